@@ -3,5 +3,6 @@ Backend module for AI Resume-Job Matcher
 """
 
 from .matcher import ResumeJobMatcher
+from .job_index import JobIndex
 
-__all__ = ['ResumeJobMatcher']
+__all__ = ['ResumeJobMatcher', 'JobIndex']
@@ -0,0 +1,220 @@
+"""
+Dynamic micro-batching of encode requests.
+
+Concurrent requests each need one or two embeddings. Encoding them one by one
+wastes most of the model's throughput, so texts are queued and flushed as a
+single batch once max_batch_size texts are waiting or the oldest text has
+waited max_wait_ms, whichever comes first.
+"""
+
+import asyncio
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+
+
+class QueueFullError(Exception):
+    """Raised when the micro-batching queue has no room for another text."""
+
+
+class MicroBatcher:
+    """
+    Coalesces texts from concurrent requests into batched encode calls.
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], np.ndarray],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_queue_size: int = 1024
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            encode_fn: Blocking function encoding a list of texts into a matrix
+            max_batch_size: Largest number of texts flushed together
+            max_wait_ms: Longest time the first text of a batch waits for company
+            max_queue_size: Texts allowed to wait before new ones are rejected
+        """
+        self.encode_fn = encode_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.max_queue_size = max_queue_size
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        self.batches = 0
+        self.items = 0
+        self.rejected = 0
+        self.flushes_full = 0
+        self.flushes_timeout = 0
+        self.max_batch_seen = 0
+        self.encode_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    def start(self):
+        """Start the flush loop on the running event loop."""
+        if self._worker is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop the flush loop; texts still queued or being encoded fail with CancelledError."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        while self._queue is not None and not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+
+    async def encode(self, text: str) -> np.ndarray:
+        """
+        Queue a text and wait for its embedding.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            QueueFullError: If max_queue_size texts are already waiting
+        """
+        return (await self.encode_many([text]))[0]
+
+    async def encode_many(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Queue several texts and wait for all of their embeddings.
+
+        Either every text is queued or none is, so a full queue never leaves
+        part of a request being encoded for nothing.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            List of embedding vectors aligned with texts
+
+        Raises:
+            QueueFullError: If the queue has no room for all of the texts
+        """
+        if self._worker is None:
+            self.start()
+
+        if self._queue.maxsize - self._queue.qsize() < len(texts):
+            self.rejected += len(texts)
+            raise QueueFullError("Encode queue is full")
+
+        # No await between the room check and the puts, so they cannot fail
+        loop = asyncio.get_running_loop()
+        queued_at = time.perf_counter()
+        futures = [loop.create_future() for _ in texts]
+        for text, future in zip(texts, futures):
+            self._queue.put_nowait((text, future, queued_at))
+
+        try:
+            return list(await asyncio.gather(*futures))
+        except BaseException:
+            # One text failed or the caller gave up: siblings need no encoding
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+            raise
+
+    async def _run(self):
+        """Collect queued texts into batches and encode them off the event loop."""
+        loop = asyncio.get_running_loop()
+        batch = []
+
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.max_wait_ms / 1000
+
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                if len(batch) >= self.max_batch_size:
+                    self.flushes_full += 1
+                else:
+                    self.flushes_timeout += 1
+
+                # Requests that gave up while waiting don't need encoding
+                batch = [item for item in batch if not item[1].cancelled()]
+                if batch:
+                    await self._encode_batch(loop, batch)
+        except asyncio.CancelledError:
+            # stop() cancelled the loop: texts already taken off the queue,
+            # including a batch still being encoded, would otherwise never resolve
+            for _, future, _ in batch:
+                if not future.done():
+                    future.cancel()
+            raise
+
+    async def _encode_batch(self, loop: asyncio.AbstractEventLoop, batch: list):
+        """Encode one batch in the default executor and resolve its futures."""
+        flushed_at = time.perf_counter()
+        self.wait_seconds += sum(flushed_at - queued_at for _, _, queued_at in batch)
+
+        try:
+            embeddings = await loop.run_in_executor(
+                None, self.encode_fn, [text for text, _, _ in batch]
+            )
+            if len(embeddings) != len(batch):
+                raise RuntimeError(
+                    f"encode_fn returned {len(embeddings)} embeddings for {len(batch)} texts"
+                )
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self.encode_seconds += time.perf_counter() - flushed_at
+
+        self.batches += 1
+        self.items += len(batch)
+        self.max_batch_seen = max(self.max_batch_seen, len(batch))
+
+        for (_, future, _), embedding in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(embedding)
+
+    def stats(self) -> dict:
+        """
+        Get batching counters.
+
+        Returns:
+            Dictionary with configuration, queue depth and batch statistics
+        """
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait_ms,
+            'max_queue_size': self.max_queue_size,
+            'queue_depth': self._queue.qsize() if self._queue is not None else 0,
+            'batches': self.batches,
+            'items': self.items,
+            'rejected': self.rejected,
+            'avg_batch_size': round(self.items / self.batches, 2) if self.batches else 0.0,
+            'max_batch_seen': self.max_batch_seen,
+            'flushes_full': self.flushes_full,
+            'flushes_timeout': self.flushes_timeout,
+            'avg_wait_ms': round(self.wait_seconds / self.items * 1000, 3) if self.items else 0.0,
+            'encode_seconds': round(self.encode_seconds, 4)
+        }
@@ -0,0 +1,287 @@
+"""
+SQLite store of registered resumes and jobs.
+
+Each document is preprocessed once when it is registered: its text, embedding,
+top keywords and skill set are stored under a generated id. Matching two stored
+documents then costs a dot product and a set difference instead of two
+transformer passes and a full keyword analysis.
+
+Embeddings are tagged with the namespace of the model that produced them, so a
+model change is detected and the affected documents can be re-encoded.
+Likewise skills are tagged with the fingerprint of the skill taxonomy they
+were extracted with, so they can be re-extracted after the taxonomy changes.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+DOCUMENT_KINDS = ('resume', 'job')
+
+
+class DocumentStore:
+    """
+    Registered resumes and jobs with their embeddings and extracted skills.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Open (or create) the store.
+
+        Args:
+            db_path: SQLite file path (None keeps the store in memory only)
+        """
+        if db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.db_path = db_path
+        self._db = sqlite3.connect(db_path or ':memory:', check_same_thread=False)
+        self._lock = threading.Lock()
+
+        if db_path:
+            self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS documents ('
+            ' id TEXT PRIMARY KEY,'
+            ' kind TEXT NOT NULL,'
+            ' title TEXT,'
+            ' text TEXT NOT NULL,'
+            ' namespace TEXT NOT NULL,'
+            ' dim INTEGER NOT NULL,'
+            ' embedding BLOB NOT NULL,'
+            ' keywords TEXT NOT NULL,'
+            ' skills TEXT NOT NULL,'
+            ' taxonomy TEXT,'
+            ' created_at REAL NOT NULL)'
+        )
+        # Stores created before skills were tagged: their rows count as another taxonomy
+        columns = [row[1] for row in self._db.execute('PRAGMA table_info(documents)')]
+        if 'taxonomy' not in columns:
+            self._db.execute('ALTER TABLE documents ADD COLUMN taxonomy TEXT')
+        self._db.execute('CREATE INDEX IF NOT EXISTS documents_kind ON documents (kind, namespace)')
+        self._db.commit()
+
+        # kind -> (namespace, ids, normalized matrix); dropped whenever documents change
+        self._matrices: Dict[str, Tuple[str, List[str], np.ndarray]] = {}
+        # Changes when another connection (e.g. another pre-forked worker) commits
+        self._data_version = self._read_data_version()
+
+    def _read_data_version(self) -> int:
+        """SQLite's counter of commits made by other connections to this database."""
+        return self._db.execute('PRAGMA data_version').fetchone()[0]
+
+    def add(
+        self,
+        kind: str,
+        text: str,
+        embedding: np.ndarray,
+        keywords: List[str],
+        skills: List[str],
+        namespace: str,
+        title: Optional[str] = None,
+        taxonomy: Optional[str] = None
+    ) -> str:
+        """
+        Register a document.
+
+        Args:
+            kind: 'resume' or 'job'
+            text: Original text
+            embedding: Embedding vector
+            keywords: Top keywords of the text
+            skills: Skill set of the text
+            namespace: Embedding namespace of the model that produced the embedding
+            title: Optional display name
+            taxonomy: Fingerprint of the skill taxonomy the skills were extracted with
+
+        Returns:
+            Generated document id
+        """
+        if kind not in DOCUMENT_KINDS:
+            raise ValueError(f"Unknown document kind: {kind}. Use one of {DOCUMENT_KINDS}.")
+
+        doc_id = uuid.uuid4().hex
+        vector = np.asarray(embedding, dtype=np.float32)
+        with self._lock:
+            self._db.execute(
+                'INSERT INTO documents '
+                '(id, kind, title, text, namespace, dim, embedding, keywords, skills, taxonomy, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (doc_id, kind, title, text, namespace, vector.shape[0], vector.tobytes(),
+                 json.dumps(keywords), json.dumps(sorted(skills)), taxonomy, time.time())
+            )
+            self._db.commit()
+            self._matrices.pop(kind, None)
+        return doc_id
+
+    def get(self, kind: str, doc_id: str) -> Optional[dict]:
+        """
+        Fetch a document.
+
+        Args:
+            kind: 'resume' or 'job'
+            doc_id: Document id
+
+        Returns:
+            Dictionary with id, title, text, namespace, embedding, keywords,
+            skills, taxonomy and created_at, or None if there is no such document
+        """
+        with self._lock:
+            row = self._db.execute(
+                'SELECT id, title, text, namespace, embedding, keywords, skills, taxonomy, created_at '
+                'FROM documents WHERE kind = ? AND id = ?',
+                (kind, doc_id)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            'id': row[0],
+            'title': row[1],
+            'text': row[2],
+            'namespace': row[3],
+            'embedding': np.frombuffer(row[4], dtype=np.float32),
+            'keywords': json.loads(row[5]),
+            'skills': json.loads(row[6]),
+            'taxonomy': row[7],
+            'created_at': row[8]
+        }
+
+    def update_embedding(self, doc_id: str, embedding: np.ndarray, namespace: str):
+        """
+        Replace a document's embedding, e.g. after a model change.
+
+        Args:
+            doc_id: Document id
+            embedding: New embedding vector
+            namespace: Namespace of the model that produced it
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        with self._lock:
+            self._db.execute(
+                'UPDATE documents SET embedding = ?, dim = ?, namespace = ? WHERE id = ?',
+                (vector.tobytes(), vector.shape[0], namespace, doc_id)
+            )
+            self._db.commit()
+            self._matrices.clear()
+
+    def update_skills(self, doc_id: str, skills: List[str], taxonomy: str):
+        """
+        Replace a document's skills, e.g. after a skill taxonomy change.
+
+        Args:
+            doc_id: Document id
+            skills: New skill set
+            taxonomy: Fingerprint of the taxonomy they were extracted with
+        """
+        with self._lock:
+            self._db.execute(
+                'UPDATE documents SET skills = ?, taxonomy = ? WHERE id = ?',
+                (json.dumps(sorted(skills)), taxonomy, doc_id)
+            )
+            self._db.commit()
+
+    def delete(self, kind: str, doc_id: str) -> bool:
+        """
+        Remove a document.
+
+        Returns:
+            True if a document was removed
+        """
+        with self._lock:
+            cursor = self._db.execute('DELETE FROM documents WHERE kind = ? AND id = ?', (kind, doc_id))
+            self._db.commit()
+            self._matrices.pop(kind, None)
+        return cursor.rowcount > 0
+
+    def stale_ids(self, kind: str, namespace: str) -> List[str]:
+        """
+        Ids of documents whose embeddings come from another model.
+
+        Args:
+            kind: 'resume' or 'job'
+            namespace: Current embedding namespace
+
+        Returns:
+            List of document ids to re-encode
+        """
+        with self._lock:
+            rows = self._db.execute(
+                'SELECT id FROM documents WHERE kind = ? AND namespace != ?', (kind, namespace)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def matrix(self, kind: str, namespace: str) -> Tuple[List[str], np.ndarray]:
+        """
+        All embeddings of one kind as a row-normalized matrix, for ranking.
+
+        The matrix is built once and reused until documents of that kind change,
+        through this store or through another connection to the same file.
+
+        Args:
+            kind: 'resume' or 'job'
+            namespace: Embedding namespace; documents from other models are left out
+
+        Returns:
+            Tuple (ids, matrix of shape (len(ids), dim))
+        """
+        with self._lock:
+            # Another process wrote to the file: any cached matrix may be out of date
+            data_version = self._read_data_version()
+            if data_version != self._data_version:
+                self._matrices.clear()
+                self._data_version = data_version
+
+            cached = self._matrices.get(kind)
+            if cached is not None and cached[0] == namespace:
+                return cached[1], cached[2]
+
+            rows = self._db.execute(
+                'SELECT id, embedding FROM documents WHERE kind = ? AND namespace = ? '
+                'ORDER BY created_at, id',
+                (kind, namespace)
+            ).fetchall()
+
+            ids = [row[0] for row in rows]
+            if rows:
+                matrix = np.vstack([np.frombuffer(row[1], dtype=np.float32) for row in rows])
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                matrix = matrix / np.maximum(norms, 1e-12)
+            else:
+                matrix = np.zeros((0, 0), dtype=np.float32)
+
+            self._matrices[kind] = (namespace, ids, matrix)
+            return ids, matrix
+
+    def titles(self, kind: str, ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Look up the titles of several documents.
+
+        Returns:
+            Dictionary id -> title
+        """
+        titles = {}
+        with self._lock:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                for doc_id, title in self._db.execute(
+                    f'SELECT id, title FROM documents WHERE kind = ? AND id IN ({placeholders})',
+                    [kind] + chunk
+                ):
+                    titles[doc_id] = title
+        return titles
+
+    def count(self, kind: str) -> int:
+        """Number of registered documents of one kind."""
+        with self._lock:
+            return self._db.execute(
+                'SELECT COUNT(*) FROM documents WHERE kind = ?', (kind,)
+            ).fetchone()[0]
@@ -0,0 +1,267 @@
+"""
+Content-addressed embedding cache for the resume-job matcher.
+
+Two tiers:
+- an in-memory LRU bounded by a byte budget
+- an optional on-disk SQLite store that survives restarts
+
+Entries are keyed by (model name, preprocessing version, SHA-256 of the text),
+so changing the model or the preprocessing rules never returns stale vectors.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    Two-tier (memory LRU + optional SQLite) cache of text embeddings.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        preprocessing_version: str = '1',
+        max_bytes: int = 64 * 1024 * 1024,
+        cache_dir: Optional[str] = None,
+        max_age: Optional[float] = None
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            model_name: Name of the model whose embeddings are cached
+            preprocessing_version: Version of the text preprocessing rules
+            max_bytes: Memory budget of the LRU tier in bytes (0 disables it)
+            cache_dir: Directory of the SQLite store (None keeps the cache in memory only)
+            max_age: Seconds after which entries of both tiers are re-encoded (None never expires)
+        """
+        self.model_name = model_name
+        self.preprocessing_version = str(preprocessing_version)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+        # key -> (vector, created_at); created_at drives max_age expiry
+        self._memory: "OrderedDict[str, Tuple[np.ndarray, float]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._db = None
+        self.db_path = None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.db_path = os.path.join(cache_dir, 'embeddings.sqlite3')
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS embeddings ('
+                ' model TEXT NOT NULL,'
+                ' version TEXT NOT NULL,'
+                ' text_hash TEXT NOT NULL,'
+                ' dim INTEGER NOT NULL,'
+                ' vector BLOB NOT NULL,'
+                ' created_at REAL NOT NULL,'
+                ' PRIMARY KEY (model, version, text_hash))'
+            )
+            self._db.commit()
+
+    @staticmethod
+    def text_hash(text: str) -> str:
+        """
+        Hash a text for use as a cache key.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Hex SHA-256 digest of the UTF-8 text
+        """
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _memory_key(self, text_hash: str) -> str:
+        return f"{self.model_name}\0{self.preprocessing_version}\0{text_hash}"
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """
+        Look up the embedding of a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Cached embedding, or None on a miss
+        """
+        return self.get_many([text])[0]
+
+    def get_many(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up the embeddings of many texts, checking memory first and then disk.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            List aligned with texts holding the cached embedding or None
+        """
+        hashes = [self.text_hash(text) for text in texts]
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        disk_lookups: Dict[str, List[int]] = {}
+
+        min_created = self._min_created()
+
+        with self._lock:
+            for i, text_hash in enumerate(hashes):
+                key = self._memory_key(text_hash)
+                entry = self._memory.get(key)
+                if entry is not None and entry[1] < min_created:
+                    # Expired: drop it so the text is re-encoded
+                    self._memory_bytes -= self._memory.pop(key)[0].nbytes
+                    entry = None
+
+                if entry is not None:
+                    self._memory.move_to_end(key)
+                    results[i] = entry[0]
+                    self.hits += 1
+                else:
+                    disk_lookups.setdefault(text_hash, []).append(i)
+
+            if disk_lookups and self._db is not None:
+                for text_hash, (vector, created_at) in self._read_disk(list(disk_lookups)).items():
+                    for i in disk_lookups.pop(text_hash):
+                        results[i] = vector
+                        self.disk_hits += 1
+                    self._remember(text_hash, vector, created_at)
+
+            self.misses += sum(len(positions) for positions in disk_lookups.values())
+
+        return results
+
+    def put(self, text: str, embedding: np.ndarray):
+        """
+        Store the embedding of a text in both tiers.
+
+        Args:
+            text: Input text
+            embedding: Embedding vector
+        """
+        self.put_many([text], [embedding])
+
+    def put_many(self, texts: List[str], embeddings: List[np.ndarray]):
+        """
+        Store the embeddings of many texts in both tiers.
+
+        Args:
+            texts: List of input texts
+            embeddings: Embedding vectors aligned with texts
+        """
+        rows = []
+        now = time.time()
+
+        with self._lock:
+            for text, embedding in zip(texts, embeddings):
+                text_hash = self.text_hash(text)
+                vector = np.array(embedding, dtype=np.float32)
+                vector.setflags(write=False)
+                self._remember(text_hash, vector, now)
+                rows.append((
+                    self.model_name, self.preprocessing_version, text_hash,
+                    vector.shape[0], vector.tobytes(), now
+                ))
+
+            if self._db is not None and rows:
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO embeddings '
+                    '(model, version, text_hash, dim, vector, created_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    rows
+                )
+                self._db.commit()
+
+    def _min_created(self) -> float:
+        """Oldest creation time that has not expired yet."""
+        return time.time() - self.max_age if self.max_age is not None else float('-inf')
+
+    def _read_disk(self, text_hashes: List[str]) -> Dict[str, Tuple[np.ndarray, float]]:
+        """Fetch non-expired (vector, created_at) pairs for the given hashes from SQLite."""
+        found = {}
+        min_created = self._min_created()
+
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(text_hashes), 500):
+            chunk = text_hashes[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor = self._db.execute(
+                f'SELECT text_hash, vector, created_at FROM embeddings '
+                f'WHERE model = ? AND version = ? AND created_at >= ? '
+                f'AND text_hash IN ({placeholders})',
+                [self.model_name, self.preprocessing_version, min_created] + chunk
+            )
+            for text_hash, blob, created_at in cursor:
+                found[text_hash] = (np.frombuffer(blob, dtype=np.float32), created_at)
+
+        return found
+
+    def _remember(self, text_hash: str, vector: np.ndarray, created_at: float):
+        """Insert into the memory tier and evict least recently used entries."""
+        if self.max_bytes <= 0 or vector.nbytes > self.max_bytes:
+            return
+
+        key = self._memory_key(text_hash)
+        if key in self._memory:
+            self._memory_bytes -= self._memory.pop(key)[0].nbytes
+
+        self._memory[key] = (vector, created_at)
+        self._memory_bytes += vector.nbytes
+
+        while self._memory_bytes > self.max_bytes:
+            _, (evicted, _) = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+            self.evictions += 1
+
+    def clear(self):
+        """Remove every entry from both tiers (counters are kept)."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self._db is not None:
+                self._db.execute(
+                    'DELETE FROM embeddings WHERE model = ? AND version = ?',
+                    (self.model_name, self.preprocessing_version)
+                )
+                self._db.commit()
+
+    def stats(self) -> dict:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hit/miss/eviction counts and memory usage
+        """
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'model': self.model_name,
+                'preprocessing_version': self.preprocessing_version,
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+                'max_bytes': self.max_bytes,
+                'disk_path': self.db_path,
+                'max_age': self.max_age
+            }
@@ -0,0 +1,394 @@
+"""
+Memory-mapped job embedding index with exact and approximate top-k search.
+
+Job embeddings are stored L2-normalized in a single (n_jobs, dim) matrix that is
+saved as a .npy file and memory-mapped on load, so a server can open a
+multi-GB index almost instantly and let the OS page in only what it touches.
+
+An optional IVF (inverted file) partitioning trained with spherical k-means
+enables approximate search that only scores the rows of the n_probe lists
+closest to the query. Exact search is always available as the fallback.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .matcher import normalize_rows
+
+
+INDEX_FORMAT_VERSION = 1
+
+INDEX_FILE = 'index.json'
+EMBEDDINGS_FILE = 'embeddings.npy'
+IDS_FILE = 'ids.json'
+METADATA_FILE = 'metadata.json'
+IVF_CENTROIDS_FILE = 'ivf_centroids.npy'
+IVF_ASSIGNMENTS_FILE = 'ivf_assignments.npy'
+
+
+class JobIndex:
+    """
+    Index of L2-normalized job embeddings with ids and metadata.
+    """
+
+    def __init__(self, dim: int, dtype: str = 'float32'):
+        """
+        Create an empty index.
+
+        Args:
+            dim: Embedding dimension
+            dtype: Storage type of the embedding matrix ('float32' or 'float16')
+        """
+        if dtype not in ('float32', 'float16'):
+            raise ValueError(f"Unsupported dtype: {dtype}. Use 'float32' or 'float16'.")
+
+        self.dim = dim
+        self.dtype = dtype
+        self.path: Optional[str] = None
+
+        self._embeddings = np.zeros((0, dim), dtype=dtype)
+        self._pending: List[np.ndarray] = []
+        self._ids: Optional[List[Any]] = []
+        self._metadata: Optional[List[Dict[str, Any]]] = []
+        self._count = 0
+
+        # IVF partitioning (None until train_ivf() is called)
+        self._ivf_centroids: Optional[np.ndarray] = None
+        self._ivf_assignments: Optional[np.ndarray] = None
+        self._ivf_lists: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """Embedding matrix of shape (len(self), dim); memory-mapped after load()."""
+        if self._pending:
+            self._embeddings = np.concatenate([self._embeddings] + self._pending)
+            self._pending = []
+        return self._embeddings
+
+    @property
+    def ids(self) -> List[Any]:
+        """Job ids aligned with the rows of the embedding matrix."""
+        if self._ids is None:
+            with open(os.path.join(self.path, IDS_FILE), encoding='utf-8') as f:
+                self._ids = json.load(f)
+        return self._ids
+
+    @property
+    def metadata(self) -> List[Dict[str, Any]]:
+        """Metadata dictionaries aligned with the rows of the embedding matrix."""
+        if self._metadata is None:
+            metadata_path = os.path.join(self.path, METADATA_FILE)
+            if os.path.exists(metadata_path):
+                with open(metadata_path, encoding='utf-8') as f:
+                    self._metadata = json.load(f)
+            else:
+                self._metadata = [{} for _ in range(self._count)]
+        return self._metadata
+
+    def add(
+        self,
+        ids: Sequence[Any],
+        embeddings: np.ndarray,
+        metadata: Optional[Sequence[Dict[str, Any]]] = None
+    ):
+        """
+        Add job embeddings to the index.
+
+        Args:
+            ids: Job ids (JSON-serializable)
+            embeddings: Embedding matrix of shape (len(ids), dim)
+            metadata: Optional metadata dictionaries aligned with ids
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32).reshape(-1, self.dim)
+        if len(ids) != len(embeddings):
+            raise ValueError("ids and embeddings must have the same length")
+        if metadata is not None and len(metadata) != len(ids):
+            raise ValueError("metadata and ids must have the same length")
+
+        # Materialize lazily loaded lists before appending to them
+        all_ids = self.ids
+        all_metadata = self.metadata
+
+        normalized = normalize_rows(embeddings)
+        self._pending.append(normalized.astype(self.dtype))
+        all_ids.extend(ids)
+        all_metadata.extend(metadata if metadata is not None else [{} for _ in ids])
+        self._count += len(ids)
+
+        # Keep a trained partitioning up to date by assigning new rows to their lists
+        if self._ivf_centroids is not None:
+            self._ivf_assignments = np.concatenate([
+                self._ivf_assignments, self._assign_lists(normalized)
+            ])
+            self._ivf_lists = None
+
+    def add_texts(
+        self,
+        matcher,
+        ids: Sequence[Any],
+        texts: List[str],
+        metadata: Optional[Sequence[Dict[str, Any]]] = None,
+        batch_size: int = 256
+    ):
+        """
+        Encode job descriptions with a matcher and add them to the index.
+
+        Args:
+            matcher: ResumeJobMatcher used to encode the texts
+            ids: Job ids (JSON-serializable)
+            texts: Job description texts aligned with ids
+            metadata: Optional metadata dictionaries aligned with ids
+            batch_size: Number of texts encoded per chunk
+        """
+        for start in range(0, len(texts), batch_size):
+            end = start + batch_size
+            self.add(
+                ids[start:end],
+                matcher.encode_batch(texts[start:end], batch_size=batch_size),
+                metadata[start:end] if metadata is not None else None
+            )
+
+    def search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 10,
+        block_size: int = 65536,
+        n_probe: Optional[int] = None
+    ) -> List[Tuple[Any, float]]:
+        """
+        Find the jobs most similar to a resume embedding.
+
+        Args:
+            query_embedding: Resume embedding vector of shape (dim,)
+            top_k: Number of results to return
+            block_size: Number of index rows scored per block
+            n_probe: Number of IVF lists to scan for approximate search
+                (None, or an untrained index, uses exact blocked brute force)
+
+        Returns:
+            List of tuples (job id, score) sorted by score descending
+        """
+        rows, scores = self.search_rows(
+            query_embedding, top_k=top_k, block_size=block_size, n_probe=n_probe
+        )
+        ids = self.ids
+        return [(ids[row], float(score)) for row, score in zip(rows, scores)]
+
+    def search_rows(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 10,
+        block_size: int = 65536,
+        n_probe: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Same as search() but returns row numbers and scores as arrays.
+
+        Args:
+            query_embedding: Resume embedding vector of shape (dim,)
+            top_k: Number of results to return
+            block_size: Number of index rows scored per block
+            n_probe: Number of IVF lists to scan (None for exact search)
+
+        Returns:
+            Tuple (rows, scores) sorted by score descending, scores in percent
+        """
+        query = normalize_rows(np.asarray(query_embedding).reshape(1, -1))[0]
+        embeddings = self.embeddings
+
+        candidates = None
+        if n_probe is not None and self.is_trained:
+            candidates = self._probe_rows(query, n_probe)
+
+        best_rows = np.zeros(0, dtype=np.int64)
+        best_scores = np.zeros(0, dtype=np.float32)
+        if top_k <= 0:
+            return best_rows, best_scores
+
+        n_rows = len(embeddings) if candidates is None else len(candidates)
+        for start in range(0, n_rows, block_size):
+            if candidates is None:
+                block_rows = None
+                block = np.asarray(embeddings[start:start + block_size], dtype=np.float32)
+            else:
+                block_rows = candidates[start:start + block_size]
+                block = np.asarray(embeddings[block_rows], dtype=np.float32)
+            block_scores = block @ query
+
+            # Keep only this block's top_k before merging with the running best
+            if len(block_scores) > top_k:
+                keep = np.argpartition(-block_scores, top_k - 1)[:top_k]
+            else:
+                keep = np.arange(len(block_scores))
+
+            best_rows = np.concatenate([
+                best_rows, keep + start if block_rows is None else block_rows[keep]
+            ])
+            best_scores = np.concatenate([best_scores, block_scores[keep]])
+            if len(best_scores) > top_k:
+                keep = np.argpartition(-best_scores, top_k - 1)[:top_k]
+                best_rows, best_scores = best_rows[keep], best_scores[keep]
+
+        order = np.argsort(-best_scores, kind='stable')
+        return best_rows[order], best_scores[order] * 100
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether an IVF partitioning is available for approximate search."""
+        return self._ivf_centroids is not None
+
+    def train_ivf(
+        self,
+        n_lists: Optional[int] = None,
+        n_iter: int = 20,
+        sample_size: Optional[int] = None,
+        seed: int = 0
+    ):
+        """
+        Partition the index into IVF lists with spherical k-means.
+
+        Args:
+            n_lists: Number of lists (defaults to about sqrt(len(self)))
+            n_iter: Number of k-means iterations
+            sample_size: Rows used to fit the centroids (defaults to 256 per list, at least n_lists)
+            seed: Random seed for sampling and initialization
+        """
+        embeddings = self.embeddings
+        if len(embeddings) == 0:
+            raise ValueError("Cannot train IVF on an empty index")
+
+        if n_lists is None:
+            n_lists = max(1, int(np.sqrt(len(embeddings))))
+        n_lists = min(n_lists, len(embeddings))
+        if sample_size is None:
+            sample_size = 256 * n_lists
+
+        rng = np.random.default_rng(seed)
+        # Every list needs at least one sample row to seed its centroid
+        sample_size = max(min(sample_size, len(embeddings)), n_lists)
+        sample_rows = np.sort(rng.choice(len(embeddings), sample_size, replace=False))
+        sample = np.asarray(embeddings[sample_rows], dtype=np.float32)
+
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+        for _ in range(n_iter):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=n_lists)
+
+            # Re-seed empty lists with random sample points
+            empty = counts == 0
+            if empty.any():
+                sums[empty] = sample[rng.choice(len(sample), int(empty.sum()), replace=False)]
+
+            centroids = normalize_rows(sums)
+
+        self._ivf_centroids = centroids
+        self._ivf_assignments = np.concatenate([
+            self._assign_lists(np.asarray(embeddings[start:start + 65536], dtype=np.float32))
+            for start in range(0, len(embeddings), 65536)
+        ])
+        self._ivf_lists = None
+
+    def _assign_lists(self, normalized: np.ndarray) -> np.ndarray:
+        """Assign normalized rows to their nearest IVF centroid."""
+        if len(normalized) == 0:
+            return np.zeros(0, dtype=np.int32)
+        return np.argmax(normalized @ self._ivf_centroids.T, axis=1).astype(np.int32)
+
+    def _probe_rows(self, query: np.ndarray, n_probe: int) -> np.ndarray:
+        """Rows of the n_probe lists whose centroids are closest to the query."""
+        if self._ivf_lists is None:
+            # Group rows by list: order[offsets[i]:offsets[i + 1]] are the rows of list i
+            order = np.argsort(self._ivf_assignments, kind='stable')
+            counts = np.bincount(self._ivf_assignments, minlength=len(self._ivf_centroids))
+            offsets = np.concatenate([[0], np.cumsum(counts)])
+            self._ivf_lists = (order, offsets)
+
+        order, offsets = self._ivf_lists
+        n_probe = max(1, min(n_probe, len(self._ivf_centroids)))
+        centroid_scores = self._ivf_centroids @ query
+        probed = np.argpartition(-centroid_scores, n_probe - 1)[:n_probe]
+
+        rows = np.concatenate([order[offsets[i]:offsets[i + 1]] for i in probed])
+        # Sorted rows give sequential reads on the memory-mapped matrix
+        return np.sort(rows)
+
+    def save(self, directory: str):
+        """
+        Save the index to a directory.
+
+        Args:
+            directory: Target directory (created if missing)
+        """
+        os.makedirs(directory, exist_ok=True)
+        embeddings = self.embeddings
+
+        # Write to a temporary file first: the target may be memory-mapped by us
+        tmp_path = os.path.join(directory, EMBEDDINGS_FILE + '.tmp')
+        out = np.lib.format.open_memmap(
+            tmp_path, mode='w+', dtype=self.dtype, shape=embeddings.shape
+        )
+        for start in range(0, len(embeddings), 65536):
+            out[start:start + 65536] = embeddings[start:start + 65536]
+        out.flush()
+        del out
+        os.replace(tmp_path, os.path.join(directory, EMBEDDINGS_FILE))
+
+        with open(os.path.join(directory, IDS_FILE), 'w', encoding='utf-8') as f:
+            json.dump(self.ids, f)
+        with open(os.path.join(directory, METADATA_FILE), 'w', encoding='utf-8') as f:
+            json.dump(self.metadata, f)
+        if self.is_trained:
+            np.save(os.path.join(directory, IVF_CENTROIDS_FILE), self._ivf_centroids)
+            np.save(os.path.join(directory, IVF_ASSIGNMENTS_FILE), self._ivf_assignments)
+        with open(os.path.join(directory, INDEX_FILE), 'w', encoding='utf-8') as f:
+            json.dump({
+                'format_version': INDEX_FORMAT_VERSION,
+                'dim': self.dim,
+                'dtype': self.dtype,
+                'count': len(self),
+                'ivf_lists': len(self._ivf_centroids) if self.is_trained else None
+            }, f, indent=2)
+
+        self.path = directory
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> 'JobIndex':
+        """
+        Open an index saved with save().
+
+        Args:
+            directory: Index directory
+            mmap: Memory-map the embeddings instead of reading them into RAM
+
+        Returns:
+            JobIndex instance (ids and metadata are read on first use)
+        """
+        with open(os.path.join(directory, INDEX_FILE), encoding='utf-8') as f:
+            info = json.load(f)
+
+        if info.get('format_version') != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported index format version: {info.get('format_version')}")
+
+        index = cls(info['dim'], info['dtype'])
+        index.path = directory
+        index._embeddings = np.load(
+            os.path.join(directory, EMBEDDINGS_FILE), mmap_mode='r' if mmap else None
+        )
+        index._count = info['count']
+        index._ids = None
+        index._metadata = None
+
+        if info.get('ivf_lists'):
+            index._ivf_centroids = np.load(os.path.join(directory, IVF_CENTROIDS_FILE))
+            index._ivf_assignments = np.load(os.path.join(directory, IVF_ASSIGNMENTS_FILE))
+
+        return index
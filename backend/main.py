@@ -2,23 +2,105 @@
 FastAPI backend for AI Resume-Job Matcher
 """
 
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Header, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Tuple
+import numpy as np
 import sys
 import os
+import asyncio
+import functools
+import itertools
+import json
+import threading
+import time
+import zipfile
 
 # Add parent directory to path to import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.text_processor import (
-    extract_text_from_pdf,
+    PREPROCESSING_VERSION,
+    AnalyzedDocument,
+    SUPPORTED_RESUME_EXTENSIONS,
+    extract_text_from_file,
     find_missing_keywords,
     extract_keywords,
-    preprocess_for_embedding
+    preprocess_for_embedding,
+    reload_skill_taxonomy,
+    skill_taxonomy
 )
-from backend.matcher import ResumeJobMatcher
+from utils.pdf_extractor import extract_pdf
+from backend.matcher import ResumeJobMatcher, normalize_rows
+from backend.match_engine import blocked_top_k
+from backend.embedding_cache import EmbeddingCache
+from backend.batching import MicroBatcher, QueueFullError
+from backend.work_pool import WorkPool, PoolBusyError
+from backend.response_cache import ResponseCache, normalize_for_key
+from backend.document_store import DocumentStore
+from backend.metrics import CONTENT_TYPE, MetricsRegistry, RequestMetricsMiddleware, observe_timings
+from backend.profiling import StageTimer, profile_call
+from backend.tasks import TaskRunner, TaskStore
+from backend.serve import process_memory
+
+
+# Model and embedding cache settings
+MODEL_NAME = os.getenv("MATCHER_MODEL_NAME", "all-MiniLM-L6-v2")
+INFERENCE_BACKEND = os.getenv("MATCHER_BACKEND", "torch")  # torch, onnx or onnx-int8
+CACHE_DIR = os.getenv("MATCHER_CACHE_DIR")  # unset keeps the cache in memory only
+CACHE_MEMORY_MB = int(os.getenv("MATCHER_CACHE_MEMORY_MB", "64"))
+CACHE_MAX_AGE = float(os.getenv("MATCHER_CACHE_MAX_AGE", str(24 * 60 * 60)))  # re-encode daily
+
+# Micro-batching of encode calls across concurrent requests
+BATCH_MAX_SIZE = int(os.getenv("MATCHER_BATCH_MAX_SIZE", "32"))
+BATCH_MAX_WAIT_MS = float(os.getenv("MATCHER_BATCH_MAX_WAIT_MS", "5"))
+BATCH_MAX_QUEUE = int(os.getenv("MATCHER_BATCH_MAX_QUEUE", "1024"))
+
+# Pool running blocking PDF parsing and NLTK keyword analysis off the event loop
+WORK_POOL_KIND = os.getenv("MATCHER_WORK_POOL", "thread")  # thread or process
+WORK_POOL_WORKERS = int(os.getenv("MATCHER_WORK_POOL_WORKERS", "0")) or None  # 0 = default
+WORK_POOL_MAX_PENDING = int(os.getenv("MATCHER_WORK_POOL_MAX_PENDING", "64"))
+RETRY_AFTER_SECONDS = int(os.getenv("MATCHER_RETRY_AFTER", "1"))
+
+# /match response cache; bump RESPONSE_VERSION whenever /match output logic changes
+RESPONSE_VERSION = "2"
+RESPONSE_CACHE_SIZE = int(os.getenv("MATCHER_RESPONSE_CACHE_SIZE", "1024"))
+RESPONSE_CACHE_TTL = float(os.getenv("MATCHER_RESPONSE_CACHE_TTL", "3600"))
+
+# ?profile=true on /match and /match-file; admin-only because it bypasses caches and pools
+PROFILING_ENABLED = os.getenv("MATCHER_PROFILING", "0") == "1"
+PROFILE_DIR = os.getenv("MATCHER_PROFILE_DIR")  # set to also write cProfile dumps here
+
+# Registered resumes and jobs; unset keeps them in memory (per worker process)
+STORE_PATH = os.getenv("MATCHER_STORE_PATH")
+
+# /match/batch: texts per request and texts analyzed and encoded per streamed chunk
+BATCH_MAX_ITEMS = int(os.getenv("MATCHER_BATCH_MAX_ITEMS", "5000"))
+STREAM_CHUNK_SIZE = int(os.getenv("MATCHER_STREAM_CHUNK_SIZE", "32"))
+
+# /match-files: text extraction of many uploaded files or ZIP members
+EXTRACT_POOL_KIND = os.getenv("MATCHER_EXTRACT_POOL", "process")  # process or thread
+EXTRACT_WORKERS = int(os.getenv("MATCHER_EXTRACT_WORKERS", "0")) or (os.cpu_count() or 1)
+MAX_UPLOAD_FILES = int(os.getenv("MATCHER_MAX_UPLOAD_FILES", "1000"))
+MAX_FILE_BYTES = int(os.getenv("MATCHER_MAX_FILE_MB", "20")) * 1024 * 1024
+# Seconds a file waits for a free extraction slot before it fails with "Server busy"
+EXTRACT_MAX_WAIT = float(os.getenv("MATCHER_EXTRACT_MAX_WAIT", "30"))
+
+# PDF extraction budgets (0 disables one); longer PDFs are matched on the pages read in time
+PDF_MAX_PAGES = int(os.getenv("MATCHER_PDF_MAX_PAGES", "50")) or None
+PDF_TIME_LIMIT = float(os.getenv("MATCHER_PDF_TIME_LIMIT", "10")) or None
+# /match-file: worker processes extracting the pages of one long PDF in parallel (0 = serial)
+PDF_PAGE_WORKERS = int(os.getenv("MATCHER_PDF_PAGE_WORKERS", "0"))
+
+# Background bulk-match tasks; set MATCHER_TASK_DB so they survive restarts and are shared by workers
+TASK_DB_PATH = os.getenv("MATCHER_TASK_DB")
+TASK_WORKERS = int(os.getenv("MATCHER_TASK_WORKERS", "1"))
+TASK_CHUNK_SIZE = int(os.getenv("MATCHER_TASK_CHUNK_SIZE", "256"))
+TASK_MAX_RESUMES = int(os.getenv("MATCHER_TASK_MAX_RESUMES", "100000"))
+TASK_MAX_JOBS = int(os.getenv("MATCHER_TASK_MAX_JOBS", "10000"))
+TASK_MAX_TOP_K = 100
 
 
 # Initialize FastAPI app
@@ -37,17 +119,342 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Prometheus metrics for GET /metrics; cheap enough to record on every request
+metrics = MetricsRegistry()
+stage_seconds = metrics.histogram(
+    "matcher_stage_seconds", "Duration of /match pipeline stages", ["stage"]
+)
+app.add_middleware(
+    RequestMetricsMiddleware,
+    requests=metrics.counter(
+        "matcher_http_requests_total", "HTTP requests by route and status", ["method", "route", "status"]
+    ),
+    errors=metrics.counter(
+        "matcher_http_errors_total", "HTTP requests answered with a 4xx or 5xx status", ["route", "status"]
+    ),
+    duration=metrics.histogram(
+        "matcher_http_request_duration_seconds", "Time until response headers are sent", ["route"]
+    ),
+    in_flight=metrics.gauge("matcher_http_requests_in_flight", "Requests being processed")
+)
+
 # Initialize the matcher (loads the AI model)
 matcher = None
 
+# Coalesces texts from concurrent requests into one encode batch
+batcher = MicroBatcher(
+    lambda texts: matcher.encode_batch(texts, batch_size=BATCH_MAX_SIZE),
+    max_batch_size=BATCH_MAX_SIZE,
+    max_wait_ms=BATCH_MAX_WAIT_MS,
+    max_queue_size=BATCH_MAX_QUEUE
+)
+
+# Blocking text work runs here; beyond max_pending calls requests get 429
+work_pool = WorkPool(
+    kind=WORK_POOL_KIND,
+    max_workers=WORK_POOL_WORKERS,
+    max_pending=WORK_POOL_MAX_PENDING,
+    retry_after=RETRY_AFTER_SECONDS
+)
+
+# PDF parsing of multi-file uploads; processes so pages parse in parallel despite the GIL
+extraction_pool = WorkPool(
+    kind=EXTRACT_POOL_KIND,
+    max_workers=EXTRACT_WORKERS,
+    max_pending=WORK_POOL_MAX_PENDING,
+    retry_after=RETRY_AFTER_SECONDS
+)
+
+# Identical /match requests are answered from here (or with a 304 via ETag)
+response_cache = ResponseCache(max_entries=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL)
+
+# Opened at startup, so pre-forked workers never share a SQLite connection
+document_store: Optional[DocumentStore] = None
+task_runner: Optional[TaskRunner] = None
+
+# Model loading happens in the background; stages in order of progress
+MODEL_LOAD_STAGES = ["not_started", "importing", "loading_model", "warming_up", "ready"]
+model_status = {
+    "stage": "not_started",
+    "started_at": None,
+    "load_seconds": None,
+    "error": None
+}
+
+
+def embedding_cache_stat(name: str) -> float:
+    """Read one embedding cache counter (0 until the model is loaded)"""
+    return matcher.cache.stats()[name] if matcher else 0
+
+
+# Values kept by other components are read when /metrics is scraped
+metrics.gauge("matcher_model_loaded", "1 once the model is loaded", function=lambda: matcher is not None)
+metrics.gauge("matcher_process_pid", "Process id of the worker that answered the scrape", function=os.getpid)
+metrics.gauge("matcher_batch_queue_depth", "Texts waiting for the micro-batcher",
+              function=lambda: batcher.stats()["queue_depth"])
+metrics.gauge("matcher_work_pool_pending", "Calls queued or running in the work pool",
+              function=lambda: work_pool.pending)
+metrics.gauge("matcher_extraction_pool_pending", "Calls queued or running in the extraction pool",
+              function=lambda: extraction_pool.pending)
+metrics.counter("matcher_busy_rejections_total", "Calls rejected because a queue was full",
+                function=lambda: batcher.rejected + work_pool.rejected + extraction_pool.rejected)
+metrics.counter("matcher_response_cache_hits_total", "/match responses served from the cache",
+                function=lambda: response_cache.hits)
+metrics.counter("matcher_response_cache_not_modified_total", "/match requests answered with 304",
+                function=lambda: response_cache.not_modified)
+metrics.counter("matcher_response_cache_misses_total", "/match responses computed",
+                function=lambda: response_cache.misses)
+metrics.counter("matcher_embedding_cache_hits_total", "Embeddings served from memory or disk",
+                function=lambda: embedding_cache_stat("hits") + embedding_cache_stat("disk_hits"))
+metrics.counter("matcher_embedding_cache_misses_total", "Embeddings computed by the model",
+                function=lambda: embedding_cache_stat("misses"))
+
+
+def build_cache(namespace: str) -> EmbeddingCache:
+    """Create the embedding cache configured by the MATCHER_CACHE_* settings"""
+    return EmbeddingCache(
+        namespace,
+        preprocessing_version=PREPROCESSING_VERSION,
+        max_bytes=CACHE_MEMORY_MB * 1024 * 1024,
+        cache_dir=CACHE_DIR,
+        max_age=CACHE_MAX_AGE
+    )
+
+
+def load_matcher():
+    """Import the ML stack, load the AI model and warm it up (runs in a background thread)"""
+    global matcher
+    model_status["started_at"] = time.time()
+    start = time.perf_counter()
+
+    try:
+        model_status["stage"] = "importing"
+        import sentence_transformers  # noqa: F401 - the slow torch import happens here
+
+        model_status["stage"] = "loading_model"
+        print("Loading AI model...")
+        loaded = ResumeJobMatcher(MODEL_NAME, backend=INFERENCE_BACKEND)
+        loaded.cache = build_cache(loaded.cache_namespace)
+
+        # Run one inference so the first real request doesn't pay for lazy init
+        model_status["stage"] = "warming_up"
+        loaded.encoder.encode(["warm up"], convert_to_tensor=False)
+        extract_keywords("warm up the keyword extractor")
+
+        matcher = loaded
+        model_status["stage"] = "ready"
+        print("Model loaded successfully!")
+    except Exception as e:
+        model_status["stage"] = "failed"
+        model_status["error"] = str(e)
+        print(f"Error loading model: {str(e)}")
+    finally:
+        model_status["load_seconds"] = round(time.perf_counter() - start, 3)
+
+
+def model_load_report() -> dict:
+    """Current model loading state, progress (0-1) and timing"""
+    stage = model_status["stage"]
+    if stage in MODEL_LOAD_STAGES:
+        progress = MODEL_LOAD_STAGES.index(stage) / (len(MODEL_LOAD_STAGES) - 1)
+    else:
+        progress = 0.0
+
+    elapsed = None
+    if model_status["started_at"] is not None:
+        elapsed = model_status["load_seconds"]
+        if elapsed is None:
+            elapsed = round(time.time() - model_status["started_at"], 3)
+
+    return {
+        "stage": stage,
+        "progress": round(progress, 2),
+        "load_seconds": elapsed,
+        "error": model_status["error"]
+    }
+
 
 @app.on_event("startup")
 async def startup_event():
-    """Load the AI model on startup"""
-    global matcher
-    print("Loading AI model...")
-    matcher = ResumeJobMatcher()
-    print("Model loaded successfully!")
+    """Start loading the AI model in the background so the server binds its port immediately"""
+    global document_store, task_runner
+    # Compile (or load the cached) skill taxonomy now rather than on the first request
+    await asyncio.to_thread(skill_taxonomy)
+    if document_store is None:
+        document_store = DocumentStore(STORE_PATH)
+    if task_runner is None:
+        task_runner = TaskRunner(
+            TaskStore(TASK_DB_PATH),
+            {"bulk_match": (prepare_bulk_match, process_bulk_match)},
+            workers=TASK_WORKERS,
+            chunk_size=TASK_CHUNK_SIZE,
+            ready=lambda: matcher is not None
+        )
+    task_runner.start()
+
+    # A pre-fork master (backend/serve.py) has already loaded the model
+    if model_status["stage"] == "not_started":
+        threading.Thread(target=load_matcher, name="model-loader", daemon=True).start()
+    batcher.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the micro-batching loop, the work pools and the task workers"""
+    await asyncio.to_thread(task_runner.stop)
+    await batcher.stop()
+    work_pool.shutdown()
+    extraction_pool.shutdown()
+
+
+def busy_error(detail: str, status_code: int = 429) -> HTTPException:
+    """HTTP error telling the client to retry after RETRY_AFTER_SECONDS"""
+    return HTTPException(
+        status_code=status_code,
+        detail=detail,
+        headers={"Retry-After": str(RETRY_AFTER_SECONDS)}
+    )
+
+
+def extract_resume_text(filename: str, file_content: bytes, page_workers: int = 0) -> Tuple[str, Optional[str]]:
+    """
+    Extract a resume file's text within the PDF budgets (executed in a pool).
+
+    Args:
+        filename: Name of the file (its extension selects the parser)
+        file_content: File content as bytes
+        page_workers: Worker processes for page-parallel extraction of long PDFs
+
+    Returns:
+        Tuple (text, None or why a PDF was cut short: "page_limit" or "time_limit")
+
+    Raises:
+        ValueError: If the file type is unsupported or the file can't be parsed
+    """
+    if filename.lower().endswith('.pdf'):
+        result = extract_pdf(
+            file_content, max_pages=PDF_MAX_PAGES, time_limit=PDF_TIME_LIMIT, workers=page_workers
+        )
+        return result.text, result.truncated
+    return extract_text_from_file(filename, file_content), None
+
+
+def server_timing(timings: dict) -> str:
+    """Format stage durations in milliseconds as a Server-Timing header value"""
+    return ", ".join(f"{name};dur={duration:.1f}" for name, duration in timings.items())
+
+
+def analyze_document(text: str) -> dict:
+    """
+    Run the blocking analysis of a document being registered (executed in the work pool).
+
+    Args:
+        text: Resume or job description text
+
+    Returns:
+        Dictionary with the embedding-ready text, keywords, skill list and
+        the fingerprint of the skill taxonomy used
+    """
+    fingerprint = skill_taxonomy().fingerprint
+    document = AnalyzedDocument(text)
+    return {
+        "processed": document.embedding_text,
+        "keywords": extract_keywords(document, top_n=15),
+        "skills": sorted(document.skills),
+        "taxonomy": fingerprint
+    }
+
+
+def extract_skill_list(text: str) -> Tuple[List[str], str]:
+    """Skills of a stored document and the fingerprint of the taxonomy used (executed in the work pool)"""
+    fingerprint = skill_taxonomy().fingerprint
+    return sorted(AnalyzedDocument(text).skills), fingerprint
+
+
+def analyze_shared_document(text: str) -> AnalyzedDocument:
+    """Fully analyze the text shared by every item of a batch (executed in the work pool)"""
+    return AnalyzedDocument(text).analyze()
+
+
+def analyze_batch_chunk(shared: AnalyzedDocument, texts: List[str], shared_is_resume: bool) -> List[dict]:
+    """
+    Run the blocking text analysis of one /match/batch chunk (executed in the work pool).
+
+    Args:
+        shared: The analyzed text every item is matched against (not re-analyzed per item)
+        texts: The chunk's texts (jobs if shared_is_resume, else resumes)
+        shared_is_resume: Whether shared is the resume
+
+    Returns:
+        One dictionary per text with its embedding-ready text, keywords and
+        missing keywords (empty texts only get processed == "")
+    """
+    results = []
+    for text in texts:
+        if not text or not text.strip():
+            results.append({"processed": ""})
+            continue
+
+        document = AnalyzedDocument(text)
+        resume, job = (shared, document) if shared_is_resume else (document, shared)
+        results.append({
+            "processed": document.embedding_text,
+            "keywords": extract_keywords(document, top_n=15),
+            "missing_keywords": find_missing_keywords(resume, job)
+        })
+    return results
+
+
+def preprocess_texts(texts: List[str]) -> List[str]:
+    """Embedding-ready versions of several texts (executed in the work pool)"""
+    return [AnalyzedDocument(text).embedding_text for text in texts]
+
+
+def preprocess_pair(resume: AnalyzedDocument, job: AnalyzedDocument) -> List[str]:
+    """Embedding-ready resume and job texts (executed in the work pool)"""
+    return [preprocess_for_embedding(resume), preprocess_for_embedding(job)]
+
+
+def keywords_pair(resume: AnalyzedDocument, job: AnalyzedDocument) -> List[List[str]]:
+    """Top keywords of the resume and the job (executed in the work pool)"""
+    return [extract_keywords(resume, top_n=15), extract_keywords(job, top_n=15)]
+
+
+def analyze_texts(resume_text: str, job_description: str) -> dict:
+    """
+    Run the blocking text analysis of one resume/job pair (executed in the work pool).
+
+    Args:
+        resume_text: Resume text
+        job_description: Job description text
+
+    Returns:
+        Dictionary with embedding-ready texts, keywords, missing keywords and
+        the duration of each stage in ms under "stage_ms"
+    """
+    stage_ms = {}
+    resume, job = AnalyzedDocument(resume_text), AnalyzedDocument(job_description)
+    start = time.perf_counter()
+    resume_processed = resume.embedding_text
+    job_processed = job.embedding_text
+    keywords_start = time.perf_counter()
+    resume_keywords = extract_keywords(resume, top_n=15)
+    job_keywords = extract_keywords(job, top_n=15)
+    skills_start = time.perf_counter()
+    missing_keywords = find_missing_keywords(resume, job)
+    end = time.perf_counter()
+
+    stage_ms["preprocess"] = (keywords_start - start) * 1000
+    stage_ms["keywords"] = (skills_start - keywords_start) * 1000
+    stage_ms["skill_diff"] = (end - skills_start) * 1000
+    return {
+        "resume_processed": resume_processed,
+        "job_processed": job_processed,
+        "resume_keywords": resume_keywords,
+        "job_keywords": job_keywords,
+        "missing_keywords": missing_keywords,
+        "stage_ms": stage_ms
+    }
 
 
 # Request/Response Models
@@ -56,12 +463,109 @@ class MatchRequest(BaseModel):
     job_description: str
 
 
+class BatchMatchRequest(BaseModel):
+    """One resume against many jobs, or one job against many resumes"""
+    resume_text: Optional[str] = None
+    job_descriptions: Optional[List[str]] = None
+    resume_texts: Optional[List[str]] = None
+    job_description: Optional[str] = None
+
+
+class ProfileReport(BaseModel):
+    stages_ms: dict
+    total_ms: float
+    characters: dict
+    tokens: dict
+    max_seq_length: int
+    hotspots: Optional[List[str]] = None
+    profile_path: Optional[str] = None
+
+
 class MatchResponse(BaseModel):
     match_score: float
     missing_keywords: List[str]
     suggestions: str
     resume_keywords: List[str]
     job_keywords: List[str]
+    profile: Optional[ProfileReport] = None
+
+
+class DocumentRequest(BaseModel):
+    text: str
+    title: Optional[str] = None
+
+
+class DocumentResponse(BaseModel):
+    id: str
+    kind: str
+    title: Optional[str] = None
+    keywords: List[str]
+    skills: List[str]
+    characters: int
+
+
+class RankedDocument(BaseModel):
+    id: str
+    title: Optional[str] = None
+    match_score: float
+
+
+class RankingResponse(BaseModel):
+    id: str
+    kind: str
+    candidates: int
+    results: List[RankedDocument]
+
+
+class BulkMatchRequest(BaseModel):
+    resume_texts: List[str]
+    job_descriptions: List[str]
+    top_k: int = 5
+
+
+class TaskResponse(BaseModel):
+    id: str
+    kind: str
+    status: str
+    total: int
+    done: int
+    progress: float
+    throughput: Optional[float] = None
+    eta_seconds: Optional[float] = None
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    cancel_requested: bool = False
+    error: Optional[str] = None
+
+
+class SkillTaxonomyResponse(BaseModel):
+    version: str
+    source: Optional[str] = None
+    skills: int
+    patterns: int
+    fingerprint: str
+
+
+class FileMatchResult(BaseModel):
+    filename: str
+    match_score: Optional[float] = None
+    missing_keywords: List[str] = []
+    resume_keywords: List[str] = []
+    characters: int = 0
+    extract_ms: Optional[float] = None
+    extract_queue_ms: Optional[float] = None
+    truncated: Optional[str] = None
+    error: Optional[str] = None
+
+
+class MultiFileMatchResponse(BaseModel):
+    job_keywords: List[str]
+    results: List[FileMatchResult]
+    files: int
+    failed: int
+    extract_seconds: float
+    score_seconds: float
 
 
 @app.get("/")
@@ -72,8 +576,22 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "/match": "POST - Match resume with job description (JSON)",
+            "/match/stream": "POST - Like /match, streamed as Server-Sent Events (score first)",
+            "/match/batch": "POST - One resume vs many jobs or one job vs many resumes (NDJSON stream)",
             "/match-file": "POST - Match resume file with job description",
-            "/health": "GET - Health check"
+            "/match-files": "POST - Rank many resume files or ZIP archives against a job description",
+            "/tasks/match": "POST - Start a background bulk match; returns a task id",
+            "/tasks/{id}": "GET - Task progress (done, throughput, ETA); POST /tasks/{id}/cancel cancels",
+            "/tasks/{id}/results": "GET - Results of a finished task (NDJSON)",
+            "/resumes, /jobs": "POST - Register a resume or job; returns its id",
+            "/match?resume_id=&job_id=": "GET - Match a registered resume and job",
+            "/resumes/{id}/jobs, /jobs/{id}/resumes": "GET - Rank registered jobs or resumes",
+            "/skills": "GET - Active skill taxonomy; POST /skills/reload reloads it from disk",
+            "/health": "GET - Health check",
+            "/health/live": "GET - Liveness probe",
+            "/health/ready": "GET - Readiness probe (503 until the model is loaded)",
+            "/stats": "GET - Runtime statistics (cache, batching, work pool)",
+            "/metrics": "GET - Prometheus metrics (request counts, stage latency histograms)"
         }
     }
 
@@ -83,24 +601,229 @@ async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "model_loaded": matcher is not None
+        "model_loaded": matcher is not None,
+        "model": model_load_report()
+    }
+
+
+@app.get("/health/live")
+async def liveness():
+    """Liveness probe: the process is up and serving requests"""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness():
+    """Readiness probe: 200 once the model is loaded, 503 while loading or after a failure"""
+    report = model_load_report()
+    if matcher is None:
+        return JSONResponse(status_code=503, content={"status": "not_ready", "model": report})
+    return {"status": "ready", "model": report}
+
+
+@app.get("/stats")
+async def stats():
+    """Runtime statistics endpoint"""
+    return {
+        "embedding_cache": matcher.cache.stats() if matcher else None,
+        "batching": batcher.stats(),
+        "response_cache": response_cache.stats(),
+        "work_pool": work_pool.stats(),
+        "extraction_pool": extraction_pool.stats(),
+        "tasks": await asyncio.to_thread(task_runner.stats) if task_runner else None,
+        "skill_taxonomy": skill_taxonomy().info(),
+        "process": process_memory()
     }
 
 
-@app.post("/match", response_model=MatchResponse)
-async def match_resume_job(request: MatchRequest):
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Metrics in the Prometheus text exposition format"""
+    return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
+
+
+@app.get("/skills", response_model=SkillTaxonomyResponse)
+async def skills_info():
+    """Version and size of the active skill taxonomy"""
+    return skill_taxonomy().info()
+
+
+@app.post("/skills/reload", response_model=SkillTaxonomyResponse)
+async def reload_skills():
+    """
+    Reload the skill taxonomy file (MATCHER_SKILL_TAXONOMY) without restarting.
+
+    The new taxonomy is compiled in a thread and swapped in atomically; a
+    malformed file returns 400 and leaves the current taxonomy active.
+    Process pools are recycled so their workers pick up the new taxonomy.
+    Cached /match responses are keyed by the taxonomy fingerprint, so they
+    are not reused across versions.
+
+    Returns:
+        SkillTaxonomyResponse describing the new taxonomy
+    """
+    try:
+        taxonomy = await asyncio.to_thread(reload_skill_taxonomy)
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Could not load skill taxonomy: {e}")
+
+    # Forked workers hold the taxonomy they started with; new ones are created on next use
+    for pool in (work_pool, extraction_pool):
+        if pool.kind == "process":
+            await asyncio.to_thread(pool.shutdown)
+
+    print(f"Reloaded skill taxonomy {taxonomy.version} ({len(taxonomy)} skills)")
+    return taxonomy.info()
+
+
+@app.post("/match", response_model=MatchResponse, response_model_exclude_none=True)
+async def match_resume_job(
+    request: MatchRequest,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    profile: bool = Query(False)
+):
     """
     Match a resume with a job description and return analysis.
 
+    Blocking work runs in the work pool and the micro-batcher, never on the
+    event loop. Queue wait and compute time are returned in a Server-Timing header.
+    Responses carry an ETag; sending it back in If-None-Match yields a 304.
+
     Args:
         request: MatchRequest containing resume_text and job_description
+        response: Response whose headers receive the timing breakdown
+        if_none_match: ETag of a response the client already holds
+        profile: Return a per-stage timing breakdown (needs MATCHER_PROFILING=1)
 
     Returns:
         MatchResponse with match score, missing keywords, and suggestions
     """
+    if profile:
+        return await run_profiled_match(request.resume_text, request.job_description, "match")
+    return await run_match(request, response, {}, if_none_match)
+
+
+def profile_match(resume_text: str, job_description: str, extract=None) -> MatchResponse:
+    """
+    Run the whole /match pipeline in the calling thread and time every stage.
+
+    Caches, the work pool and the micro-batcher are bypassed so the timings
+    describe this input alone.
+
+    Args:
+        resume_text: Resume text (ignored if extract is given)
+        job_description: Job description text
+        extract: Optional callable returning the resume text, timed as "extract"
+
+    Returns:
+        MatchResponse whose profile field holds the breakdown (without hotspots)
+
+    Raises:
+        ValueError: If the resume text is empty after extraction
+    """
+    timer = StageTimer()
+    start = time.perf_counter()
+    if extract is not None:
+        with timer.stage("extract"):
+            resume_text = extract()
+        if not resume_text.strip():
+            raise ValueError("Could not extract text from resume")
+
+    resume, job = AnalyzedDocument(resume_text), AnalyzedDocument(job_description)
+    with timer.stage("preprocess"):
+        processed = [resume.embedding_text, job.embedding_text]
+    embeddings, encode_stats = matcher.profile_encode(processed)
+    timer.add("tokenize", encode_stats["tokenize_ms"])
+    timer.add("encode", encode_stats["encode_ms"])
+    with timer.stage("keywords"):
+        resume_keywords = extract_keywords(resume, top_n=15)
+        job_keywords = extract_keywords(job, top_n=15)
+    with timer.stage("skill_diff"):
+        missing_keywords = find_missing_keywords(resume, job)
+
+    match_score = matcher.score_embeddings(embeddings[0], embeddings[1])
+    resume_tokens, job_tokens = encode_stats["token_counts"]
+    return MatchResponse(
+        match_score=round(match_score, 2),
+        missing_keywords=missing_keywords[:10],
+        suggestions=generate_suggestions(match_score, missing_keywords),
+        resume_keywords=resume_keywords,
+        job_keywords=job_keywords,
+        profile=ProfileReport(
+            stages_ms={name: round(duration, 3) for name, duration in timer.stages.items()},
+            total_ms=round((time.perf_counter() - start) * 1000, 3),
+            characters={"resume": len(resume_text), "job": len(job_description)},
+            tokens={"resume": resume_tokens, "job": job_tokens},
+            max_seq_length=encode_stats["max_seq_length"]
+        )
+    )
+
+
+async def run_profiled_match(resume_text: str, job_description: str, label: str, extract=None):
+    """
+    Profile one request in isolation (shared by /match and /match-file).
+
+    With MATCHER_PROFILE_DIR set the pipeline also runs under cProfile, whose
+    dump path and top functions are added to the report; cProfile slows
+    Python code down, so compare stage timings only between runs of the same mode.
+    """
+    if not PROFILING_ENABLED:
+        raise HTTPException(status_code=403, detail="Profiling is disabled; set MATCHER_PROFILING=1")
+    if not matcher:
+        raise busy_error("Model not loaded yet", status_code=503)
+    if (extract is None and not resume_text) or not job_description:
+        raise HTTPException(status_code=400, detail="Both resume_text and job_description are required")
+
+    try:
+        if PROFILE_DIR:
+            result, hotspots, path = await asyncio.to_thread(
+                profile_call, profile_match, resume_text, job_description, extract,
+                dump_dir=PROFILE_DIR, label=label
+            )
+            result.profile.hotspots = hotspots
+            result.profile.profile_path = path
+        else:
+            result = await asyncio.to_thread(profile_match, resume_text, job_description, extract)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    print(f"Profiled /{label}: {result.profile.total_ms:.1f} ms {result.profile.stages_ms}")
+    return result
+
+
+def response_cache_key(request: MatchRequest) -> str:
+    """Key of a /match response: normalized texts, embedding namespace, skill taxonomy and code version"""
+    return response_cache.make_key(
+        normalize_for_key(request.resume_text),
+        normalize_for_key(request.job_description),
+        matcher.cache_namespace,
+        f"{app.version}/{RESPONSE_VERSION}/{PREPROCESSING_VERSION}/{skill_taxonomy().fingerprint}"
+    )
+
+
+async def run_match(
+    request: MatchRequest,
+    response: Response,
+    timings: dict,
+    if_none_match: Optional[str] = None
+):
+    """
+    Score one resume/job pair (shared by /match and /match-file).
+
+    Args:
+        request: MatchRequest containing resume_text and job_description
+        response: Response whose headers receive the timing breakdown
+        timings: Stage durations (ms) already spent by the caller, e.g. PDF extraction
+        if_none_match: ETag of a response the client already holds
+
+    Returns:
+        MatchResponse with match score, missing keywords, and suggestions,
+        or an empty 304 response if if_none_match matches
+    """
     try:
         if not matcher:
-            raise HTTPException(status_code=503, detail="Model not loaded yet")
+            raise busy_error("Model not loaded yet", status_code=503)
 
         if not request.resume_text or not request.job_description:
             raise HTTPException(
@@ -108,60 +831,315 @@ async def match_resume_job(request: MatchRequest):
                 detail="Both resume_text and job_description are required"
             )
 
-        # Preprocess texts
-        resume_processed = preprocess_for_embedding(request.resume_text)
-        job_processed = preprocess_for_embedding(request.job_description)
+        # The key determines the response, so a matching ETag needs no work at all
+        cache_key = response_cache_key(request)
+        etag = response_cache.etag(cache_key)
+        if response_cache.matches(cache_key, if_none_match):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            response.headers["ETag"] = etag
+            response.headers["X-Cache"] = "hit"
+            return cached
 
-        # Calculate match score using AI embeddings
-        match_score = matcher.calculate_match_score(resume_processed, job_processed)
+        # Preprocess texts and extract keywords off the event loop
+        try:
+            analysis, pool_timing = await work_pool.run_timed(
+                analyze_texts, request.resume_text, request.job_description
+            )
+        except PoolBusyError:
+            raise busy_error("Server busy, please retry shortly")
+        timings["analysis_queue"] = pool_timing["queue_ms"]
+        timings["analysis"] = pool_timing["compute_ms"]
+        timings.update(analysis["stage_ms"])
 
-        # Extract keywords from both texts
-        resume_keywords = extract_keywords(request.resume_text, top_n=15)
-        job_keywords = extract_keywords(request.job_description, top_n=15)
+        # Calculate match score using AI embeddings; both texts join the shared encode batch
+        encode_start = time.perf_counter()
+        try:
+            resume_embedding, job_embedding = await batcher.encode_many(
+                [analysis["resume_processed"], analysis["job_processed"]]
+            )
+        except QueueFullError:
+            raise busy_error("Server busy, please retry shortly")
+        timings["encode"] = (time.perf_counter() - encode_start) * 1000
+        match_score = matcher.score_embeddings(resume_embedding, job_embedding)
 
-        # Find missing keywords
-        missing_keywords = find_missing_keywords(request.resume_text, request.job_description)
+        missing_keywords = analysis["missing_keywords"]
 
         # Generate suggestions
         suggestions = generate_suggestions(match_score, missing_keywords)
 
-        return MatchResponse(
+        result = MatchResponse(
             match_score=round(match_score, 2),
             missing_keywords=missing_keywords[:10],  # Limit to top 10
             suggestions=suggestions,
-            resume_keywords=resume_keywords,
-            job_keywords=job_keywords
+            resume_keywords=analysis["resume_keywords"],
+            job_keywords=analysis["job_keywords"]
         )
+        response_cache.put(cache_key, result)
 
+        observe_timings(stage_seconds, timings.items())
+        response.headers["Server-Timing"] = server_timing(timings)
+        response.headers["ETag"] = etag
+        response.headers["X-Cache"] = "miss"
+        return result
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing request: {str(e)}")
 
 
-@app.post("/match-file", response_model=MatchResponse)
+def sse_event(event: str, data) -> str:
+    """Format one Server-Sent Event with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.post("/match/stream")
+async def match_stream(request: MatchRequest):
+    """
+    Match a resume with a job description, streaming results as Server-Sent Events.
+
+    Events arrive in the order score, missing_keywords, keywords, suggestions,
+    each as soon as it is ready. Scoring, the skill-gap analysis and keyword
+    extraction run concurrently, so the score is not held back by the slower
+    keyword stages and the whole response finishes sooner than /match. The
+    stages share one AnalyzedDocument per text, so each text is cleaned and
+    skill-matched once. A failure mid-stream is sent as an error event.
+
+    Args:
+        request: MatchRequest containing resume_text and job_description
+
+    Returns:
+        text/event-stream response
+    """
+    if not matcher:
+        raise busy_error("Model not loaded yet", status_code=503)
+    if not request.resume_text or not request.job_description:
+        raise HTTPException(status_code=400, detail="Both resume_text and job_description are required")
+
+    cache_key = response_cache_key(request)
+    cached = response_cache.get(cache_key)
+    resume, job = AnalyzedDocument(request.resume_text), AnalyzedDocument(request.job_description)
+
+    async def score():
+        processed = await work_pool.run(preprocess_pair, resume, job)
+        resume_embedding, job_embedding = await batcher.encode_many(processed)
+        return round(matcher.score_embeddings(resume_embedding, job_embedding), 2)
+
+    async def events():
+        if cached is not None:
+            yield sse_event("score", {"match_score": cached.match_score})
+            yield sse_event("missing_keywords", {"missing_keywords": cached.missing_keywords})
+            yield sse_event("keywords", {"resume_keywords": cached.resume_keywords,
+                                         "job_keywords": cached.job_keywords})
+            yield sse_event("suggestions", {"suggestions": cached.suggestions})
+            return
+
+        tasks = [
+            asyncio.ensure_future(score()),
+            asyncio.ensure_future(work_pool.run(find_missing_keywords, resume, job)),
+            asyncio.ensure_future(work_pool.run(keywords_pair, resume, job))
+        ]
+        try:
+            match_score = await tasks[0]
+            yield sse_event("score", {"match_score": match_score})
+
+            missing_keywords = await tasks[1]
+            yield sse_event("missing_keywords", {"missing_keywords": missing_keywords[:10]})
+
+            resume_keywords, job_keywords = await tasks[2]
+            yield sse_event("keywords", {"resume_keywords": resume_keywords, "job_keywords": job_keywords})
+
+            suggestions = generate_suggestions(match_score, missing_keywords)
+            yield sse_event("suggestions", {"suggestions": suggestions})
+
+            response_cache.put(cache_key, MatchResponse(
+                match_score=match_score,
+                missing_keywords=missing_keywords[:10],
+                suggestions=suggestions,
+                resume_keywords=resume_keywords,
+                job_keywords=job_keywords
+            ))
+        except (PoolBusyError, QueueFullError):
+            yield sse_event("error", {"detail": "Server busy, please retry shortly",
+                                      "retry_after": RETRY_AFTER_SECONDS})
+        except Exception as e:
+            yield sse_event("error", {"detail": f"Error processing request: {str(e)}"})
+        finally:
+            # Client gone or a stage failed: don't leave the other stages running
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def analyze_shared_text(text: str):
+    """
+    Analyze and encode the text shared by every item of a batch.
+
+    Returns:
+        Tuple (AnalyzedDocument, keywords, embedding)
+    """
+    shared = await work_pool.run(analyze_shared_document, text)
+    (embedding,) = await batcher.encode_many([shared.embedding_text])
+    return shared, extract_keywords(shared, top_n=15), embedding
+
+
+async def score_in_chunks(
+    shared: AnalyzedDocument,
+    shared_keywords: List[str],
+    shared_embedding: np.ndarray,
+    texts: List[str],
+    shared_is_resume: bool
+):
+    """
+    Score texts against a shared text, STREAM_CHUNK_SIZE texts at a time.
+
+    Each chunk is analyzed in the work pool, encoded with one encode_many call
+    and scored with one matrix-vector product, so only one chunk is in memory.
+
+    Yields:
+        One result dictionary per text, in input order
+
+    Raises:
+        PoolBusyError, QueueFullError: If the server is overloaded
+    """
+    for start in range(0, len(texts), STREAM_CHUNK_SIZE):
+        chunk = texts[start:start + STREAM_CHUNK_SIZE]
+        analyses = await work_pool.run(analyze_batch_chunk, shared, chunk, shared_is_resume)
+        rows = [i for i, analysis in enumerate(analyses) if analysis["processed"]]
+        embeddings = await batcher.encode_many([analyses[i]["processed"] for i in rows])
+
+        scores = iter(matcher.score_embeddings_many(shared_embedding, np.vstack(embeddings))
+                      if embeddings else ())
+        for offset, analysis in enumerate(analyses):
+            if not analysis["processed"]:
+                yield {"index": start + offset, "error": "Empty text"}
+                continue
+
+            keywords = analysis["keywords"]
+            yield {
+                "index": start + offset,
+                "match_score": round(float(next(scores)), 2),
+                "missing_keywords": analysis["missing_keywords"][:10],
+                "resume_keywords": shared_keywords if shared_is_resume else keywords,
+                "job_keywords": keywords if shared_is_resume else shared_keywords
+            }
+
+
+@app.post("/match/batch")
+async def match_batch(request: BatchMatchRequest):
+    """
+    Match one resume against many jobs, or one job against many resumes.
+
+    Send either resume_text + job_descriptions or job_description + resume_texts.
+    Results stream back as NDJSON, one line per item in input order, as soon as
+    its chunk is scored. The shared text is analyzed and encoded once, and only
+    one chunk of STREAM_CHUNK_SIZE items is held in memory at a time.
+
+    Args:
+        request: BatchMatchRequest in one of the two orientations
+
+    Returns:
+        StreamingResponse of lines {"index", "match_score", "missing_keywords",
+        "resume_keywords", "job_keywords"} (or {"index", "error"} for empty texts)
+    """
+    if not matcher:
+        raise busy_error("Model not loaded yet", status_code=503)
+
+    if request.resume_text is not None and request.job_descriptions is not None \
+            and request.resume_texts is None and request.job_description is None:
+        shared_text, texts, shared_is_resume = request.resume_text, request.job_descriptions, True
+    elif request.job_description is not None and request.resume_texts is not None \
+            and request.resume_text is None and request.job_descriptions is None:
+        shared_text, texts, shared_is_resume = request.job_description, request.resume_texts, False
+    else:
+        raise HTTPException(
+            status_code=400,
+            detail="Send either resume_text + job_descriptions or job_description + resume_texts"
+        )
+
+    if not shared_text.strip():
+        raise HTTPException(status_code=400, detail="The shared resume/job text is empty")
+    if len(texts) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"At most {BATCH_MAX_ITEMS} texts per batch")
+
+    # Analyze and encode the shared side once, before the stream starts, so
+    # overload is still reported with a proper status code
+    try:
+        shared, shared_keywords, shared_embedding = await analyze_shared_text(shared_text)
+    except (PoolBusyError, QueueFullError):
+        raise busy_error("Server busy, please retry shortly")
+
+    async def results():
+        lines = score_in_chunks(shared, shared_keywords, shared_embedding, texts, shared_is_resume)
+        try:
+            async for line in lines:
+                yield json.dumps(line) + "\n"
+        except (PoolBusyError, QueueFullError):
+            # Headers are already sent: report overload in-band and end the stream
+            yield json.dumps({"error": "Server busy, stream aborted"}) + "\n"
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+
+@app.post("/match-file", response_model=MatchResponse, response_model_exclude_none=True)
 async def match_resume_file(
+    response: Response,
     resume_file: UploadFile = File(...),
-    job_description: str = Form(...)
+    job_description: str = Form(...),
+    if_none_match: Optional[str] = Header(None),
+    profile: bool = Query(False)
 ):
     """
     Match a resume file (PDF or TXT) with a job description.
 
     Args:
+        response: Response whose headers receive the timing breakdown
         resume_file: Uploaded resume file (PDF or TXT)
         job_description: Job description text
+        if_none_match: ETag of a response the client already holds
+        profile: Return a per-stage timing breakdown including text
+            extraction (needs MATCHER_PROFILING=1)
 
     Returns:
         MatchResponse with match score, missing keywords, and suggestions
     """
     try:
         if not matcher:
-            raise HTTPException(status_code=503, detail="Model not loaded yet")
+            raise busy_error("Model not loaded yet", status_code=503)
 
         # Read file content
         file_content = await resume_file.read()
+        timings = {}
+
+        if profile:
+            if not resume_file.filename.lower().endswith(SUPPORTED_RESUME_EXTENSIONS):
+                raise HTTPException(status_code=400, detail="Unsupported file type. Please upload PDF or TXT file.")
+            return await run_profiled_match(
+                None, job_description, "match-file",
+                extract=lambda: extract_resume_text(resume_file.filename, file_content, PDF_PAGE_WORKERS)[0]
+            )
 
-        # Extract text based on file type
+        # Extract text based on file type; PDF parsing runs in the work pool
         if resume_file.filename.lower().endswith('.pdf'):
-            resume_text = extract_text_from_pdf(file_content)
+            try:
+                (resume_text, truncated), pool_timing = await work_pool.run_timed(
+                    extract_resume_text, resume_file.filename, file_content, PDF_PAGE_WORKERS
+                )
+            except PoolBusyError:
+                raise busy_error("Server busy, please retry shortly")
+            timings["extract_queue"] = pool_timing["queue_ms"]
+            timings["extract"] = pool_timing["compute_ms"]
+            if truncated:
+                # Matched on the pages read within MATCHER_PDF_MAX_PAGES / MATCHER_PDF_TIME_LIMIT
+                response.headers["X-Extract-Truncated"] = truncated
         elif resume_file.filename.lower().endswith('.txt'):
             resume_text = file_content.decode('utf-8')
         else:
@@ -175,7 +1153,7 @@ async def match_resume_file(
 
         # Use the existing match endpoint logic
         request = MatchRequest(resume_text=resume_text, job_description=job_description)
-        return await match_resume_job(request)
+        return await run_match(request, response, timings, if_none_match)
 
     except HTTPException:
         raise
@@ -183,6 +1161,551 @@ async def match_resume_file(
         raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
 
 
+def iter_upload_entries(uploads: List[UploadFile]):
+    """
+    List the resume files of an upload, opening ZIP archives member by member.
+
+    Members are not read here: each entry carries a reader, so only the files
+    currently being extracted are ever held in memory.
+
+    Yields:
+        Tuples (filename, size in bytes or None, read function or error message)
+    """
+    for upload in uploads:
+        if not upload.filename.lower().endswith('.zip'):
+            upload.file.seek(0)
+            yield upload.filename, None, upload.file.read
+            continue
+
+        try:
+            archive = zipfile.ZipFile(upload.file)
+        except zipfile.BadZipFile:
+            yield upload.filename, None, "Invalid ZIP archive"
+            continue
+
+        for info in archive.infolist():
+            name = info.filename
+            if info.is_dir() or name.startswith('__MACOSX/') or os.path.basename(name).startswith('.'):
+                continue
+            yield f"{upload.filename}/{name}", info.file_size, functools.partial(archive.read, info)
+
+
+async def extract_upload_entry(filename: str, size: Optional[int], read):
+    """
+    Read one upload entry and extract its text in the extraction pool.
+
+    Returns:
+        Tuple (FileMatchResult with timing or error, extracted text or None)
+    """
+    result = FileMatchResult(filename=filename)
+    if isinstance(read, str):
+        result.error = read
+        return result, None
+    if not filename.lower().endswith(SUPPORTED_RESUME_EXTENSIONS):
+        result.error = "Unsupported file type. Please upload PDF or TXT file."
+        return result, None
+    if size is not None and size > MAX_FILE_BYTES:
+        result.error = f"File larger than {MAX_FILE_BYTES // (1024 * 1024)} MB"
+        return result, None
+
+    # Reading may decompress a ZIP member: keep it off the event loop
+    content = await asyncio.to_thread(read)
+    if len(content) > MAX_FILE_BYTES:
+        result.error = f"File larger than {MAX_FILE_BYTES // (1024 * 1024)} MB"
+        return result, None
+
+    deadline = time.monotonic() + EXTRACT_MAX_WAIT
+    while True:
+        try:
+            (text, truncated), timing = await extraction_pool.run_timed(extract_resume_text, filename, content)
+            break
+        except PoolBusyError:
+            # Admission was checked up front; wait for concurrent uploads to drain, but not forever
+            if time.monotonic() >= deadline:
+                result.error = "Server busy, please retry shortly"
+                return result, None
+            await asyncio.sleep(0.05)
+        except ValueError as e:
+            result.error = str(e)
+            return result, None
+
+    result.extract_ms = timing["compute_ms"]
+    result.extract_queue_ms = timing["queue_ms"]
+    result.truncated = truncated
+    observe_timings(stage_seconds, [("extract", timing["compute_ms"]), ("extract_queue", timing["queue_ms"])])
+    result.characters = len(text)
+    if not text.strip():
+        result.error = "Could not extract text from resume"
+        return result, None
+    return result, text
+
+
+@app.post("/match-files", response_model=MultiFileMatchResponse)
+async def match_resume_files(
+    resume_files: List[UploadFile] = File(...),
+    job_description: str = Form(...)
+):
+    """
+    Rank many resume files (PDF, TXT or ZIP archives of them) against one job description.
+
+    Text is extracted in a process pool, at most EXTRACT_WORKERS * 2 files at a
+    time, streaming ZIP members instead of unpacking whole archives. The
+    extracted resumes are then scored in batches against the job, which is
+    encoded once.
+
+    Args:
+        resume_files: Uploaded PDF, TXT or ZIP files
+        job_description: Job description text
+
+    Returns:
+        MultiFileMatchResponse with results ranked by score (failed files last)
+    """
+    if not matcher:
+        raise busy_error("Model not loaded yet", status_code=503)
+    if not job_description.strip():
+        raise HTTPException(status_code=400, detail="job_description is required")
+    if extraction_pool.pending >= extraction_pool.max_pending:
+        raise busy_error("Server busy, please retry shortly")
+
+    try:
+        entries = list(iter_upload_entries(resume_files))
+    except zipfile.LargeZipFile as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if len(entries) > MAX_UPLOAD_FILES:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_UPLOAD_FILES} files per request")
+
+    extract_start = time.perf_counter()
+    window = asyncio.Semaphore(EXTRACT_WORKERS * 2)
+
+    async def extract(entry):
+        async with window:
+            return await extract_upload_entry(*entry)
+
+    extractions = await asyncio.gather(*(extract(entry) for entry in entries))
+    extract_seconds = time.perf_counter() - extract_start
+
+    score_start = time.perf_counter()
+    results = [result for result, _ in extractions]
+    extracted = [result for result, text in extractions if text is not None]
+    texts = [text for _, text in extractions if text is not None]
+    del extractions
+    try:
+        job, job_keywords, job_embedding = await analyze_shared_text(job_description)
+        async for line in score_in_chunks(job, job_keywords, job_embedding, texts, False):
+            result = extracted[line["index"]]
+            if "error" in line:
+                result.error = line["error"]
+                continue
+            result.match_score = line["match_score"]
+            result.missing_keywords = line["missing_keywords"]
+            result.resume_keywords = line["resume_keywords"]
+    except (PoolBusyError, QueueFullError):
+        raise busy_error("Server busy, please retry shortly")
+    score_seconds = time.perf_counter() - score_start
+
+    scored = sorted((r for r in results if r.match_score is not None),
+                    key=lambda r: r.match_score, reverse=True)
+    failed = [r for r in results if r.match_score is None]
+
+    return MultiFileMatchResponse(
+        job_keywords=job_keywords,
+        results=scored + failed,
+        files=len(results),
+        failed=len(failed),
+        extract_seconds=round(extract_seconds, 3),
+        score_seconds=round(score_seconds, 3)
+    )
+
+
+async def register_document(kind: str, request: DocumentRequest) -> DocumentResponse:
+    """Analyze, encode and store a resume or job (shared by POST /resumes and /jobs)"""
+    if not matcher:
+        raise busy_error("Model not loaded yet", status_code=503)
+    if not request.text or not request.text.strip():
+        raise HTTPException(status_code=400, detail="text is required")
+
+    try:
+        analysis = await work_pool.run(analyze_document, request.text)
+        (embedding,) = await batcher.encode_many([analysis["processed"]])
+    except (PoolBusyError, QueueFullError):
+        raise busy_error("Server busy, please retry shortly")
+
+    doc_id = await asyncio.to_thread(
+        document_store.add, kind, request.text, embedding, analysis["keywords"],
+        analysis["skills"], matcher.cache_namespace, request.title, analysis["taxonomy"]
+    )
+    return DocumentResponse(
+        id=doc_id, kind=kind, title=request.title, keywords=analysis["keywords"],
+        skills=analysis["skills"], characters=len(request.text)
+    )
+
+
+async def reencode_stale(kind: str, doc_ids: List[str]):
+    """Re-encode stored documents whose embeddings come from another model"""
+    for start in range(0, len(doc_ids), STREAM_CHUNK_SIZE):
+        chunk = doc_ids[start:start + STREAM_CHUNK_SIZE]
+        docs = await asyncio.to_thread(lambda: [document_store.get(kind, doc_id) for doc_id in chunk])
+        docs = [doc for doc in docs if doc is not None]
+        processed = await work_pool.run(preprocess_texts, [doc["text"] for doc in docs])
+        embeddings = await batcher.encode_many(processed)
+        for doc, embedding in zip(docs, embeddings):
+            await asyncio.to_thread(
+                document_store.update_embedding, doc["id"], embedding, matcher.cache_namespace
+            )
+
+
+async def refresh_skills(doc: dict) -> dict:
+    """
+    Re-extract a stored document's skills if they come from another skill taxonomy.
+
+    Documents registered before a taxonomy reload (or before skills were
+    tagged) would otherwise be compared with stale skill sets.
+
+    Raises:
+        PoolBusyError: If the work pool is full
+    """
+    if doc["taxonomy"] == skill_taxonomy().fingerprint:
+        return doc
+    skills, fingerprint = await work_pool.run(extract_skill_list, doc["text"])
+    await asyncio.to_thread(document_store.update_skills, doc["id"], skills, fingerprint)
+    return dict(doc, skills=skills, taxonomy=fingerprint)
+
+
+async def stored_document(kind: str, doc_id: str) -> dict:
+    """Fetch a registered document with an embedding from the current model and current skills, or 404"""
+    if not matcher:
+        raise busy_error("Model not loaded yet", status_code=503)
+
+    doc = await asyncio.to_thread(document_store.get, kind, doc_id)
+    if doc is None:
+        raise HTTPException(status_code=404, detail=f"No {kind} with id {doc_id}")
+
+    try:
+        if doc["namespace"] != matcher.cache_namespace:
+            await reencode_stale(kind, [doc_id])
+            doc = await asyncio.to_thread(document_store.get, kind, doc_id)
+        return await refresh_skills(doc)
+    except (PoolBusyError, QueueFullError):
+        raise busy_error("Server busy, please retry shortly")
+
+
+async def stored_document_view(kind: str, doc_id: str) -> DocumentResponse:
+    """Public view of a registered document with current skills, or 404 (no model needed)"""
+    doc = await asyncio.to_thread(document_store.get, kind, doc_id)
+    if doc is None:
+        raise HTTPException(status_code=404, detail=f"No {kind} with id {doc_id}")
+    try:
+        doc = await refresh_skills(doc)
+    except PoolBusyError:
+        raise busy_error("Server busy, please retry shortly")
+    return document_response(kind, doc)
+
+
+def document_response(kind: str, doc: dict) -> DocumentResponse:
+    """Public view of a stored document (without its embedding)"""
+    return DocumentResponse(
+        id=doc["id"], kind=kind, title=doc["title"], keywords=doc["keywords"],
+        skills=doc["skills"], characters=len(doc["text"])
+    )
+
+
+@app.post("/resumes", response_model=DocumentResponse)
+async def create_resume(request: DocumentRequest):
+    """
+    Register a resume: preprocess it once and store its text, embedding and skills.
+
+    Args:
+        request: DocumentRequest with the resume text and an optional title
+
+    Returns:
+        DocumentResponse with the new id, keywords and skills
+    """
+    return await register_document("resume", request)
+
+
+@app.post("/jobs", response_model=DocumentResponse)
+async def create_job(request: DocumentRequest):
+    """
+    Register a job description: preprocess it once and store its text, embedding and skills.
+
+    Args:
+        request: DocumentRequest with the job description and an optional title
+
+    Returns:
+        DocumentResponse with the new id, keywords and skills
+    """
+    return await register_document("job", request)
+
+
+@app.get("/resumes/{resume_id}", response_model=DocumentResponse)
+async def get_resume(resume_id: str):
+    """Get a registered resume's keywords and skills"""
+    return await stored_document_view("resume", resume_id)
+
+
+@app.get("/jobs/{job_id}", response_model=DocumentResponse)
+async def get_job(job_id: str):
+    """Get a registered job's keywords and skills"""
+    return await stored_document_view("job", job_id)
+
+
+@app.get("/match", response_model=MatchResponse)
+async def match_stored(resume_id: str, job_id: str):
+    """
+    Match a registered resume with a registered job from their stored analysis.
+
+    No text is re-processed: the score is a dot product of the stored
+    embeddings and the missing keywords are a difference of stored skill sets.
+    Only documents from another model or skill taxonomy are analyzed again
+    (once; the refreshed embedding or skills are stored).
+
+    Args:
+        resume_id: Id returned by POST /resumes
+        job_id: Id returned by POST /jobs
+
+    Returns:
+        MatchResponse with match score, missing keywords, and suggestions
+    """
+    resume = await stored_document("resume", resume_id)
+    job = await stored_document("job", job_id)
+
+    match_score = matcher.score_embeddings(resume["embedding"], job["embedding"])
+    missing_keywords = sorted(set(job["skills"]) - set(resume["skills"]))
+
+    return MatchResponse(
+        match_score=round(match_score, 2),
+        missing_keywords=missing_keywords[:10],
+        suggestions=generate_suggestions(match_score, missing_keywords),
+        resume_keywords=resume["keywords"],
+        job_keywords=job["keywords"]
+    )
+
+
+async def rank_stored(kind: str, doc_id: str, target_kind: str, top_k: int) -> RankingResponse:
+    """Rank every registered document of target_kind against one registered document"""
+    doc = await stored_document(kind, doc_id)
+
+    stale = await asyncio.to_thread(document_store.stale_ids, target_kind, matcher.cache_namespace)
+    if stale:
+        try:
+            await reencode_stale(target_kind, stale)
+        except (PoolBusyError, QueueFullError):
+            raise busy_error("Server busy, please retry shortly")
+
+    ids, matrix = await asyncio.to_thread(document_store.matrix, target_kind, matcher.cache_namespace)
+    ranked = matcher.rank_embeddings(doc["embedding"], matrix, top_k=top_k) if ids else []
+    titles = await asyncio.to_thread(document_store.titles, target_kind, [ids[row] for row, _ in ranked])
+
+    return RankingResponse(
+        id=doc_id,
+        kind=kind,
+        candidates=len(ids),
+        results=[
+            RankedDocument(id=ids[row], title=titles.get(ids[row]),
+                           match_score=round(max(0.0, min(100.0, score)), 2))
+            for row, score in ranked
+        ]
+    )
+
+
+@app.get("/resumes/{resume_id}/jobs", response_model=RankingResponse)
+async def rank_jobs_for_resume(resume_id: str, top_k: int = 10):
+    """
+    Rank all registered jobs for a registered resume by stored embeddings.
+
+    Args:
+        resume_id: Id returned by POST /resumes
+        top_k: Number of best jobs to return
+
+    Returns:
+        RankingResponse with job ids, titles and scores, best first
+    """
+    return await rank_stored("resume", resume_id, "job", top_k)
+
+
+@app.get("/jobs/{job_id}/resumes", response_model=RankingResponse)
+async def rank_resumes_for_job(job_id: str, top_k: int = 10):
+    """
+    Rank all registered resumes for a registered job by stored embeddings.
+
+    Args:
+        job_id: Id returned by POST /jobs
+        top_k: Number of best resumes to return
+
+    Returns:
+        RankingResponse with resume ids, titles and scores, best first
+    """
+    return await rank_stored("job", job_id, "resume", top_k)
+
+
+def prepare_bulk_match(task: dict) -> dict:
+    """
+    Encode and analyze the jobs of a bulk-match task once (runs in a task worker).
+
+    Runs again when a task resumes; the embedding cache makes that cheap.
+
+    Args:
+        task: Task whose params hold job_descriptions and top_k
+
+    Returns:
+        State shared by every chunk: job positions, normalized embeddings and skill sets
+    """
+    jobs = task["params"]["job_descriptions"]
+    job_rows = [j for j, text in enumerate(jobs) if text.strip()]
+    documents = [AnalyzedDocument(jobs[j]) for j in job_rows]
+    return {
+        "job_rows": job_rows,
+        "embeddings": normalize_rows(matcher.encode_batch(
+            [document.embedding_text for document in documents], batch_size=BATCH_MAX_SIZE
+        )),
+        "skills": [document.skills for document in documents]
+    }
+
+
+def process_bulk_match(task: dict, state: dict, resumes: List[str], start: int) -> List[dict]:
+    """
+    Match one chunk of a bulk-match task's resumes against all of its jobs.
+
+    Args:
+        task: The running task
+        state: Result of prepare_bulk_match
+        resumes: Resume texts of this chunk
+        start: Position of the first resume in the task
+
+    Returns:
+        One result per resume: its best top_k jobs with scores and missing
+        keywords, or an error for an empty resume
+    """
+    results = [{"index": start + offset, "error": "Empty text"} for offset in range(len(resumes))]
+    rows = [offset for offset, text in enumerate(resumes) if text.strip()]
+    if not rows:
+        return results
+
+    documents = [AnalyzedDocument(resumes[offset]) for offset in rows]
+    embeddings = normalize_rows(matcher.encode_batch(
+        [document.embedding_text for document in documents], batch_size=BATCH_MAX_SIZE
+    ))
+    indices, scores = blocked_top_k(embeddings, state["embeddings"], task["params"]["top_k"])
+
+    for row, offset in enumerate(rows):
+        resume_skills = documents[row].skills
+        results[offset] = {
+            "index": start + offset,
+            "matches": [
+                {
+                    "job_index": state["job_rows"][col],
+                    "match_score": round(float(np.clip(score * 100, 0.0, 100.0)), 2),
+                    "missing_keywords": sorted(state["skills"][col] - resume_skills)[:10]
+                }
+                for col, score in zip(indices[row], scores[row])
+            ]
+        }
+    return results
+
+
+def task_or_404(task_id: str) -> dict:
+    """Fetch a task or raise 404"""
+    task = task_runner.store.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"No task with id {task_id}")
+    return task
+
+
+@app.post("/tasks/match", response_model=TaskResponse, status_code=202)
+async def submit_bulk_match(request: BulkMatchRequest):
+    """
+    Start matching many resumes against many jobs in the background.
+
+    The task is stored in SQLite and processed by local task workers in
+    chunks; poll GET /tasks/{id} for progress and download GET
+    /tasks/{id}/results when it has completed.
+
+    Args:
+        request: BulkMatchRequest with resume_texts, job_descriptions and top_k
+
+    Returns:
+        TaskResponse of the queued task
+    """
+    if not request.resume_texts or not any(job.strip() for job in request.job_descriptions):
+        raise HTTPException(status_code=400, detail="resume_texts and at least one job description are required")
+    if len(request.resume_texts) > TASK_MAX_RESUMES or len(request.job_descriptions) > TASK_MAX_JOBS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {TASK_MAX_RESUMES} resumes and {TASK_MAX_JOBS} jobs per task"
+        )
+    if not 1 <= request.top_k <= TASK_MAX_TOP_K:
+        raise HTTPException(status_code=400, detail=f"top_k must be between 1 and {TASK_MAX_TOP_K}")
+
+    task_id = await asyncio.to_thread(
+        task_runner.store.submit, "bulk_match", request.resume_texts,
+        {"job_descriptions": request.job_descriptions, "top_k": request.top_k}
+    )
+    return TaskResponse(**await asyncio.to_thread(task_or_404, task_id))
+
+
+@app.get("/tasks/{task_id}", response_model=TaskResponse)
+async def get_task(task_id: str):
+    """
+    Get a task's status and progress.
+
+    Args:
+        task_id: Id returned by POST /tasks/match
+
+    Returns:
+        TaskResponse with items done, throughput (items/sec) and ETA
+    """
+    return TaskResponse(**await asyncio.to_thread(task_or_404, task_id))
+
+
+@app.post("/tasks/{task_id}/cancel", response_model=TaskResponse)
+async def cancel_task(task_id: str):
+    """
+    Cancel a task: a queued task stops at once, a running one after its current chunk.
+
+    Results of the chunks already processed stay downloadable.
+
+    Args:
+        task_id: Id returned by POST /tasks/match
+
+    Returns:
+        TaskResponse after the cancellation request
+    """
+    if await asyncio.to_thread(task_runner.store.cancel, task_id) is None:
+        raise HTTPException(status_code=404, detail=f"No task with id {task_id}")
+    return TaskResponse(**await asyncio.to_thread(task_or_404, task_id))
+
+
+@app.get("/tasks/{task_id}/results")
+async def task_results(task_id: str):
+    """
+    Download a task's results as NDJSON, one line per resume in input order.
+
+    Available once the task has completed, or for the processed part of a
+    cancelled task.
+
+    Args:
+        task_id: Id returned by POST /tasks/match
+
+    Returns:
+        Streaming NDJSON response
+    """
+    task = await asyncio.to_thread(task_or_404, task_id)
+    if task["status"] not in ("completed", "cancelled"):
+        raise HTTPException(status_code=409, detail=f"Task is {task['status']}; results are not ready")
+
+    results = task_runner.store.results(task_id)
+
+    async def lines():
+        while True:
+            batch = await asyncio.to_thread(lambda: list(itertools.islice(results, 500)))
+            for entry in batch:
+                yield json.dumps(entry[1]) + "\n"
+            if len(batch) < 500:
+                return
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 def generate_suggestions(match_score: float, missing_keywords: List[str]) -> str:
     """
     Generate improvement suggestions based on match score and missing keywords.
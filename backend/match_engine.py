@@ -0,0 +1,74 @@
+"""
+Memory-bounded many-to-many similarity search.
+
+Scores every query row against every corpus row in fixed-size blocks and keeps
+only a per-row top-k, so an N x M run never materializes the full N x M matrix.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+def blocked_top_k(
+    queries: np.ndarray,
+    corpus: np.ndarray,
+    top_k: int,
+    query_block: int = 1024,
+    corpus_block: int = 8192
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the top_k corpus rows for every query row by blocked dot products.
+
+    Both inputs should already be L2-normalized so dot products are cosine
+    similarities. Peak extra memory is about query_block * corpus_block floats.
+
+    Args:
+        queries: Array of shape (n_queries, dim)
+        corpus: Array of shape (n_corpus, dim), may be memory-mapped
+        top_k: Number of results per query row
+        query_block: Query rows scored per block
+        corpus_block: Corpus rows scored per block
+
+    Returns:
+        Tuple (indices, scores) of shape (n_queries, min(top_k, n_corpus)),
+        each row sorted by score descending
+    """
+    n_queries, n_corpus = len(queries), len(corpus)
+    k = max(0, min(top_k, n_corpus))
+
+    all_indices = np.zeros((n_queries, k), dtype=np.int64)
+    all_scores = np.zeros((n_queries, k), dtype=np.float32)
+    if k == 0:
+        return all_indices, all_scores
+
+    for q_start in range(0, n_queries, query_block):
+        query_rows = np.asarray(queries[q_start:q_start + query_block], dtype=np.float32)
+
+        # Running per-row top-k, seeded with empty (-inf) slots
+        best_indices = np.full((len(query_rows), k), -1, dtype=np.int64)
+        best_scores = np.full((len(query_rows), k), -np.inf, dtype=np.float32)
+
+        for c_start in range(0, n_corpus, corpus_block):
+            corpus_rows = np.asarray(corpus[c_start:c_start + corpus_block], dtype=np.float32)
+            block_scores = query_rows @ corpus_rows.T
+
+            if block_scores.shape[1] > k:
+                keep = np.argpartition(-block_scores, k - 1, axis=1)[:, :k]
+            else:
+                keep = np.broadcast_to(np.arange(block_scores.shape[1]), block_scores.shape)
+
+            candidate_indices = np.concatenate([best_indices, keep + c_start], axis=1)
+            candidate_scores = np.concatenate(
+                [best_scores, np.take_along_axis(block_scores, keep, axis=1)], axis=1
+            )
+
+            keep = np.argpartition(-candidate_scores, k - 1, axis=1)[:, :k]
+            best_indices = np.take_along_axis(candidate_indices, keep, axis=1)
+            best_scores = np.take_along_axis(candidate_scores, keep, axis=1)
+
+        order = np.argsort(-best_scores, axis=1, kind='stable')
+        all_indices[q_start:q_start + len(query_rows)] = np.take_along_axis(best_indices, order, axis=1)
+        all_scores[q_start:q_start + len(query_rows)] = np.take_along_axis(best_scores, order, axis=1)
+
+    return all_indices, all_scores
@@ -2,11 +2,18 @@
 AI-powered resume and job description matcher using Sentence Transformers.
 """
 
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import os
+import time
+
+from .embedding_cache import EmbeddingCache
+from .match_engine import blocked_top_k
+from .model_bundle import is_bundle, read_manifest, verify_bundle
+
+
+POOLING_STRATEGIES = ('mean', 'max', 'weighted')
+INFERENCE_BACKENDS = ('torch', 'onnx', 'onnx-int8')
 
 
 class ResumeJobMatcher:
@@ -15,17 +22,93 @@ class ResumeJobMatcher:
     Uses the free 'all-MiniLM-L6-v2' model that runs offline.
     """
 
-    def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
+    def __init__(
+        self,
+        model_name: str = 'all-MiniLM-L6-v2',
+        cache: Optional[EmbeddingCache] = None,
+        chunking: bool = False,
+        chunk_overlap: int = 32,
+        pooling: str = 'mean',
+        backend: str = 'torch',
+        onnx_dir: Optional[str] = None,
+        verify_checksums: bool = False
+    ):
         """
         Initialize the matcher with a sentence transformer model.
 
         Args:
-            model_name: Name of the sentence transformer model to use
+            model_name: Name of the sentence transformer model to use, or the
+                path of a bundle made by models/download_model.py (loaded offline)
+            cache: Embedding cache to use (defaults to an in-memory LRU cache)
+            chunking: Encode long texts as overlapping windows of max_seq_length
+                tokens instead of truncating them
+            chunk_overlap: Number of tokens shared by consecutive windows
+            pooling: How window embeddings are combined: 'mean', 'max' or
+                'weighted' (mean weighted by window token count)
+            backend: Inference backend: 'torch', 'onnx' or 'onnx-int8'
+                (ONNX Runtime with dynamically int8-quantized weights)
+            onnx_dir: Where exported ONNX models are kept (defaults to models/onnx/)
+            verify_checksums: Verify bundle file checksums before loading
         """
+        if pooling not in POOLING_STRATEGIES:
+            raise ValueError(f"Unknown pooling: {pooling}. Use one of {POOLING_STRATEGIES}.")
+        if backend not in INFERENCE_BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}. Use one of {INFERENCE_BACKENDS}.")
+
+        # Imported here: torch and sentence_transformers take seconds to import
+        from sentence_transformers import SentenceTransformer
+
         print(f"Loading model: {model_name}...")
-        self.model = SentenceTransformer(model_name)
+        self.model_name = model_name
+        # Identifies the weights for caching; bundles use their source model and version
+        self.model_id = model_name
+
+        if is_bundle(model_name):
+            manifest = verify_bundle(model_name) if verify_checksums else read_manifest(model_name)
+            self.model_id = f"{manifest['model_name']}@{manifest['bundle_version']}"
+            # Local files only: never contact the Hugging Face Hub for a bundle
+            self.model = SentenceTransformer(model_name, local_files_only=True)
+        else:
+            self.model = SentenceTransformer(model_name)
+        # sentence-transformers renamed this accessor in newer releases
+        get_dimension = getattr(self.model, 'get_embedding_dimension', None) or \
+            self.model.get_sentence_embedding_dimension
+        self.embedding_dim = get_dimension()
+
+        # Object whose encode() produces embeddings: the model itself or ONNX Runtime
+        self.backend = backend
+        if backend == 'torch':
+            self.encoder = self.model
+        else:
+            from .onnx_backend import OnnxEncoder
+            self.encoder = OnnxEncoder(
+                self.model, self.model_id, quantize=(backend == 'onnx-int8'), onnx_dir=onnx_dir
+            )
+
+        self.chunking = chunking
+        self.chunk_overlap = chunk_overlap
+        self.pooling = pooling
+
+        if cache is None:
+            cache = EmbeddingCache(self.cache_namespace)
+        self.cache = cache
         print("Model loaded successfully!")
 
+    @property
+    def cache_namespace(self) -> str:
+        """
+        Name identifying how embeddings are produced, used as the cache model key.
+
+        Chunked and quantized embeddings differ from the default ones, so they
+        must never share cache entries.
+        """
+        namespace = self.model_id
+        if self.backend != 'torch':
+            namespace += f"|{self.backend}"
+        if self.chunking:
+            namespace += f"|chunked-{self.pooling}-{self.chunk_overlap}"
+        return namespace
+
     def calculate_match_score(self, resume_text: str, job_text: str) -> float:
         """
         Calculate semantic similarity match score between resume and job description.
@@ -37,26 +120,97 @@ class ResumeJobMatcher:
         Returns:
             Match score as percentage (0-100)
         """
-        # Generate embeddings for both texts
-        resume_embedding = self.model.encode(resume_text, convert_to_tensor=False)
-        job_embedding = self.model.encode(job_text, convert_to_tensor=False)
+        # Generate embeddings for both texts (cached texts are not re-encoded)
+        resume_embedding, job_embedding = self.encode_batch([resume_text, job_text])
+
+        return self.score_embeddings(resume_embedding, job_embedding)
 
-        # Reshape for sklearn
-        resume_embedding = resume_embedding.reshape(1, -1)
-        job_embedding = job_embedding.reshape(1, -1)
+    @staticmethod
+    def score_embeddings(resume_embedding: np.ndarray, job_embedding: np.ndarray) -> float:
+        """
+        Calculate the match score of two precomputed embeddings.
+
+        Args:
+            resume_embedding: Resume embedding vector
+            job_embedding: Job description embedding vector
+
+        Returns:
+            Match score as percentage (0-100)
+        """
+        resume_embedding, job_embedding = normalize_rows(np.vstack([resume_embedding, job_embedding]))
 
         # Calculate cosine similarity
-        similarity = cosine_similarity(resume_embedding, job_embedding)[0][0]
+        similarity = float(np.dot(resume_embedding, job_embedding))
 
         # Convert to percentage (0-100)
         match_score = float(similarity * 100)
 
         return max(0.0, min(100.0, match_score))  # Ensure it's within 0-100
 
-    def calculate_section_scores(
+    @staticmethod
+    def score_embeddings_many(embedding: np.ndarray, others: np.ndarray) -> np.ndarray:
+        """
+        Calculate the match scores of one embedding against many, in input order.
+
+        Cosine similarity is symmetric, so this serves both one resume vs many
+        jobs and one job vs many resumes.
+
+        Args:
+            embedding: Embedding vector of shape (dim,)
+            others: Embedding matrix of shape (n, dim)
+
+        Returns:
+            Array of n match scores (0-100), same scale as score_embeddings
+        """
+        if len(others) == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        embedding = normalize_rows(np.asarray(embedding).reshape(1, -1))[0]
+        return np.clip(normalize_rows(others) @ embedding * 100, 0.0, 100.0)
+
+    def section_similarity_matrix(
         self,
         resume_sections: List[str],
         job_sections: List[str]
+    ) -> np.ndarray:
+        """
+        Calculate the full resume-section x job-section match score matrix.
+
+        Each distinct section is encoded once in a single batch and all pairs are
+        scored with one matrix multiplication.
+
+        Args:
+            resume_sections: List of resume section texts
+            job_sections: List of job description section texts
+
+        Returns:
+            Array of shape (len(resume_sections), len(job_sections)) with scores
+            as percentages (0-100); pairs involving an empty section are NaN
+        """
+        matrix = np.full((len(resume_sections), len(job_sections)), np.nan, dtype=np.float32)
+
+        resume_rows = [i for i, section in enumerate(resume_sections) if section.strip()]
+        job_cols = [j for j, section in enumerate(job_sections) if section.strip()]
+        if not resume_rows or not job_cols:
+            return matrix
+
+        embeddings = normalize_rows(self.encode_batch(
+            [resume_sections[i] for i in resume_rows] + [job_sections[j] for j in job_cols]
+        ))
+        resume_embeddings = embeddings[:len(resume_rows)]
+        job_embeddings = embeddings[len(resume_rows):]
+
+        scores = np.clip(resume_embeddings @ job_embeddings.T * 100, 0.0, 100.0)
+        matrix[np.ix_(resume_rows, job_cols)] = scores
+
+        return matrix
+
+    def calculate_section_scores(
+        self,
+        resume_sections: List[str],
+        job_sections: List[str],
+        top_k: Optional[int] = None,
+        matrix: Optional[np.ndarray] = None
     ) -> List[Tuple[float, str, str]]:
         """
         Calculate match scores for different sections of resume and job description.
@@ -64,17 +218,29 @@ class ResumeJobMatcher:
         Args:
             resume_sections: List of resume section texts
             job_sections: List of job description section texts
+            top_k: If given, only the best top_k pairs are returned
+            matrix: Precomputed section_similarity_matrix result to reuse
 
         Returns:
             List of tuples (score, resume_section, job_section)
         """
-        scores = []
+        if matrix is None:
+            matrix = self.section_similarity_matrix(resume_sections, job_sections)
+
+        rows, cols = np.nonzero(~np.isnan(matrix))
+        values = matrix[rows, cols]
 
-        for r_section in resume_sections:
-            for j_section in job_sections:
-                if r_section.strip() and j_section.strip():
-                    score = self.calculate_match_score(r_section, j_section)
-                    scores.append((score, r_section[:100], j_section[:100]))
+        if top_k is not None and top_k < len(values):
+            if top_k <= 0:
+                return []
+            # Partial selection keeps only the candidates worth sorting
+            keep = np.argpartition(-values, top_k - 1)[:top_k]
+            rows, cols, values = rows[keep], cols[keep], values[keep]
+
+        scores = [
+            (float(value), resume_sections[r][:100], job_sections[c][:100])
+            for r, c, value in zip(rows, cols, values)
+        ]
 
         return sorted(scores, reverse=True)
 
@@ -86,38 +252,346 @@ class ResumeJobMatcher:
             text: Input text
 
         Returns:
-            Embedding vector as numpy array
+            Embedding vector as numpy array (a writable copy, never the cached vector)
+        """
+        embedding = self.cache.get(text)
+        if embedding is None:
+            if self.chunking:
+                embedding = self.encode_chunked([text])[0]
+            else:
+                embedding = self.encoder.encode(text, convert_to_tensor=False)
+            self.cache.put(text, embedding)
+        return np.array(embedding, dtype=np.float32)
+
+    def encode_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 64,
+        chunk_stats: Optional[List[Optional[dict]]] = None
+    ) -> np.ndarray:
+        """
+        Get embedding vectors for many texts with a single batched encode call.
+
+        Texts found in the cache are not re-encoded, and duplicates within the
+        batch are encoded only once.
+
+        Args:
+            texts: List of input texts
+            batch_size: Number of texts the model processes per forward pass
+            chunk_stats: Optional list that receives one entry per text: the
+                chunk statistics of encode_chunked, or None if the text was
+                served from the cache or chunking is off
+
+        Returns:
+            Embedding matrix of shape (len(texts), dim)
+        """
+        cached = self.cache.get_many(texts)
+        missing = list(dict.fromkeys(
+            text for text, embedding in zip(texts, cached) if embedding is None
+        ))
+
+        missing_stats: List[dict] = []
+        if missing:
+            if self.chunking:
+                encoded = self.encode_chunked(missing, batch_size=batch_size, stats=missing_stats)
+            else:
+                encoded = np.asarray(
+                    self.encoder.encode(missing, batch_size=batch_size, convert_to_tensor=False),
+                    dtype=np.float32
+                )
+            self.cache.put_many(missing, encoded)
+            new_embeddings = dict(zip(missing, encoded))
+            cached = [
+                embedding if embedding is not None else new_embeddings[text]
+                for text, embedding in zip(texts, cached)
+            ]
+
+        if chunk_stats is not None:
+            stats_by_text = dict(zip(missing, missing_stats))
+            chunk_stats.extend(stats_by_text.get(text) for text in texts)
+
+        if not cached:
+            return np.zeros((0, self.embedding_dim), dtype=np.float32)
+
+        return np.vstack(cached).astype(np.float32, copy=False)
+
+    def profile_encode(self, texts: List[str]) -> Tuple[np.ndarray, dict]:
+        """
+        Encode texts bypassing the cache, timing tokenization and the model separately.
+
+        Used to reproduce a slow request in isolation: nothing is served from
+        or written to the cache. The encode time includes the encoder's own
+        tokenization, so tokenize_ms shows what share of it is tokenizer work.
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            Tuple (embedding matrix, stats) where stats has tokenize_ms,
+            encode_ms, token_counts (without truncation) and max_seq_length
+        """
+        start = time.perf_counter()
+        token_counts = [
+            len(ids) for ids in self.model.tokenizer(texts, verbose=False)['input_ids']
+        ]
+        tokenized = time.perf_counter()
+
+        if self.chunking:
+            embeddings = self.encode_chunked(texts)
+        else:
+            embeddings = np.asarray(self.encoder.encode(texts, convert_to_tensor=False), dtype=np.float32)
+        encoded = time.perf_counter()
+
+        return embeddings, {
+            'tokenize_ms': (tokenized - start) * 1000,
+            'encode_ms': (encoded - tokenized) * 1000,
+            'token_counts': token_counts,
+            'max_seq_length': self.model.max_seq_length
+        }
+
+    def split_into_chunks(self, text: str) -> Tuple[List[str], List[int]]:
+        """
+        Split a text into overlapping windows that fit the model's max_seq_length.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Tuple (chunks, token_counts) with one entry per window
+        """
+        tokenizer = self.model.tokenizer
+        # Leave room for the [CLS] and [SEP] tokens the model adds
+        window = max(1, self.model.max_seq_length - 2)
+        step = max(1, window - self.chunk_overlap)
+
+        offsets = tokenizer(
+            text, add_special_tokens=False, return_offsets_mapping=True, verbose=False
+        )['offset_mapping']
+
+        if len(offsets) <= window:
+            return [text], [len(offsets)]
+
+        chunks, token_counts = [], []
+        for start in range(0, len(offsets), step):
+            end = min(start + window, len(offsets))
+            chunks.append(text[offsets[start][0]:offsets[end - 1][1]])
+            token_counts.append(end - start)
+            if end == len(offsets):
+                break
+
+        return chunks, token_counts
+
+    def encode_chunked(
+        self,
+        texts: List[str],
+        batch_size: int = 64,
+        stats: Optional[List[dict]] = None
+    ) -> np.ndarray:
+        """
+        Encode texts of any length by pooling the embeddings of their windows.
+
+        The windows of all texts are encoded together in one batched call.
+
+        Args:
+            texts: List of input texts
+            batch_size: Number of windows the model processes per forward pass
+            stats: Optional list that receives one dict per text with its chunk
+                count, token count and encode time (the batch time apportioned
+                by the text's share of tokens)
+
+        Returns:
+            Embedding matrix of shape (len(texts), dim)
+        """
+        all_chunks, all_counts, owners = [], [], []
+        for doc, text in enumerate(texts):
+            chunks, token_counts = self.split_into_chunks(text)
+            all_chunks.extend(chunks)
+            all_counts.extend(token_counts)
+            owners.extend([doc] * len(chunks))
+
+        start = time.perf_counter()
+        chunk_embeddings = np.asarray(
+            self.encoder.encode(all_chunks, batch_size=batch_size, convert_to_tensor=False),
+            dtype=np.float32
+        ).reshape(len(all_chunks), -1)
+        encode_seconds = time.perf_counter() - start
+
+        owners = np.asarray(owners)
+        counts = np.asarray(all_counts, dtype=np.float32)
+        total_tokens = max(float(counts.sum()), 1.0)
+
+        pooled = np.zeros((len(texts), self.embedding_dim), dtype=np.float32)
+        for doc in range(len(texts)):
+            rows = owners == doc
+            if self.pooling == 'max':
+                pooled[doc] = chunk_embeddings[rows].max(axis=0)
+            elif self.pooling == 'weighted':
+                weights = np.maximum(counts[rows], 1.0)
+                pooled[doc] = weights @ chunk_embeddings[rows] / weights.sum()
+            else:
+                pooled[doc] = chunk_embeddings[rows].mean(axis=0)
+
+            if stats is not None:
+                stats.append({
+                    'chunks': int(rows.sum()),
+                    'tokens': int(counts[rows].sum()),
+                    'encode_seconds': round(encode_seconds * float(counts[rows].sum()) / total_tokens, 6)
+                })
+
+        return normalize_rows(pooled)
+
+    @staticmethod
+    def rank_embeddings(
+        resume_embedding: np.ndarray,
+        job_embeddings: np.ndarray,
+        top_k: Optional[int] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        Rank job embeddings against a resume embedding by cosine similarity.
+
+        Args:
+            resume_embedding: Resume embedding vector of shape (dim,)
+            job_embeddings: Job embedding matrix of shape (n_jobs, dim)
+            top_k: If given, only the best top_k jobs are returned
+
+        Returns:
+            List of tuples (row index, score) sorted by score descending
         """
-        return self.model.encode(text, convert_to_tensor=False)
+        job_embeddings = normalize_rows(job_embeddings)
+        resume_embedding = normalize_rows(resume_embedding.reshape(1, -1))[0]
+
+        # One matrix-vector product scores every job at once
+        scores = job_embeddings @ resume_embedding * 100
+
+        if top_k is not None and top_k <= 0:
+            return []
+
+        if top_k is not None and top_k < len(scores):
+            # Partial selection: O(n) to find the top_k, then sort only those
+            order = np.argpartition(-scores, top_k - 1)[:top_k]
+            order = order[np.argsort(-scores[order], kind='stable')]
+        else:
+            order = np.argsort(-scores, kind='stable')
+
+        return [(int(i), float(scores[i])) for i in order]
 
     def batch_calculate_scores(
         self,
         resume_text: str,
-        job_descriptions: List[str]
+        job_descriptions: List[str],
+        top_k: Optional[int] = None,
+        batch_size: int = 64
     ) -> List[Tuple[int, float]]:
         """
         Calculate match scores for one resume against multiple job descriptions.
 
+        All non-empty job descriptions are encoded in one batched call and scored
+        with a single normalized matrix-vector product.
+
         Args:
             resume_text: Resume text
             job_descriptions: List of job description texts
+            top_k: If given, only the best top_k matches are returned
+            batch_size: Number of texts the model processes per forward pass
 
         Returns:
             List of tuples (index, score) sorted by score descending
         """
+        job_indices = [idx for idx, job_text in enumerate(job_descriptions) if job_text.strip()]
+        if not job_indices:
+            return []
+
         resume_embedding = self.get_embedding(resume_text)
+        job_embeddings = self.encode_batch(
+            [job_descriptions[idx] for idx in job_indices],
+            batch_size=batch_size
+        )
 
-        scores = []
-        for idx, job_text in enumerate(job_descriptions):
-            if job_text.strip():
-                job_embedding = self.get_embedding(job_text)
+        ranked = self.rank_embeddings(resume_embedding, job_embeddings, top_k=top_k)
 
-                resume_emb = resume_embedding.reshape(1, -1)
-                job_emb = job_embedding.reshape(1, -1)
+        # Map rows of the job matrix back to positions in job_descriptions
+        return [(job_indices[row], score) for row, score in ranked]
 
-                similarity = cosine_similarity(resume_emb, job_emb)[0][0]
-                match_score = float(similarity * 100)
+    def match_matrix(
+        self,
+        resumes: List[str],
+        jobs: List[str],
+        top_k: int = 10,
+        batch_size: int = 64,
+        resume_block: int = 1024,
+        job_block: int = 8192
+    ) -> Tuple[List[List[Tuple[int, float]]], dict]:
+        """
+        Match every resume against every job and keep each resume's top_k jobs.
 
-                scores.append((idx, match_score))
+        Each side is encoded once in batches; similarities are computed in
+        resume_block x job_block tiles so the full matrix is never materialized.
 
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+        Args:
+            resumes: List of resume texts
+            jobs: List of job description texts
+            top_k: Number of jobs kept per resume
+            batch_size: Number of texts the model processes per forward pass
+            resume_block: Resume rows scored per tile
+            job_block: Job rows scored per tile
+
+        Returns:
+            Tuple (results, stats): results[i] is a list of (job index, score)
+            sorted by score descending for resumes[i] (empty for an empty resume);
+            stats holds sizes, timings and pairs/sec throughput
+        """
+        start = time.perf_counter()
+
+        resume_rows = [i for i, text in enumerate(resumes) if text.strip()]
+        job_rows = [j for j, text in enumerate(jobs) if text.strip()]
+
+        resume_embeddings = normalize_rows(
+            self.encode_batch([resumes[i] for i in resume_rows], batch_size=batch_size)
+        )
+        job_embeddings = normalize_rows(
+            self.encode_batch([jobs[j] for j in job_rows], batch_size=batch_size)
+        )
+        encoded = time.perf_counter()
+
+        indices, scores = blocked_top_k(
+            resume_embeddings, job_embeddings, top_k,
+            query_block=resume_block, corpus_block=job_block
+        )
+        scored = time.perf_counter()
+
+        results: List[List[Tuple[int, float]]] = [[] for _ in resumes]
+        for row, resume_idx in enumerate(resume_rows):
+            results[resume_idx] = [
+                (job_rows[col], float(score) * 100)
+                for col, score in zip(indices[row], scores[row])
+            ]
+
+        pairs = len(resume_rows) * len(job_rows)
+        score_seconds = scored - encoded
+        stats = {
+            'resumes': len(resume_rows),
+            'jobs': len(job_rows),
+            'pairs': pairs,
+            'encode_seconds': round(encoded - start, 4),
+            'score_seconds': round(score_seconds, 4),
+            'total_seconds': round(time.perf_counter() - start, 4),
+            'pairs_per_sec': round(pairs / score_seconds, 1) if score_seconds > 0 else None
+        }
+
+        return results, stats
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize each row of a matrix so dot products become cosine similarities.
+
+    Args:
+        matrix: Array of shape (n, dim)
+
+    Returns:
+        Row-normalized float32 array (all-zero rows are left as zeros)
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
@@ -0,0 +1,340 @@
+"""
+Prometheus-format metrics without external dependencies.
+
+Counters, gauges and histograms live in a MetricsRegistry and are rendered in
+the Prometheus text exposition format for GET /metrics. Recording a value is a
+lock, a dictionary lookup and (for histograms) a bisect over the bucket bounds,
+so instrumenting every request stage costs microseconds.
+
+Values that already exist elsewhere (queue depths, cache counters) are read at
+scrape time through a callback instead of being mirrored on every change.
+Each process keeps its own registry; with several pre-forked workers a scrape
+reaches one worker, whose pid is exported as matcher_process_pid.
+"""
+
+import bisect
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Seconds; spans sub-millisecond cache hits up to multi-second PDF parses
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value the way Prometheus expects."""
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    if math.isnan(value):
+        return 'NaN'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    """Render a label set such as {stage="encode",le="0.1"}."""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class _Metric:
+    """Shared bookkeeping of one metric family."""
+
+    kind = 'untyped'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        function: Optional[Callable[[], float]] = None
+    ):
+        """
+        Args:
+            name: Metric name, e.g. 'matcher_requests_total'
+            documentation: HELP text
+            labelnames: Label names; values are given to inc/set/observe
+            function: Read the (unlabelled) value from this callback at scrape time
+        """
+        if function is not None and labelnames:
+            raise ValueError("Callback metrics cannot have labels")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.function = function
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Sequence[str]) -> Tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(label) for label in labels)
+
+    def value(self, *labels: str) -> float:
+        """Current value for a label set (0 if never recorded)."""
+        if self.function is not None:
+            return float(self.function())
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        """Sample lines of this family."""
+        if self.function is not None:
+            return [f'{self.name} {_format_value(self.value())}']
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f'{self.name}{_labels(self.labelnames, key)} {_format_value(value)}'
+                for key, value in items]
+
+    def render(self) -> List[str]:
+        """HELP, TYPE and sample lines."""
+        return [f'# HELP {self.name} {self.documentation}',
+                f'# TYPE {self.name} {self.kind}'] + self.samples()
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = 'counter'
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        """
+        Increase the counter.
+
+        Args:
+            *labels: Label values in the order of labelnames
+            amount: Non-negative increment
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = 'gauge'
+
+    def set(self, value: float, *labels: str):
+        """Set the gauge to a value."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        """Increase (or with a negative amount, decrease) the gauge."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0):
+        """Decrease the gauge."""
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed buckets."""
+
+    kind = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        """
+        Args:
+            name: Metric name, e.g. 'matcher_stage_seconds'
+            documentation: HELP text
+            labelnames: Label names; values are given to observe
+            buckets: Increasing upper bounds (+Inf is added automatically)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets if not math.isinf(bound)))
+        # label values -> [per-bucket counts (+Inf last), sum]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str):
+        """
+        Record one observation.
+
+        Args:
+            value: Observed value (seconds for latency histograms)
+            *labels: Label values in the order of labelnames
+        """
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def count(self, *labels: str) -> int:
+        """Number of observations for a label set."""
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            return sum(series[0]) if series else 0
+
+    def samples(self) -> List[str]:
+        """Cumulative bucket, sum and count lines of every label set."""
+        with self._lock:
+            items = sorted((key, (list(series[0]), series[1])) for key, series in self._series.items())
+
+        lines = []
+        bounds = [_format_value(bound) for bound in self.buckets] + ['+Inf']
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                le = 'le="' + bound + '"'
+                lines.append(f'{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}')
+            lines.append(f'{self.name}_sum{_labels(self.labelnames, key)} {_format_value(total)}')
+            lines.append(f'{self.name}_count{_labels(self.labelnames, key)} {cumulative}')
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Named collection of metrics rendered together.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                function: Optional[Callable[[], float]] = None) -> Counter:
+        """Create and register a counter."""
+        return self._register(Counter(name, documentation, labelnames, function))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+              function: Optional[Callable[[], float]] = None) -> Gauge:
+        """Create and register a gauge."""
+        return self._register(Gauge(name, documentation, labelnames, function))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Create and register a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Look up a registered metric by name."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            Text for a GET /metrics response body
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines: List[str] = []
+        for metric in metrics:
+            try:
+                lines.extend(metric.render())
+            except Exception:
+                # A failing callback must not break the whole scrape
+                continue
+        return '\n'.join(lines) + '\n'
+
+
+# Content type of the text exposition format
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def observe_timings(histogram: Histogram, timings: Iterable[Tuple[str, float]]):
+    """
+    Record stage durations given in milliseconds into a histogram labelled by stage.
+
+    Args:
+        histogram: Histogram with a single 'stage' label, in seconds
+        timings: Pairs (stage name, duration in ms), e.g. a Server-Timing dict's items()
+    """
+    for stage, duration_ms in timings:
+        histogram.observe(duration_ms / 1000.0, stage)
+
+
+class RequestMetricsMiddleware:
+    """
+    ASGI middleware counting HTTP requests, errors and in-flight requests and timing them.
+
+    Requests are labelled by route template (``/resumes/{resume_id}``), not by
+    raw path, so ids in URLs cannot blow up the number of series. Durations
+    run until the response headers are sent, so streamed bodies count their
+    time to first byte.
+    """
+
+    def __init__(
+        self,
+        app,
+        requests: Counter,
+        errors: Counter,
+        duration: Histogram,
+        in_flight: Gauge
+    ):
+        """
+        Args:
+            app: ASGI application to wrap
+            requests: Counter labelled (method, route, status)
+            errors: Counter labelled (route, status) for 4xx/5xx answers
+            duration: Histogram labelled (route) in seconds
+            in_flight: Unlabelled gauge of requests being processed
+        """
+        self.app = app
+        self.requests = requests
+        self.errors = errors
+        self.duration = duration
+        self.in_flight = in_flight
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = {'code': 500}
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start':
+                status['code'] = message['status']
+                status['elapsed'] = time.perf_counter() - start
+            await send(message)
+
+        self.in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.in_flight.dec()
+            route = scope.get('route')
+            route = getattr(route, 'path', None) or 'unmatched'
+            code = status['code']
+            self.requests.inc(scope.get('method', ''), route, str(code))
+            if code >= 400:
+                self.errors.inc(route, str(code))
+            self.duration.observe(status.get('elapsed', time.perf_counter() - start), route)
@@ -0,0 +1,151 @@
+"""
+Self-contained, versioned model bundles for offline deployment.
+
+A bundle is a directory produced by SentenceTransformer.save() with safetensors
+weights, the tokenizer and the pooling/normalization config, plus a
+manifest.json holding the source model name, bundle version and a SHA-256
+checksum of every file. Loading a bundle never contacts the Hugging Face Hub,
+and safetensors weights are memory-mapped instead of copied into RAM.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from typing import Optional
+
+
+BUNDLE_FORMAT_VERSION = 1
+MANIFEST_FILE = 'manifest.json'
+
+DEFAULT_BUNDLE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models', 'bundles'
+)
+
+
+def _sha256(path: str) -> str:
+    """Hash a file in 1 MB chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_bundle(path: str) -> bool:
+    """
+    Check whether a path is a model bundle directory.
+
+    Args:
+        path: Model name or directory
+
+    Returns:
+        True if the path is a directory with a bundle manifest
+    """
+    return os.path.isfile(os.path.join(path, MANIFEST_FILE))
+
+
+def read_manifest(bundle_dir: str) -> dict:
+    """
+    Read a bundle manifest without verifying checksums.
+
+    Args:
+        bundle_dir: Bundle directory
+
+    Returns:
+        Manifest dictionary
+    """
+    with open(os.path.join(bundle_dir, MANIFEST_FILE), encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    if manifest.get('format_version') != BUNDLE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported bundle format version: {manifest.get('format_version')}")
+
+    return manifest
+
+
+def verify_bundle(bundle_dir: str) -> dict:
+    """
+    Verify that every file listed in a bundle manifest is present and unchanged.
+
+    Args:
+        bundle_dir: Bundle directory
+
+    Returns:
+        Manifest dictionary
+
+    Raises:
+        ValueError: If a file is missing or its checksum does not match
+    """
+    manifest = read_manifest(bundle_dir)
+
+    for relative_path, expected in manifest['files'].items():
+        path = os.path.join(bundle_dir, relative_path)
+        if not os.path.isfile(path):
+            raise ValueError(f"Bundle file missing: {relative_path}")
+        if _sha256(path) != expected['sha256']:
+            raise ValueError(f"Bundle checksum mismatch: {relative_path}")
+
+    return manifest
+
+
+def create_bundle(
+    model_name: str,
+    output_dir: Optional[str] = None,
+    version: Optional[str] = None
+) -> str:
+    """
+    Download a model and write it as a self-contained bundle directory.
+
+    Args:
+        model_name: Name of the sentence transformer model to bundle
+        output_dir: Parent directory of bundles (defaults to models/bundles/)
+        version: Bundle version (defaults to the current UTC date and time)
+
+    Returns:
+        Path of the created bundle directory
+    """
+    from sentence_transformers import SentenceTransformer
+
+    version = version or time.strftime('%Y%m%d%H%M%S', time.gmtime())
+    safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', model_name.strip('/\\'))
+    bundle_dir = os.path.join(output_dir or DEFAULT_BUNDLE_DIR, f"{safe_name}-{version}")
+    if os.path.exists(bundle_dir):
+        raise ValueError(f"Bundle already exists: {bundle_dir}")
+
+    model = SentenceTransformer(model_name)
+
+    # Build in a temporary directory so a failed run never leaves a partial bundle
+    tmp_dir = bundle_dir + '.tmp'
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    model.save(tmp_dir, safe_serialization=True)
+
+    if not any(name.endswith('.safetensors') for _, _, names in os.walk(tmp_dir) for name in names):
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise ValueError(f"Model {model_name} was not saved with safetensors weights")
+
+    files = {}
+    for root, _, names in os.walk(tmp_dir):
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            relative_path = os.path.relpath(path, tmp_dir).replace(os.sep, '/')
+            files[relative_path] = {'sha256': _sha256(path), 'bytes': os.path.getsize(path)}
+
+    get_dimension = getattr(model, 'get_embedding_dimension', None) or \
+        model.get_sentence_embedding_dimension
+    manifest = {
+        'format_version': BUNDLE_FORMAT_VERSION,
+        'model_name': model_name,
+        'bundle_version': version,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'embedding_dimension': get_dimension(),
+        'max_seq_length': model.max_seq_length,
+        'files': dict(sorted(files.items()))
+    }
+    with open(os.path.join(tmp_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    os.replace(tmp_dir, bundle_dir)
+    return bundle_dir
@@ -0,0 +1,287 @@
+"""
+ONNX Runtime inference backend for the resume-job matcher.
+
+Exports the transformer of a SentenceTransformer model to a local ONNX file
+once (optionally with dynamic int8 weight quantization) and reproduces the
+model's pooling and normalization on top of ONNX Runtime outputs.
+"""
+
+import hashlib
+import os
+import re
+from typing import List, Optional, Union
+
+import numpy as np
+
+
+DEFAULT_ONNX_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models', 'onnx'
+)
+
+ONNX_OPSET = 17
+
+# SentenceTransformer modules reproduced on top of the exported transformer
+SUPPORTED_MODULES = ('Transformer', 'Pooling', 'Normalize')
+
+
+def _require_onnxruntime():
+    """Import onnxruntime or explain how to install it."""
+    try:
+        import onnxruntime
+    except ImportError:
+        raise ImportError(
+            "The ONNX backend requires onnxruntime. Install it with: pip install onnxruntime onnx"
+        )
+    return onnxruntime
+
+
+def _check_modules(model):
+    """
+    Make sure every module of a SentenceTransformer can be reproduced.
+
+    Raises:
+        ValueError: If the model has a module other than SUPPORTED_MODULES (e.g. Dense),
+            whose output the ONNX backend would otherwise silently leave out
+    """
+    unsupported = [type(module).__name__ for module in model
+                   if type(module).__name__ not in SUPPORTED_MODULES]
+    if unsupported:
+        raise ValueError(
+            f"Unsupported SentenceTransformer modules for ONNX backend: {', '.join(unsupported)}. "
+            f"Only {', '.join(SUPPORTED_MODULES)} are supported; use the torch backend for this model."
+        )
+
+
+def _pooling_mode(model) -> str:
+    """Read the pooling mode ('mean', 'cls' or 'max') of a SentenceTransformer."""
+    for module in model:
+        if type(module).__name__ != 'Pooling':
+            continue
+
+        mode = getattr(module, 'pooling_mode', None)
+        if isinstance(mode, (list, tuple)) and len(mode) == 1:
+            mode = mode[0]
+        if isinstance(mode, str):
+            return {'mean_tokens': 'mean', 'cls_token': 'cls', 'max_tokens': 'max'}.get(mode, mode)
+
+        # Older sentence-transformers releases use one boolean flag per mode
+        if getattr(module, 'pooling_mode_cls_token', False):
+            return 'cls'
+        if getattr(module, 'pooling_mode_max_tokens', False):
+            return 'max'
+        return 'mean'
+
+    return 'mean'
+
+
+def weights_fingerprint(model) -> str:
+    """
+    Hash the weights and export-relevant settings of a SentenceTransformer.
+
+    Args:
+        model: Loaded SentenceTransformer
+
+    Returns:
+        Hex SHA-256 digest of the state dict, max_seq_length and ONNX opset
+    """
+    digest = hashlib.sha256(f"{model.max_seq_length}|{ONNX_OPSET}".encode('utf-8'))
+    for name, tensor in sorted(model.state_dict().items()):
+        digest.update(name.encode('utf-8'))
+        digest.update(tensor.detach().cpu().contiguous().numpy().tobytes())
+    return digest.hexdigest()
+
+
+class OnnxEncoder:
+    """
+    Drop-in replacement for SentenceTransformer.encode backed by ONNX Runtime.
+    """
+
+    def __init__(
+        self,
+        model,
+        model_name: str,
+        quantize: bool = False,
+        onnx_dir: Optional[str] = None,
+        num_threads: Optional[int] = None
+    ):
+        """
+        Export (if needed) and load the ONNX version of a SentenceTransformer.
+
+        Args:
+            model: Loaded SentenceTransformer (used for export, tokenizer and pooling config)
+            model_name: Model id (name, path or bundle id) used to name the export directory;
+                a hash of the weights is appended so changed weights are re-exported
+            quantize: Use dynamic int8 weight quantization
+            onnx_dir: Directory holding exported models (defaults to models/onnx/)
+            num_threads: ONNX Runtime intra-op threads (None lets ONNX Runtime decide)
+
+        Raises:
+            ValueError: If the model has modules or a pooling mode the backend can't reproduce
+        """
+        _check_modules(model)
+        _require_onnxruntime()  # fail before the slow export if it is missing
+
+        self.pooling = _pooling_mode(model)
+        if self.pooling not in ('mean', 'cls', 'max'):
+            raise ValueError(f"Unsupported pooling mode for ONNX backend: {self.pooling}")
+
+        self.tokenizer = model.tokenizer
+        self.max_seq_length = model.max_seq_length
+        self.normalize = any(type(module).__name__ == 'Normalize' for module in model)
+
+        self.fingerprint = weights_fingerprint(model)
+        safe_name = re.sub(r'[^A-Za-z0-9_.@-]+', '_', model_name.strip('/\\'))
+        self.export_dir = os.path.join(
+            onnx_dir or DEFAULT_ONNX_DIR, f"{safe_name}-{self.fingerprint[:16]}"
+        )
+        self.model_path = self.export(model, quantize=quantize)
+        self.create_session(num_threads)
+
+    def create_session(self, num_threads: Optional[int] = None):
+        """
+        (Re)create the ONNX Runtime session, e.g. in a freshly forked worker process.
+
+        Args:
+            num_threads: ONNX Runtime intra-op threads (None lets ONNX Runtime decide)
+        """
+        onnxruntime = _require_onnxruntime()
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+
+        self.session = onnxruntime.InferenceSession(
+            self.model_path, options, providers=['CPUExecutionProvider']
+        )
+        self.input_names = [node.name for node in self.session.get_inputs()]
+
+    def export(self, model, quantize: bool = False) -> str:
+        """
+        Export the transformer to ONNX once and return the file to load.
+
+        Args:
+            model: Loaded SentenceTransformer
+            quantize: Also write and return a dynamically int8-quantized copy
+
+        Returns:
+            Path of the ONNX model file
+        """
+        fp32_path = os.path.join(self.export_dir, 'model.onnx')
+        int8_path = os.path.join(self.export_dir, 'model.int8.onnx')
+
+        if not os.path.exists(fp32_path):
+            import torch
+
+            os.makedirs(self.export_dir, exist_ok=True)
+            transformer = model[0].auto_model
+
+            class _LastHiddenState(torch.nn.Module):
+                """Call the transformer with keyword inputs and return token embeddings."""
+
+                def __init__(self, inner):
+                    super().__init__()
+                    self.inner = inner
+
+                def forward(self, input_ids, attention_mask, token_type_ids=None):
+                    kwargs = {'input_ids': input_ids, 'attention_mask': attention_mask}
+                    if token_type_ids is not None:
+                        kwargs['token_type_ids'] = token_type_ids
+                    return self.inner(**kwargs).last_hidden_state
+
+            features = self.tokenizer(
+                ['Export example sentence.', 'Another one'], padding=True, return_tensors='pt'
+            )
+            input_names = [name for name in ('input_ids', 'attention_mask', 'token_type_ids')
+                           if name in features]
+
+            # Write to a temporary name so a crash never leaves a half-written model
+            tmp_path = fp32_path + '.tmp'
+            torch.onnx.export(
+                _LastHiddenState(transformer).eval(),
+                tuple(features[name] for name in input_names),
+                tmp_path,
+                input_names=input_names,
+                output_names=['last_hidden_state'],
+                dynamic_axes={name: {0: 'batch', 1: 'sequence'}
+                              for name in input_names + ['last_hidden_state']},
+                opset_version=ONNX_OPSET,
+                dynamo=False
+            )
+            os.replace(tmp_path, fp32_path)
+
+        if not quantize:
+            return fp32_path
+
+        if not os.path.exists(int8_path):
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            tmp_path = int8_path + '.tmp'
+            quantize_dynamic(fp32_path, tmp_path, weight_type=QuantType.QInt8)
+            os.replace(tmp_path, int8_path)
+
+        return int8_path
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        convert_to_tensor: bool = False,
+        **kwargs
+    ) -> np.ndarray:
+        """
+        Encode sentences the same way SentenceTransformer.encode does.
+
+        Args:
+            sentences: A text or a list of texts
+            batch_size: Number of texts per ONNX Runtime call
+            convert_to_tensor: Accepted for compatibility; numpy arrays are always returned
+
+        Returns:
+            Embedding vector for a single text, or matrix for a list of texts
+        """
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+
+        # Batch texts of similar length together to minimize padding
+        order = np.argsort([-len(text) for text in sentences], kind='stable')
+        embeddings = None
+
+        for start in range(0, len(sentences), batch_size):
+            rows = order[start:start + batch_size]
+            features = self.tokenizer(
+                [sentences[i] for i in rows],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors='np'
+            )
+            feeds = {name: features[name].astype(np.int64) for name in self.input_names}
+            token_embeddings = self.session.run(None, feeds)[0]
+
+            pooled = self._pool(token_embeddings, features['attention_mask'])
+            if embeddings is None:
+                embeddings = np.zeros((len(sentences), pooled.shape[1]), dtype=np.float32)
+            embeddings[rows] = pooled
+
+        if embeddings is None:
+            embeddings = np.zeros((0, 0), dtype=np.float32)
+
+        if self.normalize and len(embeddings):
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.maximum(norms, 1e-12)
+
+        return embeddings[0] if single else embeddings
+
+    def _pool(self, token_embeddings: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        """Apply the model's pooling to token embeddings of shape (batch, seq, dim)."""
+        if self.pooling == 'cls':
+            return token_embeddings[:, 0]
+
+        mask = attention_mask[:, :, None].astype(np.float32)
+        if self.pooling == 'max':
+            return np.where(mask > 0, token_embeddings, -1e9).max(axis=1)
+
+        summed = (token_embeddings * mask).sum(axis=1)
+        return summed / np.maximum(mask.sum(axis=1), 1e-9)
@@ -0,0 +1,105 @@
+"""
+Per-request profiling helpers.
+
+A profiled request runs its pipeline in one thread, outside the shared pools
+and caches, so its timings describe that input alone. Stages are timed with
+StageTimer; optionally the whole call runs under cProfile and the stats are
+written to a directory (a .prof file for snakeviz/pstats and a readable .txt
+summary) so hot spots in utils/text_processor.py show up by function name.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class StageTimer:
+    """
+    Collects the duration of named stages in milliseconds.
+    """
+
+    def __init__(self):
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block and add it to stage `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def add(self, name: str, duration_ms: float):
+        """Add a duration measured elsewhere."""
+        self.stages[name] = self.stages.get(name, 0.0) + duration_ms
+
+
+def top_functions(profiler: cProfile.Profile, limit: int = 10) -> List[str]:
+    """
+    Summarize the functions with the most own time.
+
+    Args:
+        profiler: Finished profiler
+        limit: Number of functions to list
+
+    Returns:
+        Lines "file:line(function) tottime_ms ms, ncalls calls"
+    """
+    stats = pstats.Stats(profiler)
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+    lines = []
+    for (filename, line, function), (_, ncalls, tottime, _, _) in rows:
+        location = f"{os.path.basename(filename)}:{line}({function})" if line else function
+        lines.append(f"{location} {tottime * 1000:.2f} ms, {ncalls} calls")
+    return lines
+
+
+def profile_call(
+    fn: Callable,
+    *args,
+    dump_dir: Optional[str] = None,
+    label: str = 'request',
+    **kwargs
+) -> Tuple[Any, List[str], Optional[str]]:
+    """
+    Run fn under cProfile.
+
+    cProfile only sees the calling thread, so fn should do all of its work
+    in this thread (not in pools).
+
+    Args:
+        fn: Function to profile
+        *args: Positional arguments for fn
+        dump_dir: Directory receiving <label>-<id>.prof and .txt (None writes nothing)
+        label: File name prefix, e.g. the endpoint name
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        Tuple (fn's result, top functions by own time, path of the .prof file or None)
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = fn(*args, **kwargs)
+    finally:
+        profiler.disable()
+
+    path = None
+    if dump_dir:
+        os.makedirs(dump_dir, exist_ok=True)
+        base = os.path.join(dump_dir, f"{label}-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}")
+        path = base + '.prof'
+        profiler.dump_stats(path)
+
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats('cumulative').print_stats(40)
+        with open(base + '.txt', 'w', encoding='utf-8') as f:
+            f.write(summary.getvalue())
+
+    return result, top_functions(profiler), path
@@ -0,0 +1,163 @@
+"""
+Response cache for /match.
+
+Clients often resubmit the exact same resume/job pair (page reloads, retries).
+Responses are cached under a hash of everything that determines them: the
+whitespace-normalized texts, the model/embedding namespace and the code
+version. Because the key fully determines the response, it doubles as the
+ETag: a client that sends it back in If-None-Match gets a 304 without any
+recomputation, even after the entry has been evicted.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+def normalize_for_key(text: str) -> str:
+    """Collapse whitespace so formatting-only differences share a cache entry."""
+    return ' '.join(text.split())
+
+
+class ResponseCache:
+    """
+    LRU cache of endpoint responses with a TTL and an entry-count bound.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Largest number of cached responses (0 disables caching)
+            ttl: Seconds a cached response stays valid (None never expires)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.not_modified = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """
+        Hash the parts that determine a response.
+
+        Args:
+            *parts: Strings such as normalized texts, model id and code version
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            encoded = part.encode('utf-8')
+            # Length prefix so ('ab', 'c') and ('a', 'bc') never collide
+            digest.update(len(encoded).to_bytes(8, 'big'))
+            digest.update(encoded)
+        return digest.hexdigest()
+
+    @staticmethod
+    def etag(key: str) -> str:
+        """Strong ETag header value for a cache key."""
+        return f'"{key[:32]}"'
+
+    def matches(self, key: str, if_none_match: Optional[str]) -> bool:
+        """
+        Check an If-None-Match header against a key and count a 304 if it matches.
+
+        Args:
+            key: Cache key of the request
+            if_none_match: Raw If-None-Match header value (may list several tags)
+
+        Returns:
+            True if the client already holds this response ('*' does not count:
+            it would answer 304 to a request the client has never seen)
+        """
+        if not if_none_match:
+            return False
+
+        etag = self.etag(key)
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        if etag in tags or f'W/{etag}' in tags:
+            with self._lock:
+                self.not_modified += 1
+            return True
+        return False
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached response, or None on a miss or after the TTL
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.time() - entry[1] > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, value: Any):
+        """
+        Store a response, evicting the least recently used entries beyond max_entries.
+
+        Args:
+            key: Cache key
+            value: Response to cache (treated as immutable)
+        """
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (value, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove every cached response (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hit/304/miss counts, hit ratio and size
+        """
+        with self._lock:
+            lookups = self.hits + self.not_modified + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'not_modified': self.not_modified,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_ratio': round((self.hits + self.not_modified) / lookups, 4) if lookups else 0.0
+            }
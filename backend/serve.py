@@ -0,0 +1,211 @@
+"""
+Pre-fork multi-worker launcher for the FastAPI backend.
+
+`python backend/main.py` runs a single process. Starting more uvicorn workers
+the usual way makes every worker import torch and load its own copy of the
+model. Here the master loads and warms up ResumeJobMatcher once, freezes the
+garbage collector so later collections don't write to (and un-share) the
+loaded objects, and only then forks the workers. The model weights stay in
+copy-on-write pages shared by all workers.
+
+Each worker gets its own torch intra-op thread count (cores / workers by
+default) so N workers don't run N x cores threads, and reopens the resources
+that must not cross a fork (SQLite cache connection, ONNX Runtime session).
+
+Usage:
+    python backend/serve.py --workers 4 --port 8000
+"""
+
+import argparse
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict, Optional
+
+# Add parent directory to path to import the backend package
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def process_memory(pid: str = 'self') -> Dict[str, Optional[float]]:
+    """
+    Read the memory usage of a process from /proc (Linux only).
+
+    RSS counts shared pages in full for every process; PSS splits them between
+    the processes sharing them, so the PSS of all workers adds up to the real total.
+
+    Args:
+        pid: Process id, or 'self' for the current process
+
+    Returns:
+        Dictionary with pid, rss_mb, pss_mb and shared_mb (None where unavailable)
+    """
+    fields = {}
+    try:
+        with open(f'/proc/{pid}/smaps_rollup') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].endswith(':') and parts[1].isdigit():
+                    fields[parts[0][:-1]] = int(parts[1])
+    except OSError:
+        pass
+
+    def mb(*names):
+        if not all(name in fields for name in names):
+            return None
+        return round(sum(fields[name] for name in names) / 1024, 1)
+
+    return {
+        'pid': os.getpid() if pid == 'self' else int(pid),
+        'rss_mb': mb('Rss'),
+        'pss_mb': mb('Pss'),
+        'shared_mb': mb('Shared_Clean', 'Shared_Dirty')
+    }
+
+
+def default_worker_threads(workers: int) -> int:
+    """Split the available cores evenly between workers (at least one thread each)."""
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
+    return max(1, (cores or 1) // workers)
+
+
+def load_in_master():
+    """Load and warm up the matcher once in the master, before any fork."""
+    import gc
+    import torch
+    from backend import main
+
+    # A single thread in the master: no OpenMP pool exists when the workers
+    # fork, and each worker sizes its own pool afterwards
+    torch.set_num_threads(1)
+    main.load_matcher()
+    if main.matcher is None:
+        raise RuntimeError(f"Model failed to load: {main.model_status['error']}")
+    # Shared copy-on-write by the workers like the model
+    main.skill_taxonomy()
+
+    # Move everything allocated so far out of the collector's reach, so
+    # collections in the workers never touch (and copy) these pages
+    gc.collect()
+    gc.freeze()
+    return main
+
+
+def run_worker(sock: socket.socket, threads: int, host: str, port: int, log_level: str):
+    """Body of a forked worker: size thread pools, reopen fork-unsafe state, serve."""
+    import torch
+    import uvicorn
+    from backend import main
+
+    torch.set_num_threads(threads)
+    main.matcher.cache = main.build_cache(main.matcher.cache_namespace)
+    if main.matcher.backend != 'torch':
+        main.matcher.encoder.create_session(num_threads=threads)
+
+    config = uvicorn.Config(main.app, host=host, port=port, log_level=log_level)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def serve(host: str, port: int, workers: int, threads: Optional[int], log_level: str = 'info'):
+    """
+    Load the model, bind the listening socket and supervise forked workers.
+
+    Workers that exit unexpectedly are replaced by a fresh fork of the master,
+    which still holds the loaded model. SIGINT/SIGTERM stop all workers.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind
+        workers: Number of worker processes
+        threads: Torch intra-op threads per worker (None splits the cores evenly)
+        log_level: uvicorn log level
+    """
+    import uvicorn  # noqa: F401 - imported once here instead of in every worker
+
+    # Tokenizers' Rust thread pool is not fork-safe either
+    os.environ.setdefault('TOKENIZERS_PARALLELISM', 'false')
+    threads = threads or default_worker_threads(workers)
+
+    start = time.perf_counter()
+    load_in_master()
+    print(f"Master {os.getpid()} loaded the model in {time.perf_counter() - start:.1f}s "
+          f"({process_memory()['rss_mb']} MB RSS)")
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+
+    children = {}
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            code = 0
+            try:
+                run_worker(sock, threads, host, port, log_level)
+            except BaseException:
+                import traceback
+                traceback.print_exc()
+                code = 1
+            finally:
+                # Never fall back into the master's supervision loop
+                os._exit(code)
+        children[pid] = time.time()
+        print(f"Worker {pid} started ({threads} torch threads)")
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    for _ in range(workers):
+        spawn()
+    print(f"Serving on http://{host}:{port} with {workers} workers")
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+
+        started_at = children.pop(pid, None)
+        if started_at is None or stopping:
+            continue
+
+        print(f"Worker {pid} exited with status {status}; restarting")
+        # Avoid a fork loop when workers die right after starting
+        if time.time() - started_at < 1:
+            time.sleep(1)
+        spawn()
+
+    sock.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-fork multi-worker API server")
+    parser.add_argument('--host', default='0.0.0.0', help='interface to bind')
+    parser.add_argument('--port', type=int, default=8000, help='port to bind')
+    parser.add_argument('--workers', type=int,
+                        default=int(os.getenv('MATCHER_WORKERS', '2')), help='worker processes')
+    parser.add_argument('--torch-threads', type=int,
+                        default=int(os.getenv('MATCHER_TORCH_THREADS', '0')) or None,
+                        help='torch intra-op threads per worker (default: cores / workers)')
+    parser.add_argument('--log-level', default='info', help='uvicorn log level')
+    args = parser.parse_args()
+
+    serve(args.host, args.port, args.workers, args.torch_threads, args.log_level)
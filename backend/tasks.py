@@ -0,0 +1,489 @@
+"""
+SQLite-backed background tasks for bulk work that outlives an HTTP request.
+
+A task is a list of input items plus JSON parameters. Worker threads of a
+TaskRunner claim queued tasks from the database and process their items in
+chunks. After each chunk the results and the new position are committed in
+one transaction; that position is the checkpoint a task resumes from.
+
+Claims are leases: while a worker holds a task, a background thread refreshes
+the task's heartbeat several times per lease (so a long prepare or chunk
+doesn't lose it), and a running task whose heartbeat is older than the lease
+is claimed again, for example after the process was killed. Several processes
+(such as pre-forked workers) can share one database file; SQLite
+serializes the claims, so each task runs in one place at a time.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+TASK_STATUSES = ('queued', 'running', 'completed', 'failed', 'cancelled')
+FINISHED_STATUSES = ('completed', 'failed', 'cancelled')
+
+
+class TaskStore:
+    """
+    Tasks, their input items and their results in SQLite.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Open (or create) the task database.
+
+        Args:
+            db_path: SQLite file path (None keeps tasks in memory; they are
+                then lost on restart and not shared between processes)
+        """
+        if db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.db_path = db_path
+        # Writers from other processes hold the lock briefly; wait instead of failing
+        self._db = sqlite3.connect(db_path or ':memory:', check_same_thread=False, timeout=30)
+        self._lock = threading.Lock()
+
+        if db_path:
+            self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.executescript(
+            'CREATE TABLE IF NOT EXISTS tasks ('
+            ' id TEXT PRIMARY KEY,'
+            ' kind TEXT NOT NULL,'
+            ' status TEXT NOT NULL,'
+            ' params TEXT NOT NULL,'
+            ' total INTEGER NOT NULL,'
+            ' done INTEGER NOT NULL DEFAULT 0,'
+            ' created_at REAL NOT NULL,'
+            ' started_at REAL,'
+            ' finished_at REAL,'
+            ' run_started_at REAL,'
+            ' run_start_done INTEGER,'
+            ' heartbeat REAL,'
+            ' owner TEXT,'
+            ' cancel_requested INTEGER NOT NULL DEFAULT 0,'
+            ' error TEXT);'
+            'CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, created_at);'
+            'CREATE TABLE IF NOT EXISTS task_items ('
+            ' task_id TEXT NOT NULL,'
+            ' position INTEGER NOT NULL,'
+            ' item TEXT NOT NULL,'
+            ' PRIMARY KEY (task_id, position));'
+            'CREATE TABLE IF NOT EXISTS task_results ('
+            ' task_id TEXT NOT NULL,'
+            ' position INTEGER NOT NULL,'
+            ' result TEXT NOT NULL,'
+            ' PRIMARY KEY (task_id, position));'
+        )
+        self._db.commit()
+
+    def submit(self, kind: str, items: List[str], params: dict) -> str:
+        """
+        Queue a task.
+
+        Args:
+            kind: Handler name, e.g. 'bulk_match'
+            items: Input items, processed in order and checkpointed in chunks
+            params: JSON-serializable parameters shared by all items
+
+        Returns:
+            Task id
+        """
+        task_id = uuid.uuid4().hex
+        with self._lock, self._db:
+            self._db.execute(
+                'INSERT INTO tasks (id, kind, status, params, total, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (task_id, kind, 'queued', json.dumps(params), len(items), time.time())
+            )
+            self._db.executemany(
+                'INSERT INTO task_items (task_id, position, item) VALUES (?, ?, ?)',
+                ((task_id, position, item) for position, item in enumerate(items))
+            )
+        return task_id
+
+    def get(self, task_id: str) -> Optional[dict]:
+        """
+        Get a task's state and progress.
+
+        Args:
+            task_id: Task id
+
+        Returns:
+            Dictionary with id, kind, status, params, total, done, progress,
+            throughput (items/sec of the current or last run), eta_seconds,
+            timestamps and error, or None if there is no such task
+        """
+        with self._lock:
+            row = self._db.execute(
+                'SELECT id, kind, status, params, total, done, created_at, started_at, finished_at,'
+                ' run_started_at, run_start_done, heartbeat, owner, cancel_requested, error '
+                'FROM tasks WHERE id = ?',
+                (task_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        task = dict(zip(
+            ('id', 'kind', 'status', 'params', 'total', 'done', 'created_at', 'started_at',
+             'finished_at', 'run_started_at', 'run_start_done', 'heartbeat', 'owner',
+             'cancel_requested', 'error'),
+            row
+        ))
+        task['params'] = json.loads(task['params'])
+        task['cancel_requested'] = bool(task['cancel_requested'])
+
+        throughput = None
+        if task['run_started_at'] is not None:
+            end = task['finished_at'] or task['heartbeat'] or time.time()
+            elapsed = end - task['run_started_at']
+            processed = task['done'] - (task['run_start_done'] or 0)
+            if elapsed > 0 and processed > 0:
+                throughput = processed / elapsed
+
+        remaining = task['total'] - task['done']
+        task['progress'] = round(task['done'] / task['total'], 4) if task['total'] else 1.0
+        task['throughput'] = round(throughput, 2) if throughput else None
+        task['eta_seconds'] = (
+            round(remaining / throughput, 1)
+            if throughput and task['status'] in ('queued', 'running') else None
+        )
+        return task
+
+    def claim(self, owner: str, lease_seconds: float, kinds: Tuple[str, ...]) -> Optional[dict]:
+        """
+        Take the oldest queued task, or a running task whose lease expired.
+
+        Args:
+            owner: Identifier of the claiming worker
+            lease_seconds: Heartbeat age after which a running task is reclaimed
+            kinds: Task kinds this worker can process
+
+        Returns:
+            The claimed task (see get), or None if there is nothing to do
+        """
+        now = time.time()
+        placeholders = ','.join('?' * len(kinds))
+        with self._lock, self._db:
+            row = self._db.execute(
+                f'SELECT id FROM tasks WHERE kind IN ({placeholders}) AND '
+                f'(status = ? OR (status = ? AND heartbeat < ?)) '
+                f'ORDER BY created_at LIMIT 1',
+                (*kinds, 'queued', 'running', now - lease_seconds)
+            ).fetchone()
+            if row is None:
+                return None
+
+            # The status check makes the claim atomic across processes
+            claimed = self._db.execute(
+                'UPDATE tasks SET status = ?, owner = ?, heartbeat = ?, run_started_at = ?,'
+                ' run_start_done = done, started_at = COALESCE(started_at, ?) '
+                'WHERE id = ? AND (status = ? OR (status = ? AND heartbeat < ?))',
+                ('running', owner, now, now, now, row[0], 'queued', 'running', now - lease_seconds)
+            ).rowcount
+        return self.get(row[0]) if claimed else None
+
+    def items(self, task_id: str, start: int, end: int) -> List[str]:
+        """Input items at positions start..end-1."""
+        with self._lock:
+            rows = self._db.execute(
+                'SELECT item FROM task_items WHERE task_id = ? AND position >= ? AND position < ? '
+                'ORDER BY position',
+                (task_id, start, end)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def heartbeat(self, task_id: str, owner: str) -> bool:
+        """
+        Refresh the lease on a running task.
+
+        Args:
+            task_id: Task id
+            owner: Worker holding the lease
+
+        Returns:
+            False if the lease was lost (or the task is no longer running)
+        """
+        with self._lock, self._db:
+            return bool(self._db.execute(
+                'UPDATE tasks SET heartbeat = ? WHERE id = ? AND owner = ? AND status = ?',
+                (time.time(), task_id, owner, 'running')
+            ).rowcount)
+
+    def checkpoint(self, task_id: str, owner: str, start: int, results: List[Any]) -> bool:
+        """
+        Store the results of one chunk and advance the task's position.
+
+        Args:
+            task_id: Task id
+            owner: Worker holding the lease
+            start: Position of the chunk's first item
+            results: JSON-serializable result of each item in the chunk
+
+        Returns:
+            False if the lease was lost or cancellation was requested, so the
+            worker should stop; the chunk is only stored if the lease is held
+        """
+        with self._lock, self._db:
+            held = self._db.execute(
+                'UPDATE tasks SET done = ?, heartbeat = ? WHERE id = ? AND owner = ? AND status = ?',
+                (start + len(results), time.time(), task_id, owner, 'running')
+            ).rowcount
+            if not held:
+                return False
+            self._db.executemany(
+                'INSERT OR REPLACE INTO task_results (task_id, position, result) VALUES (?, ?, ?)',
+                ((task_id, start + offset, json.dumps(result)) for offset, result in enumerate(results))
+            )
+            cancel = self._db.execute(
+                'SELECT cancel_requested FROM tasks WHERE id = ?', (task_id,)
+            ).fetchone()[0]
+        return not cancel
+
+    def finish(self, task_id: str, owner: str, status: str, error: Optional[str] = None):
+        """
+        Mark a task as completed, failed or cancelled.
+
+        Args:
+            task_id: Task id
+            owner: Worker holding the lease (a lost lease leaves the task alone)
+            status: One of FINISHED_STATUSES
+            error: Error message of a failed task
+        """
+        if status not in FINISHED_STATUSES:
+            raise ValueError(f"Not a final status: {status}. Use one of {FINISHED_STATUSES}.")
+        with self._lock, self._db:
+            self._db.execute(
+                'UPDATE tasks SET status = ?, error = ?, finished_at = ?, heartbeat = ? '
+                'WHERE id = ? AND owner = ?',
+                (status, error, time.time(), time.time(), task_id, owner)
+            )
+
+    def release(self, task_id: str, owner: str):
+        """Give a running task back to the queue (on shutdown) so it resumes from its checkpoint."""
+        with self._lock, self._db:
+            self._db.execute(
+                'UPDATE tasks SET status = ?, owner = NULL WHERE id = ? AND owner = ? AND status = ?',
+                ('queued', task_id, owner, 'running')
+            )
+
+    def cancel(self, task_id: str) -> Optional[str]:
+        """
+        Cancel a task: queued tasks stop at once, running ones at their next checkpoint.
+
+        Args:
+            task_id: Task id
+
+        Returns:
+            The task's status afterwards, or None if there is no such task
+        """
+        with self._lock, self._db:
+            self._db.execute(
+                'UPDATE tasks SET status = ?, finished_at = ? WHERE id = ? AND status = ?',
+                ('cancelled', time.time(), task_id, 'queued')
+            )
+            self._db.execute(
+                'UPDATE tasks SET cancel_requested = 1 WHERE id = ? AND status = ?',
+                (task_id, 'running')
+            )
+            row = self._db.execute('SELECT status FROM tasks WHERE id = ?', (task_id,)).fetchone()
+        return row[0] if row else None
+
+    def results(self, task_id: str, batch_size: int = 500) -> Iterator[Tuple[int, Any]]:
+        """
+        Iterate over stored results in item order, reading batch_size rows at a time.
+
+        Yields:
+            Tuples (position, result)
+        """
+        position = 0
+        while True:
+            with self._lock:
+                rows = self._db.execute(
+                    'SELECT position, result FROM task_results WHERE task_id = ? AND position >= ? '
+                    'ORDER BY position LIMIT ?',
+                    (task_id, position, batch_size)
+                ).fetchall()
+            for row_position, result in rows:
+                yield row_position, json.loads(result)
+            if len(rows) < batch_size:
+                return
+            position = rows[-1][0] + 1
+
+    def counts(self) -> Dict[str, int]:
+        """Number of tasks per status."""
+        with self._lock:
+            rows = self._db.execute('SELECT status, COUNT(*) FROM tasks GROUP BY status').fetchall()
+        counts = {status: 0 for status in TASK_STATUSES}
+        counts.update(dict(rows))
+        return counts
+
+
+class TaskRunner:
+    """
+    Worker threads that claim tasks from a TaskStore and process them in chunks.
+
+    Each task kind has a handler pair: prepare(task) builds state shared by
+    all chunks (run again when a task resumes), and process(task, state,
+    items, start) returns one result per item.
+    """
+
+    def __init__(
+        self,
+        store: TaskStore,
+        handlers: Dict[str, Tuple[Callable, Callable]],
+        workers: int = 1,
+        chunk_size: int = 256,
+        lease_seconds: float = 120.0,
+        poll_interval: float = 1.0,
+        ready: Optional[Callable[[], bool]] = None
+    ):
+        """
+        Args:
+            store: Task database
+            handlers: kind -> (prepare, process)
+            workers: Number of worker threads
+            chunk_size: Items processed between checkpoints
+            lease_seconds: Heartbeat age after which another worker may take a task over;
+                a held task's heartbeat is refreshed every lease_seconds / 3
+            poll_interval: Seconds between looks at an empty queue
+            ready: Tasks are only claimed while this returns True (e.g. model loaded)
+        """
+        self.store = store
+        self.handlers = handlers
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.ready = ready or (lambda: True)
+
+        self.owner = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.items_processed = 0
+        self._stats_lock = threading.Lock()
+
+    def start(self):
+        """Start the worker threads."""
+        self._stop.clear()
+        for number in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"task-worker-{number}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 30.0):
+        """
+        Stop after the current chunks; running tasks go back to the queue.
+
+        Args:
+            timeout: Seconds to wait for each worker thread
+        """
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _work(self):
+        while not self._stop.is_set():
+            task = self.store.claim(self.owner, self.lease_seconds, tuple(self.handlers)) \
+                if self.ready() else None
+            if task is None:
+                self._stop.wait(self.poll_interval)
+                continue
+            self.run_task(task)
+
+    def _keep_lease(self, task_id: str) -> threading.Event:
+        """
+        Refresh a task's heartbeat in the background until the returned event is set.
+
+        prepare() and a single chunk may take longer than the lease, so the
+        heartbeat can't wait for the next checkpoint.
+        """
+        released = threading.Event()
+
+        def beat():
+            while not released.wait(self.lease_seconds / 3):
+                if not self.store.heartbeat(task_id, self.owner):
+                    return
+
+        threading.Thread(target=beat, name=f"task-lease-{task_id[:8]}", daemon=True).start()
+        return released
+
+    def run_task(self, task: dict):
+        """
+        Process a claimed task from its checkpoint until it finishes, is cancelled or the runner stops.
+
+        Args:
+            task: Task returned by TaskStore.claim
+        """
+        task_id = task['id']
+        prepare, process = self.handlers[task['kind']]
+        position = task['done']
+        if task['cancel_requested']:
+            # Cancelled while its previous worker was gone
+            self.store.finish(task_id, self.owner, 'cancelled')
+            return
+        released = self._keep_lease(task_id)
+        try:
+            state = prepare(task)
+            while position < task['total']:
+                if self._stop.is_set():
+                    self.store.release(task_id, self.owner)
+                    return
+
+                items = self.store.items(task_id, position, position + self.chunk_size)
+                results = process(task, state, items, position)
+                if len(results) != len(items):
+                    raise RuntimeError(f"Handler returned {len(results)} results for {len(items)} items")
+
+                keep_going = self.store.checkpoint(task_id, self.owner, position, results)
+                position += len(items)
+                with self._stats_lock:
+                    self.items_processed += len(items)
+                if not keep_going:
+                    current = self.store.get(task_id)
+                    if current['cancel_requested'] and current['owner'] == self.owner:
+                        self.store.finish(task_id, self.owner, 'cancelled')
+                        with self._stats_lock:
+                            self.cancelled += 1
+                    return
+
+            self.store.finish(task_id, self.owner, 'completed')
+            with self._stats_lock:
+                self.completed += 1
+        except Exception as e:
+            traceback.print_exc()
+            self.store.finish(task_id, self.owner, 'failed', error=str(e))
+            with self._stats_lock:
+                self.failed += 1
+        finally:
+            released.set()
+
+    def stats(self) -> dict:
+        """
+        Get runner counters and the number of tasks per status.
+
+        Returns:
+            Dictionary of runner settings, counters and task counts
+        """
+        with self._stats_lock:
+            runner = {
+                'workers': self.workers,
+                'chunk_size': self.chunk_size,
+                'running': any(thread.is_alive() for thread in self._threads),
+                'completed': self.completed,
+                'failed': self.failed,
+                'cancelled': self.cancelled,
+                'items_processed': self.items_processed
+            }
+        runner['tasks'] = self.store.counts()
+        return runner
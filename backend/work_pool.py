@@ -0,0 +1,184 @@
+"""
+Bounded executor for CPU-bound request work.
+
+PDF parsing, NLTK tokenization and keyword analysis are blocking calls. Running
+them inside async endpoints stalls the event loop, so every other connection
+(health probes included) waits behind one slow document. WorkPool runs them in
+a thread or process pool instead and admits only a bounded number of pending
+calls, so overload turns into fast rejections rather than an unbounded backlog.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+
+POOL_KINDS = ('thread', 'process')
+
+
+class PoolBusyError(Exception):
+    """Raised when the work pool already holds max_pending calls."""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _timed_call(fn: Callable, args: tuple, kwargs: dict) -> Tuple[Any, float, float]:
+    """
+    Run fn in the worker and time it there.
+
+    Returns wall-clock start time (comparable across processes) and compute
+    seconds alongside the result, so queue wait and compute can be separated.
+    """
+    started_at = time.time()
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, started_at, time.perf_counter() - start
+
+
+class WorkPool:
+    """
+    Thread or process pool with bounded admission and queue/compute timing.
+    """
+
+    def __init__(
+        self,
+        kind: str = 'thread',
+        max_workers: Optional[int] = None,
+        max_pending: int = 64,
+        retry_after: int = 1
+    ):
+        """
+        Initialize the pool (workers start lazily on first use).
+
+        Args:
+            kind: 'thread' or 'process' (processes sidestep the GIL for pure-Python work)
+            max_workers: Number of workers (None lets concurrent.futures decide)
+            max_pending: Calls allowed to be queued or running before new ones are rejected
+            retry_after: Seconds clients are told to wait when the pool is full
+        """
+        if kind not in POOL_KINDS:
+            raise ValueError(f"Unknown pool kind: {kind}. Use one of {POOL_KINDS}.")
+
+        self.kind = kind
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self.pending = 0
+
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.queue_wait_seconds = 0.0
+        self.compute_seconds = 0.0
+        self.max_queue_wait = 0.0
+
+    @property
+    def executor(self) -> Executor:
+        """The underlying executor, created on first use."""
+        with self._lock:
+            if self._executor is None:
+                if self.kind == 'process':
+                    self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix='work-pool'
+                    )
+            return self._executor
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking function in the pool and wait for its result.
+
+        Args:
+            fn: Function to call (module-level and picklable for process pools)
+            *args: Positional arguments of fn
+            **kwargs: Keyword arguments of fn
+
+        Returns:
+            Return value of fn
+
+        Raises:
+            PoolBusyError: If max_pending calls are already queued or running
+        """
+        result, _ = await self.run_timed(fn, *args, **kwargs)
+        return result
+
+    async def run_timed(self, fn: Callable, *args, **kwargs) -> Tuple[Any, dict]:
+        """
+        Like run(), but also return this call's timing.
+
+        Returns:
+            Tuple (result, timing) where timing holds queue_ms and compute_ms
+
+        Raises:
+            PoolBusyError: If max_pending calls are already queued or running
+        """
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise PoolBusyError("Work pool is full", retry_after=self.retry_after)
+            self.pending += 1
+
+        submitted_at = time.time()
+        try:
+            call = functools.partial(_timed_call, fn, args, kwargs)
+            result, started_at, compute = await asyncio.get_running_loop().run_in_executor(
+                self.executor, call
+            )
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+        queue_wait = max(0.0, started_at - submitted_at)
+        with self._lock:
+            self.completed += 1
+            self.queue_wait_seconds += queue_wait
+            self.compute_seconds += compute
+            self.max_queue_wait = max(self.max_queue_wait, queue_wait)
+
+        return result, {
+            'queue_ms': round(queue_wait * 1000, 3),
+            'compute_ms': round(compute * 1000, 3)
+        }
+
+    def shutdown(self):
+        """Stop the workers (pending calls finish first)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def stats(self) -> dict:
+        """
+        Get pool counters.
+
+        Returns:
+            Dictionary with configuration, pending calls and queue/compute timing
+        """
+        with self._lock:
+            return {
+                'kind': self.kind,
+                'max_workers': self.max_workers,
+                'max_pending': self.max_pending,
+                'pending': self.pending,
+                'completed': self.completed,
+                'failed': self.failed,
+                'rejected': self.rejected,
+                'avg_queue_ms': round(self.queue_wait_seconds / self.completed * 1000, 3)
+                if self.completed else 0.0,
+                'max_queue_ms': round(self.max_queue_wait * 1000, 3),
+                'avg_compute_ms': round(self.compute_seconds / self.completed * 1000, 3)
+                if self.completed else 0.0
+            }
@@ -0,0 +1,100 @@
+"""
+Benchmark one-resume-vs-many-jobs scoring.
+
+Compares the old per-job loop (one encode + one sklearn cosine_similarity call
+per job) against the batched ResumeJobMatcher.batch_calculate_scores path.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sklearn.metrics.pairwise import cosine_similarity
+
+from backend.matcher import ResumeJobMatcher
+
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'samples')
+
+
+def load_sample(name):
+    """Read a file from the samples directory."""
+    with open(os.path.join(SAMPLES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def make_jobs(base_job, n_jobs):
+    """Build n_jobs distinct job descriptions from the sample posting."""
+    paragraphs = [p for p in base_job.split('\n\n') if p.strip()]
+    jobs = []
+    for i in range(n_jobs):
+        # Rotate paragraphs so every posting has different text
+        shift = i % len(paragraphs)
+        jobs.append(f"Posting #{i}\n" + "\n\n".join(paragraphs[shift:] + paragraphs[:shift]))
+    return jobs
+
+
+def legacy_batch_scores(matcher, resume_text, job_descriptions):
+    """The original implementation: one encode and one cosine call per job."""
+    resume_embedding = matcher.model.encode(resume_text, convert_to_tensor=False)
+
+    scores = []
+    for idx, job_text in enumerate(job_descriptions):
+        if job_text.strip():
+            job_embedding = matcher.model.encode(job_text, convert_to_tensor=False)
+            similarity = cosine_similarity(
+                resume_embedding.reshape(1, -1), job_embedding.reshape(1, -1)
+            )[0][0]
+            scores.append((idx, float(similarity * 100)))
+
+    return sorted(scores, key=lambda x: x[1], reverse=True)
+
+
+def run(n_jobs, batch_size, top_k):
+    """Run both implementations and print jobs/sec for each."""
+    matcher = ResumeJobMatcher()
+    resume = load_sample('sample_resume.txt')
+    jobs = make_jobs(load_sample('sample_job.txt'), n_jobs)
+
+    # Warm up both code paths so model initialisation is not timed
+    legacy_batch_scores(matcher, resume, jobs[:4])
+    matcher.batch_calculate_scores(resume, jobs[:4])
+
+    start = time.perf_counter()
+    legacy = legacy_batch_scores(matcher, resume, jobs)
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = matcher.batch_calculate_scores(resume, jobs, batch_size=batch_size)
+    batched_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matcher.batch_calculate_scores(resume, jobs, top_k=top_k, batch_size=batch_size)
+    top_k_seconds = time.perf_counter() - start
+
+    max_drift = max(
+        abs(a - b) for a, b in zip(sorted(s for _, s in legacy), sorted(s for _, s in batched))
+    )
+
+    print("=" * 50)
+    print(f"Jobs scored: {n_jobs} (batch_size={batch_size})")
+    print("-" * 50)
+    print(f"Per-job loop:      {n_jobs / legacy_seconds:10.1f} jobs/sec ({legacy_seconds:.2f}s)")
+    print(f"Batched:           {n_jobs / batched_seconds:10.1f} jobs/sec ({batched_seconds:.2f}s)")
+    print(f"Batched top_k={top_k:<4} {n_jobs / top_k_seconds:10.1f} jobs/sec ({top_k_seconds:.2f}s)")
+    print(f"Speedup:           {legacy_seconds / batched_seconds:10.1f}x")
+    print(f"Max score drift:   {max_drift:10.4f} points")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=1000, help='number of job descriptions')
+    parser.add_argument('--batch-size', type=int, default=64, help='encode batch size')
+    parser.add_argument('--top-k', type=int, default=10, help='top_k for the partial-selection run')
+    args = parser.parse_args()
+
+    run(args.jobs, args.batch_size, args.top_k)
@@ -0,0 +1,72 @@
+"""
+Measure matcher cold-start time: Hugging Face model name vs offline bundle.
+
+Each run starts a fresh Python process, so imports, hub resolution and weight
+loading are all included, exactly as on a container start.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+from backend.matcher import ResumeJobMatcher
+import sentence_transformers  # ML stack import, timed separately from model loading
+imported = time.perf_counter()
+matcher = ResumeJobMatcher({model!r})
+loaded = time.perf_counter()
+matcher.encoder.encode(["warm up"], convert_to_tensor=False)
+ready = time.perf_counter()
+print("RESULT " + json.dumps({{
+    "import": imported - start, "load": loaded - imported,
+    "first_encode": ready - loaded, "total": ready - start
+}}))
+"""
+
+
+def cold_start(model, offline):
+    """Run one cold start in a child process and return its timings."""
+    env = dict(os.environ)
+    if offline:
+        env['HF_HUB_OFFLINE'] = '1'
+
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT.format(root=ROOT_DIR, model=model)],
+        capture_output=True, text=True, env=env, check=True
+    ).stdout
+
+    for line in output.splitlines():
+        if line.startswith('RESULT '):
+            return json.loads(line[len('RESULT '):])
+    raise RuntimeError(f"No timing output from child process:\n{output}")
+
+
+def report(label, runs):
+    """Print median timings of several runs."""
+    median = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+    print(f"{label:<28}{median['import']:>9.2f}{median['load']:>9.2f}"
+          f"{median['first_encode']:>9.2f}{median['total']:>9.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--model', default='all-MiniLM-L6-v2', help='hub model name')
+    parser.add_argument('--bundle', required=True, help='bundle directory from models/download_model.py')
+    parser.add_argument('--runs', type=int, default=3, help='cold starts per mode')
+    args = parser.parse_args()
+
+    print("=" * 64)
+    print(f"Cold start, median of {args.runs} runs (seconds)")
+    print("-" * 64)
+    print(f"{'mode':<28}{'import':>9}{'load':>9}{'encode':>9}{'total':>9}")
+    report(f"hub name ({args.model})", [cold_start(args.model, offline=False) for _ in range(args.runs)])
+    report("offline bundle", [cold_start(args.bundle, offline=True) for _ in range(args.runs)])
+    print("=" * 64)
@@ -0,0 +1,93 @@
+"""
+Benchmark and accuracy check of the ONNX Runtime inference backends.
+
+Compares 'onnx' and 'onnx-int8' against the default 'torch' backend on the
+bundled samples/: embedding drift, match score drift and encode throughput.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from backend.embedding_cache import EmbeddingCache
+from backend.matcher import ResumeJobMatcher, normalize_rows
+
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'samples')
+
+
+def load_sample(name):
+    """Read a file from the samples directory."""
+    with open(os.path.join(SAMPLES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def sample_texts():
+    """Full sample documents plus each of their non-empty paragraphs."""
+    resume = load_sample('sample_resume.txt')
+    job = load_sample('sample_job.txt')
+    paragraphs = [p.strip() for p in (resume + '\n\n' + job).split('\n\n') if p.strip()]
+    return resume, job, paragraphs
+
+
+def throughput(matcher, texts, batch_size, repeats):
+    """Texts encoded per second, bypassing the embedding cache."""
+    matcher.encoder.encode(texts[:batch_size], batch_size=batch_size)  # warm up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        matcher.encoder.encode(texts, batch_size=batch_size)
+    return len(texts) * repeats / (time.perf_counter() - start)
+
+
+def run(model_name, batch_size, repeats, onnx_dir):
+    """Print accuracy and speed of each backend relative to torch."""
+    resume, job, paragraphs = sample_texts()
+    texts = [resume, job] + paragraphs
+
+    results = {}
+    for backend in ('torch', 'onnx', 'onnx-int8'):
+        # Disable the cache so every backend really encodes
+        matcher = ResumeJobMatcher(
+            model_name, backend=backend, onnx_dir=onnx_dir,
+            cache=EmbeddingCache(model_name, max_bytes=0)
+        )
+        embeddings = normalize_rows(matcher.encoder.encode(texts, batch_size=batch_size))
+        results[backend] = {
+            'embeddings': embeddings,
+            'score': matcher.calculate_match_score(resume, job),
+            'section_matrix': matcher.section_similarity_matrix(paragraphs, paragraphs),
+            'texts_per_sec': throughput(matcher, texts, batch_size, repeats)
+        }
+
+    reference = results['torch']
+    print("=" * 78)
+    print(f"Model: {model_name} | texts: {len(texts)} | batch_size: {batch_size}")
+    print("-" * 78)
+    print(f"{'backend':<12}{'texts/sec':>11}{'speedup':>9}{'min cos':>10}"
+          f"{'sample score':>14}{'drift':>9}{'max pair drift':>15}")
+    for backend, result in results.items():
+        cosine = np.sum(result['embeddings'] * reference['embeddings'], axis=1)
+        pair_drift = np.nanmax(np.abs(result['section_matrix'] - reference['section_matrix']))
+        print(f"{backend:<12}{result['texts_per_sec']:>11.1f}"
+              f"{result['texts_per_sec'] / reference['texts_per_sec']:>8.2f}x"
+              f"{cosine.min():>10.5f}{result['score']:>14.2f}"
+              f"{result['score'] - reference['score']:>+9.3f}{pair_drift:>15.3f}")
+    print("=" * 78)
+    print("min cos: lowest cosine similarity between a backend's embedding and torch's")
+    print("drift / max pair drift: match score difference to torch in points (0-100)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--model', default='all-MiniLM-L6-v2', help='model name or path')
+    parser.add_argument('--batch-size', type=int, default=32, help='encode batch size')
+    parser.add_argument('--repeats', type=int, default=5, help='throughput repetitions')
+    parser.add_argument('--onnx-dir', default=None, help='ONNX export directory')
+    args = parser.parse_args()
+
+    run(args.model, args.batch_size, args.repeats, args.onnx_dir)
@@ -0,0 +1,121 @@
+"""
+Benchmark PDF text extraction on a synthetic corpus.
+
+The corpus mixes short text resumes with long portfolios, some of whose
+pages are scanned images without a text layer. It compares the original
+extract_text_from_pdf (every page serially, text built with +=) against the
+streaming extractor with image-page skipping, its page-parallel mode, and
+the page/time budgets that bound the worst case per document.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from io import BytesIO
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from tests.test_pdf_extractor import make_pdf
+from utils.pdf_extractor import extract_pdf
+
+
+SAMPLES_DIR = os.path.join(ROOT_DIR, 'samples')
+
+
+def legacy_extract_text_from_pdf(file_content):
+    """The original implementation: every page, serially, concatenated with +=."""
+    import PyPDF2
+
+    pdf_reader = PyPDF2.PdfReader(BytesIO(file_content))
+    text = ""
+    for page in pdf_reader.pages:
+        text += page.extract_text() + "\n"
+    return text.strip()
+
+
+def make_corpus(documents, long_every, long_pages, scanned_share, seed=0):
+    """
+    Build the corpus: 1-2 page resumes, and every long_every-th document a
+    long_pages portfolio with scanned_share of its pages image-only.
+    """
+    with open(os.path.join(SAMPLES_DIR, 'sample_resume.txt'), encoding='utf-8') as f:
+        lines = [line.encode('latin-1', 'replace').decode('latin-1').replace('(', '[').replace(')', ']')
+                 for line in f.read().splitlines() if line.strip()]
+
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(documents):
+        count = long_pages if long_every and i % long_every == long_every - 1 else rng.randint(1, 2)
+        pages = []
+        for _ in range(count):
+            if count > 2 and rng.random() < scanned_share:
+                pages.append(None)
+            else:
+                # Dense pages: the sample resume's lines, several times over
+                pages.append([lines[j % len(lines)] for j in range(rng.randint(60, 120))])
+        corpus.append(make_pdf(pages))
+    return corpus
+
+
+def time_corpus(fn, corpus):
+    """Total and worst per-document time in milliseconds."""
+    worst = 0.0
+    start = time.perf_counter()
+    for content in corpus:
+        doc_start = time.perf_counter()
+        fn(content)
+        worst = max(worst, (time.perf_counter() - doc_start) * 1000)
+    return (time.perf_counter() - start) * 1000, worst
+
+
+def run(documents, long_every, long_pages, scanned_share, workers, max_pages, time_limit):
+    """Time each mode on the same corpus and check the extracted text agrees."""
+    corpus = make_corpus(documents, long_every, long_pages, scanned_share)
+    pages = sum(extract_pdf(content).pages for content in corpus)
+    size_mb = sum(len(content) for content in corpus) / 1024 / 1024
+
+    # The page-parallel mode's output must match the serial one
+    longest = max(corpus, key=len)
+    assert extract_pdf(longest, workers=workers).text == extract_pdf(longest).text
+
+    modes = [
+        ("legacy serial +=", legacy_extract_text_from_pdf),
+        ("streaming, skip image pages", lambda c: extract_pdf(c)),
+        (f"page-parallel ({workers} workers)", lambda c: extract_pdf(c, workers=workers)),
+        (f"budget {max_pages} pages / {time_limit} s",
+         lambda c: extract_pdf(c, max_pages=max_pages, time_limit=time_limit, workers=workers)),
+    ]
+
+    print("=" * 64)
+    print(f"{documents} PDFs, {pages} pages, {size_mb:.1f} MB; every {long_every}th is "
+          f"{long_pages} pages ({scanned_share:.0%} scanned)")
+    print("-" * 64)
+    print(f"{'mode':<34}{'total ms':>12}{'worst doc ms':>16}")
+    legacy_total = None
+    for name, fn in modes:
+        total, worst = time_corpus(fn, corpus)
+        legacy_total = legacy_total or total
+        print(f"{name:<34}{total:>12.0f}{worst:>16.0f}  ({legacy_total / total:.1f}x)")
+
+    budgeted = extract_pdf(longest, max_pages=max_pages, time_limit=time_limit, workers=workers)
+    print("-" * 64)
+    print(f"Longest document under budget: {budgeted.pages_read} text pages read, "
+          f"{budgeted.pages_skipped} image pages skipped, truncated={budgeted.truncated}")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--documents', type=int, default=60, help='PDFs in the corpus')
+    parser.add_argument('--long-every', type=int, default=10, help='every Nth PDF is a long portfolio')
+    parser.add_argument('--long-pages', type=int, default=40, help='pages of a long portfolio')
+    parser.add_argument('--scanned-share', type=float, default=0.3, help='share of image-only pages in portfolios')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 2, help='page-parallel worker processes')
+    parser.add_argument('--max-pages', type=int, default=20, help='page budget per document')
+    parser.add_argument('--time-limit', type=float, default=0.5, help='time budget per document in seconds')
+    args = parser.parse_args()
+    run(args.documents, args.long_every, args.long_pages, args.scanned_share,
+        args.workers, args.max_pages, args.time_limit)
@@ -0,0 +1,135 @@
+"""
+Benchmark the pre-fork server (backend/serve.py) with different worker counts.
+
+For each worker count the server is started in a child process, /match is
+hammered by concurrent clients for a fixed time, and the memory of every
+worker is read from /proc. RSS counts the shared model weights in every
+worker; PSS splits them between workers, so "total PSS" is the real footprint.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from backend.serve import process_memory
+
+
+SAMPLES_DIR = os.path.join(ROOT_DIR, 'samples')
+
+
+def load_sample(name):
+    """Read a file from the samples directory."""
+    with open(os.path.join(SAMPLES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def wait_ready(url, timeout):
+    """Poll the readiness probe until it answers 200."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(url + '/health/ready', timeout=2) as response:
+                if response.status == 200:
+                    return
+        except (urllib.error.URLError, ConnectionError):
+            pass
+        time.sleep(0.5)
+    raise RuntimeError("Server did not become ready in time")
+
+
+def worker_pids(master_pid):
+    """Child processes of the master, read from /proc."""
+    pids = []
+    for task in os.listdir(f'/proc/{master_pid}/task'):
+        with open(f'/proc/{master_pid}/task/{task}/children') as f:
+            pids.extend(int(pid) for pid in f.read().split())
+    return pids
+
+
+def load_test(url, body, clients, seconds):
+    """Send /match requests from several client threads and count successes."""
+    payload = json.dumps(body).encode('utf-8')
+    deadline = time.time() + seconds
+    counts = {'ok': 0, 'errors': 0}
+    lock = threading.Lock()
+
+    def client():
+        while time.time() < deadline:
+            request = urllib.request.Request(
+                url + '/match', data=payload, headers={'Content-Type': 'application/json'}
+            )
+            try:
+                with urllib.request.urlopen(request, timeout=30) as response:
+                    response.read()
+                key = 'ok'
+            except (urllib.error.URLError, ConnectionError):
+                key = 'errors'
+            with lock:
+                counts[key] += 1
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return counts
+
+
+def run(workers, port, clients, seconds, model):
+    """Start the server with the given worker count, load it and report memory."""
+    env = dict(os.environ, MATCHER_MODEL_NAME=model)
+    # Every request sends the same texts; without this they would all be cache hits
+    env.setdefault('MATCHER_CACHE_MEMORY_MB', '0')
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT_DIR, 'backend', 'serve.py'),
+         '--workers', str(workers), '--port', str(port), '--log-level', 'warning'],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    url = f'http://127.0.0.1:{port}'
+
+    try:
+        wait_ready(url, timeout=300)
+        body = {'resume_text': load_sample('sample_resume.txt'),
+                'job_description': load_sample('sample_job.txt')}
+        load_test(url, body, clients, 2)  # warm up every worker
+        counts = load_test(url, body, clients, seconds)
+
+        memory = [process_memory(pid) for pid in worker_pids(server.pid)]
+        master = process_memory(server.pid)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    rss = [entry['rss_mb'] or 0.0 for entry in memory]
+    pss = [entry['pss_mb'] or 0.0 for entry in memory]
+    print(f"{workers:>8}{counts['ok'] / seconds:>12.1f}{counts['errors']:>8}"
+          f"{max(rss):>16.1f}{sum(pss) + (master['pss_mb'] or 0.0):>14.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', default=f"1,2,{os.cpu_count() or 4}",
+                        help='comma-separated worker counts')
+    parser.add_argument('--clients', type=int, default=16, help='concurrent client threads')
+    parser.add_argument('--seconds', type=float, default=20.0, help='measurement time per run')
+    parser.add_argument('--port', type=int, default=8790, help='port used by the test server')
+    parser.add_argument('--model', default='all-MiniLM-L6-v2', help='model name or bundle directory')
+    args = parser.parse_args()
+
+    print("=" * 58)
+    print(f"Pre-fork serving: {args.clients} clients, {args.seconds:.0f}s per run, "
+          f"{os.cpu_count()} cores")
+    print("-" * 58)
+    print(f"{'workers':>8}{'req/s':>12}{'errors':>8}{'RSS/worker MB':>16}{'total PSS MB':>14}")
+    for workers in sorted({int(n) for n in args.workers.split(',')}):
+        run(workers, args.port, args.clients, args.seconds, args.model)
+    print("=" * 58)
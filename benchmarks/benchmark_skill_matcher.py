@@ -0,0 +1,152 @@
+"""
+Benchmark skill extraction on large documents.
+
+Compares the original extract_skills_keywords (one substring scan of the
+whole text per skill, plus lists of every bigram and trigram) against the
+single-pass token-level Aho–Corasick matcher, on documents of a given size
+built from the sample resume and job posting. Also times compiling large
+synthetic taxonomies against loading their compiled form from the disk cache.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.skill_taxonomy import load_taxonomy
+from utils.text_processor import extract_skills_keywords, find_skills, skill_taxonomy
+
+
+# The hard-coded skill lists the original implementation scanned for
+LEGACY_SKILLS = (
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'php',
+    'swift', 'kotlin', 'go', 'rust', 'scala', 'r', 'matlab', 'sql', 'html',
+    'css', 'bash', 'shell', 'perl',
+    'react', 'angular', 'vue', 'django', 'flask', 'fastapi', 'spring',
+    'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy',
+    'node.js', 'express', 'next.js', 'laravel', 'rails', 'asp.net',
+    'streamlit', 'gradio', 'huggingface', 'transformers',
+    'git', 'docker', 'kubernetes', 'jenkins', 'aws', 'azure', 'gcp',
+    'mongodb', 'postgresql', 'mysql', 'redis', 'elasticsearch', 'kafka',
+    'spark', 'hadoop', 'airflow', 'linux', 'unix', 'agile', 'scrum',
+    'ci/cd', 'devops', 'mlops', 'rest', 'api', 'graphql', 'microservices',
+    'machine learning', 'deep learning', 'neural network', 'nlp',
+    'computer vision', 'data science', 'artificial intelligence',
+    'natural language processing', 'reinforcement learning', 'lstm',
+    'transformer', 'bert', 'gpt', 'llm', 'generative ai'
+)
+
+SAMPLES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'samples')
+
+
+def load_sample(name):
+    """Read a file from the samples directory."""
+    with open(os.path.join(SAMPLES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def make_document(size_kb):
+    """Repeat the sample texts until the document reaches size_kb kilobytes."""
+    base = load_sample('sample_resume.txt') + '\n' + load_sample('sample_job.txt') + '\n'
+    repeats = size_kb * 1024 // len(base) + 1
+    return (base * repeats)[:size_kb * 1024]
+
+
+def legacy_extract_skills_keywords(text):
+    """The original implementation: one `in` scan per skill and n-gram lists."""
+    text_lower = text.lower()
+    skills = set()
+
+    for skill in LEGACY_SKILLS:
+        if skill in text_lower:
+            skills.add(skill)
+
+    words = re.findall(r'\b[a-z][a-z0-9+#\-]*\b', text_lower)
+    bigrams = [f"{words[i]} {words[i+1]}" for i in range(len(words)-1)]
+    trigrams = [f"{words[i]} {words[i+1]} {words[i+2]}" for i in range(len(words)-2)]
+
+    for term in bigrams + trigrams:
+        if any(tech in term for tech in ['machine learning', 'deep learning', 'data science', 'computer vision']):
+            skills.add(term)
+
+    return skills
+
+
+def best_time(fn, text, repeats):
+    """Fastest of several runs, in milliseconds."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(text)
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def synthetic_taxonomy(size):
+    """Default taxonomy plus made-up skills (each with an alias), as taxonomy file entries."""
+    skills = [{'id': skill_id, 'aliases': []} for skill_id in skill_taxonomy().names]
+    skills += [
+        {'id': f"skill{i} tool{i % 97}" if i % 3 == 0 else f"skill{i}", 'aliases': [f"sk{i}"]}
+        for i in range(max(size - len(skills), 0))
+    ]
+    return {'version': f"synthetic-{size}", 'skills': skills}
+
+
+def time_taxonomy_load(taxonomy, cache_dir):
+    """Write a taxonomy file and time compiling it, then loading the compiled form from disk."""
+    path = os.path.join(cache_dir, f"{taxonomy['version']}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(taxonomy, f)
+    start = time.perf_counter()
+    load_taxonomy(path, cache_dir)
+    compile_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    loaded = load_taxonomy(path, cache_dir)
+    cached_ms = (time.perf_counter() - start) * 1000
+    return loaded.matcher, compile_ms, cached_ms
+
+
+def run(size_kb, repeats, taxonomy_sizes):
+    """Time both implementations and compare their outputs."""
+    document = make_document(size_kb)
+
+    legacy_ms = best_time(legacy_extract_skills_keywords, document, repeats)
+    new_ms = best_time(extract_skills_keywords, document, repeats)
+    offsets_ms = best_time(find_skills, document, repeats)
+
+    legacy = legacy_extract_skills_keywords(document)
+    new = extract_skills_keywords(document)
+
+    print("=" * 60)
+    print(f"Skill extraction on a {size_kb} KB document (best of {repeats})")
+    print("-" * 60)
+    print(f"{'legacy substring scans':<34}{legacy_ms:>10.2f} ms")
+    print(f"{'Aho-Corasick skills()':<34}{new_ms:>10.2f} ms  ({legacy_ms / new_ms:.1f}x)")
+    print(f"{'Aho-Corasick find() with offsets':<34}{offsets_ms:>10.2f} ms")
+    print("-" * 60)
+    print(f"Only in legacy output ({len(legacy - new)}): {sorted(legacy - new)[:12]}")
+    print(f"Only in new output ({len(new - legacy)}): {sorted(new - legacy)[:12]}")
+
+    print("-" * 60)
+    print("Cost vs taxonomy size (skills() on the same document)")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for size in taxonomy_sizes:
+            matcher, compile_ms, cached_ms = time_taxonomy_load(synthetic_taxonomy(size), cache_dir)
+            print(f"{size:>8} skills: {best_time(matcher.skills, document, repeats):>8.2f} ms "
+                  f"(compile {compile_ms:.0f} ms, load compiled {cached_ms:.0f} ms)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size-kb', type=int, default=100, help='document size in KB')
+    parser.add_argument('--repeats', type=int, default=5, help='runs per measurement')
+    parser.add_argument('--taxonomy-sizes', default='100,2000,20000',
+                        help='comma-separated taxonomy sizes (skills) for the scaling check')
+    args = parser.parse_args()
+    run(args.size_kb, args.repeats, [int(n) for n in args.taxonomy_sizes.split(',')])
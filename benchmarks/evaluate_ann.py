@@ -0,0 +1,108 @@
+"""
+Recall@k vs latency evaluation of approximate (IVF) job index search.
+
+Ground truth comes from exact scoring with ResumeJobMatcher.rank_embeddings.
+Runs on a saved JobIndex (--index) or on a synthetic clustered corpus.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from backend.job_index import JobIndex
+from backend.matcher import ResumeJobMatcher
+
+
+def synthetic_index(n_jobs, dim, n_clusters, seed):
+    """Build an index of clustered random vectors, similar in shape to job embeddings."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(n_clusters, dim)).astype(np.float32)
+
+    index = JobIndex(dim=dim)
+    for start in range(0, n_jobs, 100000):
+        size = min(100000, n_jobs - start)
+        labels = rng.integers(0, n_clusters, size=size)
+        block = centers[labels] + 0.5 * rng.normal(size=(size, dim)).astype(np.float32)
+        index.add(list(range(start, start + size)), block)
+
+    return index
+
+
+def sample_queries(index, n_queries, seed):
+    """Perturbed index rows stand in for resume embeddings."""
+    rng = np.random.default_rng(seed + 1)
+    rows = np.sort(rng.choice(len(index), n_queries, replace=False))
+    base = np.asarray(index.embeddings[rows], dtype=np.float32)
+    return base + 0.05 * rng.normal(size=base.shape).astype(np.float32)
+
+
+def percentile_ms(latencies, q):
+    """Latency percentile in milliseconds."""
+    return float(np.percentile(latencies, q) * 1000)
+
+
+def evaluate(index, queries, top_k, n_probes):
+    """Print recall@k and latency for exact search and each n_probe setting."""
+    embeddings = np.asarray(index.embeddings, dtype=np.float32)
+
+    ground_truth = []
+    exact_latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        ranked = ResumeJobMatcher.rank_embeddings(query, embeddings, top_k=top_k)
+        exact_latencies.append(time.perf_counter() - start)
+        ground_truth.append({row for row, _ in ranked})
+
+    print("=" * 64)
+    print(f"Index: {len(index)} jobs, dim={index.dim}, "
+          f"lists={len(index._ivf_centroids)}, top_k={top_k}, queries={len(queries)}")
+    print("-" * 64)
+    print(f"{'mode':<16}{'recall@k':>10}{'p50 ms':>12}{'p99 ms':>12}{'qps':>12}")
+    print(f"{'exact':<16}{1.0:>10.3f}{percentile_ms(exact_latencies, 50):>12.2f}"
+          f"{percentile_ms(exact_latencies, 99):>12.2f}{len(queries) / sum(exact_latencies):>12.1f}")
+
+    for n_probe in n_probes:
+        hits = 0
+        latencies = []
+        for query, truth in zip(queries, ground_truth):
+            start = time.perf_counter()
+            rows, _ = index.search_rows(query, top_k=top_k, n_probe=n_probe)
+            latencies.append(time.perf_counter() - start)
+            hits += len(truth & set(rows.tolist()))
+
+        recall = hits / (top_k * len(queries))
+        print(f"{'n_probe=' + str(n_probe):<16}{recall:>10.3f}{percentile_ms(latencies, 50):>12.2f}"
+              f"{percentile_ms(latencies, 99):>12.2f}{len(queries) / sum(latencies):>12.1f}")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--index', help='directory of a saved JobIndex (default: synthetic corpus)')
+    parser.add_argument('--jobs', type=int, default=200000, help='synthetic corpus size')
+    parser.add_argument('--dim', type=int, default=384, help='synthetic embedding dimension')
+    parser.add_argument('--clusters', type=int, default=200, help='synthetic cluster count')
+    parser.add_argument('--lists', type=int, default=None, help='IVF lists (default: sqrt(n))')
+    parser.add_argument('--queries', type=int, default=100, help='number of queries')
+    parser.add_argument('--top-k', type=int, default=10, help='k for recall@k')
+    parser.add_argument('--n-probe', type=int, nargs='+', default=[1, 4, 8, 16, 32, 64],
+                        help='n_probe values to evaluate')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    args = parser.parse_args()
+
+    if args.index:
+        job_index = JobIndex.load(args.index)
+    else:
+        job_index = synthetic_index(args.jobs, args.dim, args.clusters, args.seed)
+
+    if not job_index.is_trained:
+        start = time.perf_counter()
+        job_index.train_ivf(n_lists=args.lists, seed=args.seed)
+        print(f"Trained IVF in {time.perf_counter() - start:.2f}s")
+
+    evaluate(job_index, sample_queries(job_index, args.queries, args.seed), args.top_k, args.n_probe)
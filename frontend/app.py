@@ -927,9 +927,64 @@ def get_match_score_class(score):
         return "score-low"
 
 
-def display_results(result):
-    """Display match results in ultra-professional minimalist format"""
-    score = result['match_score']
+def iter_sse_events(response):
+    """
+    Parse a Server-Sent Events response.
+
+    Args:
+        response: Streaming requests response
+
+    Yields:
+        Tuples (event name, decoded JSON data)
+    """
+    event, data = "message", []
+    for line in response.iter_lines(decode_unicode=True):
+        if line is None:
+            continue
+        if line == "":
+            if data:
+                yield event, json.loads("\n".join(data))
+            event, data = "message", []
+        elif line.startswith("event:"):
+            event = line[len("event:"):].strip()
+        elif line.startswith("data:"):
+            data.append(line[len("data:"):].strip())
+
+
+def stream_match(resume_text, job_description, on_update):
+    """
+    Run a match through /match/stream, reporting partial results as they arrive.
+
+    Args:
+        resume_text: Resume text
+        job_description: Job description text
+        on_update: Called with the result dict collected so far after each event
+
+    Returns:
+        The complete result dict (same fields as /match)
+
+    Raises:
+        RuntimeError: If the backend reports an error
+    """
+    result = {}
+    with requests.post(
+        f"{API_URL}/match/stream",
+        json={"resume_text": resume_text, "job_description": job_description},
+        stream=True,
+        timeout=30
+    ) as response:
+        if response.status_code != 200:
+            raise RuntimeError(f"Error {response.status_code}: {response.text}")
+        for event, data in iter_sse_events(response):
+            if event == "error":
+                raise RuntimeError(data.get("detail", "Unknown error"))
+            result.update(data)
+            on_update(result)
+    return result
+
+
+def display_score(score):
+    """Display the score gauge and progress bar"""
     score_class = get_match_score_class(score)
 
     # Minimalist score display
@@ -947,6 +1002,31 @@ def display_results(result):
         </div>
     """, unsafe_allow_html=True)
 
+
+def display_partial_results(result):
+    """Display the results received so far while the analysis streams in"""
+    if 'match_score' not in result:
+        return
+    display_score(result['match_score'])
+
+    if 'missing_keywords' in result:
+        missing_html = "".join([
+            f"<span class='keyword missing'>{kw}</span>"
+            for kw in result['missing_keywords']
+        ]) or "No critical gaps"
+        st.markdown("<div class='info-card'>", unsafe_allow_html=True)
+        st.markdown("### Skills to Develop")
+        st.markdown(f"<div class='keyword-container'>{missing_html}</div>", unsafe_allow_html=True)
+        st.markdown("</div>", unsafe_allow_html=True)
+
+    st.caption("Analyzing keywords..." if 'resume_keywords' not in result else "Preparing summary...")
+
+
+def display_results(result):
+    """Display match results in ultra-professional minimalist format"""
+    score = result['match_score']
+    display_score(score)
+
     # Metrics row
     matching_skills = set(result.get('resume_keywords', [])) & set(result.get('job_keywords', []))
     total_required = len(result.get('job_keywords', []))
@@ -1366,25 +1446,24 @@ def main():
         elif not job_description or not job_description.strip():
             st.error("Job description required")
         else:
+            # The score arrives first and is shown while keywords are still being analyzed
+            progress = st.empty()
+
+            def show_partial(partial):
+                with progress.container():
+                    display_partial_results(partial)
+
             with st.spinner("Analyzing..."):
                 try:
-                    response = requests.post(
-                        f"{API_URL}/match",
-                        json={
-                            "resume_text": resume_text,
-                            "job_description": job_description
-                        },
-                        timeout=30
-                    )
-
-                    if response.status_code == 200:
-                        result = response.json()
-                        st.success("Analysis Complete")
-                        st.markdown("<br>", unsafe_allow_html=True)
-                        display_results(result)
-                    else:
-                        st.error(f"Error {response.status_code}: {response.text}")
-
+                    result = stream_match(resume_text, job_description, show_partial)
+                    progress.empty()
+                    st.success("Analysis Complete")
+                    st.markdown("<br>", unsafe_allow_html=True)
+                    display_results(result)
+
+                except RuntimeError as e:
+                    progress.empty()
+                    st.error(str(e))
                 except requests.exceptions.ConnectionError:
                     st.error("Cannot connect to backend service")
                 except requests.exceptions.Timeout:
@@ -1,10 +1,16 @@
 """
 Script to download the AI model (Sentence Transformer).
-This will download the model the first time you run it.
+This will download the model the first time you run it and write a
+self-contained, versioned bundle that the app can load fully offline.
 """
 
-from sentence_transformers import SentenceTransformer
+import argparse
 import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.model_bundle import DEFAULT_BUNDLE_DIR, create_bundle, verify_bundle
 
 
 def download_model(model_name='all-MiniLM-L6-v2'):
@@ -14,6 +20,8 @@ def download_model(model_name='all-MiniLM-L6-v2'):
     Args:
         model_name: Name of the model to download (default: all-MiniLM-L6-v2)
     """
+    from sentence_transformers import SentenceTransformer
+
     print(f"Downloading model: {model_name}")
     print("This may take a few minutes on the first run...")
     print("-" * 50)
@@ -25,7 +33,9 @@ def download_model(model_name='all-MiniLM-L6-v2'):
         print("\n✅ Model downloaded successfully!")
         print(f"Model name: {model_name}")
         print(f"Max sequence length: {model.max_seq_length}")
-        print(f"Embedding dimension: {model.get_sentence_embedding_dimension()}")
+        get_dimension = getattr(model, 'get_embedding_dimension', None) or \
+            model.get_sentence_embedding_dimension
+        print(f"Embedding dimension: {get_dimension()}")
 
         # Test the model
         print("\n🧪 Testing model...")
@@ -44,13 +54,73 @@ def download_model(model_name='all-MiniLM-L6-v2'):
         return None
 
 
+def build_bundle(model_name='all-MiniLM-L6-v2', output_dir=None, version=None):
+    """
+    Download the model and write it as an offline bundle.
+
+    Args:
+        model_name: Name of the model to bundle (default: all-MiniLM-L6-v2)
+        output_dir: Parent directory of bundles (default: models/bundles/)
+        version: Bundle version (default: current UTC date and time)
+
+    Returns:
+        Path of the bundle directory, or None on failure
+    """
+    print(f"Building offline bundle for: {model_name}")
+    print("This may take a few minutes on the first run...")
+    print("-" * 50)
+
+    try:
+        bundle_dir = create_bundle(model_name, output_dir=output_dir, version=version)
+        manifest = verify_bundle(bundle_dir)
+
+        total_bytes = sum(entry['bytes'] for entry in manifest['files'].values())
+        print("\n✅ Bundle created and verified!")
+        print(f"Bundle directory: {bundle_dir}")
+        print(f"Bundle version: {manifest['bundle_version']}")
+        print(f"Files: {len(manifest['files'])} ({total_bytes / 1024 / 1024:.1f} MB)")
+        print(f"Embedding dimension: {manifest['embedding_dimension']}")
+
+        print("\n✨ Load it offline with:")
+        print(f"  MATCHER_MODEL_NAME={bundle_dir} python backend/main.py")
+        print(f"  ResumeJobMatcher('{bundle_dir}')")
+
+        return bundle_dir
+
+    except Exception as e:
+        print(f"\n❌ Error building bundle: {str(e)}")
+        print("\nPlease check your internet connection and try again.")
+        return None
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Download the AI model and build an offline bundle")
+    parser.add_argument('--model', default='all-MiniLM-L6-v2', help='model to download')
+    parser.add_argument('--output-dir', default=DEFAULT_BUNDLE_DIR, help='parent directory of bundles')
+    parser.add_argument('--version', default=None, help='bundle version (default: UTC timestamp)')
+    parser.add_argument('--cache-only', action='store_true',
+                        help='only warm the Hugging Face cache, do not build a bundle')
+    parser.add_argument('--verify', metavar='BUNDLE_DIR', help='verify an existing bundle and exit')
+    args = parser.parse_args()
+
+    if args.verify:
+        try:
+            verified = verify_bundle(args.verify)
+        except (OSError, ValueError) as e:
+            print(f"❌ Bundle verification failed: {str(e)}")
+            sys.exit(1)
+        print(f"✅ Bundle OK: {verified['model_name']} version {verified['bundle_version']}")
+        sys.exit(0)
+
     print("=" * 50)
     print("AI Resume-Job Matcher - Model Download")
     print("=" * 50)
     print()
 
-    download_model()
+    if args.cache_only:
+        download_model(args.model)
+    else:
+        build_bundle(args.model, args.output_dir, args.version)
 
     print("\n" + "=" * 50)
     print("You can now run the application!")
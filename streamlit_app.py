@@ -13,7 +13,7 @@ import json
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import utilities
-from utils.text_processor import extract_text_from_pdf, extract_keywords, find_missing_keywords
+from utils.text_processor import AnalyzedDocument, extract_text_from_pdf, extract_keywords, find_missing_keywords
 from backend.matcher import ResumeJobMatcher
 
 # Download NLTK data on first run
@@ -1505,15 +1505,19 @@ def main():
                     # Load the matcher
                     matcher = load_matcher()
 
+                    # Analyze each text once for keywords and skills
+                    resume = AnalyzedDocument(resume_text)
+                    job = AnalyzedDocument(job_description)
+
                     # Calculate match score
-                    match_score = matcher.calculate_match_score(resume_text, job_description)
+                    match_score = matcher.calculate_match_score(resume.text, job.text)
 
                     # Extract keywords
-                    resume_keywords = extract_keywords(resume_text, top_n=20)
-                    job_keywords = extract_keywords(job_description, top_n=20)
+                    resume_keywords = extract_keywords(resume, top_n=20)
+                    job_keywords = extract_keywords(job, top_n=20)
 
                     # Find missing keywords
-                    missing_keywords = find_missing_keywords(resume_text, job_description)
+                    missing_keywords = find_missing_keywords(resume, job)
 
                     # Generate suggestions
                     suggestions = generate_suggestions(match_score, missing_keywords)
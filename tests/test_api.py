@@ -0,0 +1,688 @@
+"""
+Tests for the API health probes and model loading report
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+
+class StubEncoder:
+    """Encoder returning fixed vectors"""
+
+    def encode(self, texts, **kwargs):
+        return np.ones((len(texts), 4), dtype=np.float32)
+
+
+class StubMatcher:
+    """Stands in for ResumeJobMatcher; blocks in __init__ until released"""
+
+    release = threading.Event()
+    fail_with = None
+
+    def __init__(self, *args, **kwargs):
+        StubMatcher.release.wait(10)
+        if StubMatcher.fail_with is not None:
+            raise StubMatcher.fail_with
+        self.cache_namespace = 'stub'
+        self.encoder = StubEncoder()
+
+    def encode_batch(self, texts, batch_size=64):
+        return self.encoder.encode(texts)
+
+    @staticmethod
+    def score_embeddings(resume_embedding, job_embedding):
+        return 80.0
+
+    @staticmethod
+    def score_embeddings_many(embedding, others):
+        return np.full(len(others), 80.0)
+
+    def profile_encode(self, texts):
+        stats = {"tokenize_ms": 0.1, "encode_ms": 1.0,
+                 "token_counts": [len(text.split()) + 2 for text in texts], "max_seq_length": 256}
+        return self.encoder.encode(texts), stats
+
+    @staticmethod
+    def rank_embeddings(embedding, others, top_k=None):
+        return [(row, 80.0) for row in range(len(others))][:top_k]
+
+
+def wait_for_stage(main, stages, timeout=10.0):
+    """Poll the load report until it reaches one of the given stages"""
+    deadline = time.time() + timeout
+    while main.model_status["stage"] not in stages:
+        assert time.time() < deadline, f"stuck at {main.model_status['stage']}"
+        time.sleep(0.01)
+
+
+def run_with_stub(check):
+    """Start the app with ResumeJobMatcher replaced by StubMatcher and run check(main, client)"""
+    from fastapi.testclient import TestClient
+    import backend.main as main
+
+    original = main.ResumeJobMatcher, main.matcher, dict(main.model_status)
+    main.ResumeJobMatcher = StubMatcher
+    main.matcher = None
+    main.model_status.update(stage="not_started", started_at=None, load_seconds=None, error=None)
+    StubMatcher.release.clear()
+
+    try:
+        with TestClient(main.app) as client:
+            check(main, client)
+    finally:
+        StubMatcher.release.set()
+        StubMatcher.fail_with = None
+        main.ResumeJobMatcher, main.matcher = original[0], original[1]
+        main.model_status.clear()
+        main.model_status.update(original[2])
+
+
+def test_probes_while_loading_and_ready():
+    """Test liveness, readiness and progress before and after the model loads"""
+    def check(main, client):
+        wait_for_stage(main, {"loading_model"})
+
+        assert client.get("/health/live").status_code == 200
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json()["model"]["stage"] == "loading_model"
+        assert response.json()["model"]["progress"] == 0.5
+        assert client.post("/match", json={"resume_text": "a", "job_description": "b"}).status_code == 503
+
+        StubMatcher.release.set()
+        wait_for_stage(main, {"ready", "failed"})
+
+        response = client.get("/health/ready")
+        assert response.status_code == 200
+        report = response.json()["model"]
+        assert report["stage"] == "ready"
+        assert report["progress"] == 1.0
+        assert report["load_seconds"] is not None
+        assert client.get("/health").json()["model_loaded"] is True
+
+    try:
+        run_with_stub(check)
+        print("✓ test_probes_while_loading_and_ready passed")
+    except ImportError as e:
+        print(f"✗ test_probes_while_loading_and_ready skipped: {str(e)}")
+
+
+def test_failed_load_reported():
+    """Test that a failed model load keeps readiness at 503 and reports the error"""
+    def check(main, client):
+        StubMatcher.fail_with = OSError("weights not found")
+        StubMatcher.release.set()
+        wait_for_stage(main, {"failed"})
+
+        assert client.get("/health/live").status_code == 200
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        report = response.json()["model"]
+        assert report["stage"] == "failed"
+        assert report["progress"] == 0.0
+        assert "weights not found" in report["error"]
+
+    try:
+        run_with_stub(check)
+        print("✓ test_failed_load_reported passed")
+    except ImportError as e:
+        print(f"✗ test_failed_load_reported skipped: {str(e)}")
+
+
+def test_match_timing_and_backpressure():
+    """Test the Server-Timing breakdown and 429 + Retry-After when the work pool is full"""
+    def check(main, client):
+        StubMatcher.release.set()
+        wait_for_stage(main, {"ready"})
+        body = {"resume_text": "Python developer", "job_description": "Python and Docker engineer"}
+
+        response = client.post("/match", json=body)
+        assert response.status_code == 200
+        assert response.json()["match_score"] == 80.0
+        timing = response.headers["Server-Timing"]
+        assert "analysis_queue;dur=" in timing and "analysis;dur=" in timing and "encode;dur=" in timing
+
+        max_pending = main.work_pool.max_pending
+        main.work_pool.max_pending = 0
+        try:
+            response = client.post("/match", json=dict(body, resume_text="Go developer"))
+        finally:
+            main.work_pool.max_pending = max_pending
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == str(main.RETRY_AFTER_SECONDS)
+        assert client.get("/stats").json()["work_pool"]["rejected"] >= 1
+
+    try:
+        run_with_stub(check)
+        print("✓ test_match_timing_and_backpressure passed")
+    except ImportError as e:
+        print(f"✗ test_match_timing_and_backpressure skipped: {str(e)}")
+
+
+def test_match_etag_and_response_cache():
+    """Test cache hits, 304 on a matching If-None-Match and the hit ratio in /stats"""
+    def check(main, client):
+        StubMatcher.release.set()
+        wait_for_stage(main, {"ready"})
+        main.response_cache.clear()
+        before = client.get("/stats").json()["response_cache"]
+        body = {"resume_text": "Python  developer", "job_description": "Python and Docker engineer"}
+
+        first = client.post("/match", json=body)
+        assert first.status_code == 200 and first.headers["X-Cache"] == "miss"
+        etag = first.headers["ETag"]
+
+        # Whitespace-only differences share the cached response
+        second = client.post("/match", json=dict(body, resume_text="Python developer\n"))
+        assert second.headers["X-Cache"] == "hit" and second.headers["ETag"] == etag
+        assert second.json() == first.json()
+
+        not_modified = client.post("/match", json=body, headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304 and not_modified.content == b""
+
+        other = client.post("/match", json=dict(body, job_description="Java developer"),
+                            headers={"If-None-Match": etag})
+        assert other.status_code == 200 and other.headers["ETag"] != etag
+
+        stats = client.get("/stats").json()["response_cache"]
+        assert stats["hits"] - before["hits"] == 1
+        assert stats["not_modified"] - before["not_modified"] == 1
+        assert stats["misses"] - before["misses"] == 2
+        assert 0 < stats["hit_ratio"] <= 1
+
+    try:
+        run_with_stub(check)
+        print("✓ test_match_etag_and_response_cache passed")
+    except ImportError as e:
+        print(f"✗ test_match_etag_and_response_cache skipped: {str(e)}")
+
+
+def test_match_batch_streams_ndjson():
+    """Test both /match/batch orientations and the NDJSON line format"""
+    import json
+
+    def check(main, client):
+        StubMatcher.release.set()
+        wait_for_stage(main, {"ready"})
+
+        chunk_size = main.STREAM_CHUNK_SIZE
+        main.STREAM_CHUNK_SIZE = 2
+        try:
+            jobs = ["Python and Docker engineer", "", "Java developer", "Python data engineer"]
+            with client.stream("POST", "/match/batch",
+                               json={"resume_text": "Python developer", "job_descriptions": jobs}) as response:
+                assert response.status_code == 200
+                assert response.headers["content-type"].startswith("application/x-ndjson")
+                lines = [json.loads(line) for line in response.iter_lines() if line]
+
+            assert [line["index"] for line in lines] == [0, 1, 2, 3]
+            assert lines[1] == {"index": 1, "error": "Empty text"}
+            assert lines[0]["match_score"] == 80.0
+            assert "docker" in lines[0]["missing_keywords"]
+            assert lines[0]["resume_keywords"] == lines[2]["resume_keywords"]
+
+            response = client.post("/match/batch", json={
+                "job_description": "Python and Docker engineer",
+                "resume_texts": ["Python developer", "Docker expert"]
+            })
+            lines = [json.loads(line) for line in response.text.splitlines()]
+            assert len(lines) == 2
+            assert "docker" in lines[0]["missing_keywords"]
+            assert "docker" not in lines[1]["missing_keywords"]
+        finally:
+            main.STREAM_CHUNK_SIZE = chunk_size
+
+        assert client.post("/match/batch", json={"resume_text": "a"}).status_code == 400
+
+    try:
+        run_with_stub(check)
+        print("✓ test_match_batch_streams_ndjson passed")
+    except ImportError as e:
+        print(f"✗ test_match_batch_streams_ndjson skipped: {str(e)}")
+
+
+def test_match_files_ranks_uploads_and_zip_members():
+    """Test /match-files with plain files, a ZIP archive and per-file errors"""
+    import io
+    import zipfile
+
+    def check(main, client):
+        StubMatcher.release.set()
+        wait_for_stage(main, {"ready"})
+
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr('cvs/docker.txt', 'Python developer with Docker and Kubernetes')
+            zf.writestr('cvs/broken.pdf', b'not a pdf')
+            zf.writestr('cvs/notes.docx', b'binary')
+            zf.writestr('__MACOSX/cvs/._docker.txt', b'metadata')
+
+        response = client.post(
+            "/match-files",
+            data={"job_description": "Python engineer with Docker and Kubernetes"},
+            files=[
+                ("resume_files", ("plain.txt", b"Python developer", "text/plain")),
+                ("resume_files", ("empty.txt", b"   ", "text/plain")),
+                ("resume_files", ("cvs.zip", archive.getvalue(), "application/zip")),
+            ]
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["files"] == 5 and body["failed"] == 3
+
+        results = {result["filename"]: result for result in body["results"]}
+        assert results["plain.txt"]["match_score"] == 80.0
+        assert "docker" in results["plain.txt"]["missing_keywords"]
+        assert results["cvs.zip/cvs/docker.txt"]["missing_keywords"] == []
+        assert results["cvs.zip/cvs/docker.txt"]["extract_ms"] is not None
+        assert "Error extracting text from PDF" in results["cvs.zip/cvs/broken.pdf"]["error"]
+        assert "Unsupported file type" in results["cvs.zip/cvs/notes.docx"]["error"]
+        assert results["empty.txt"]["error"] == "Could not extract text from resume"
+        # Scored files come first, failed files last
+        assert [r["match_score"] is None for r in body["results"]] == [False, False, True, True, True]
+
+    try:
+        run_with_stub(check)
+        print("✓ test_match_files_ranks_uploads_and_zip_members passed")
+    except ImportError as e:
+        print(f"✗ test_match_files_ranks_uploads_and_zip_members skipped: {str(e)}")
+
+
+def test_match_files_busy_pool_gives_up():
+    """Test that a file waiting on a saturated extraction pool fails after EXTRACT_MAX_WAIT"""
+    def check(main, client):
+        StubMatcher.release.set()
+        wait_for_stage(main, {"ready"})
+
+        async def always_busy(*args, **kwargs):
+            raise main.PoolBusyError("busy")
+
+        run_timed, main.extraction_pool.run_timed = main.extraction_pool.run_timed, always_busy
+        try:
+            start = time.time()
+            response = client.post(
+                "/match-files",
+                data={"job_description": "Python engineer"},
+                files=[("resume_files", ("cv.txt", b"Python developer", "text/plain"))]
+            )
+        finally:
+            main.extraction_pool.run_timed = run_timed
+        assert response.status_code == 200 and time.time() - start < 5
+        body = response.json()
+        assert body["failed"] == 1 and body["results"][0]["error"] == "Server busy, please retry shortly"
+
+    try:
+        import backend.main as main
+    except ImportError as e:
+        print(f"✗ test_match_files_busy_pool_gives_up skipped: {str(e)}")
+        return
+
+    original = main.EXTRACT_MAX_WAIT
+    main.EXTRACT_MAX_WAIT = 0.2
+    try:
+        run_with_stub(check)
+        print("✓ test_match_files_busy_pool_gives_up passed")
+    finally:
+        main.EXTRACT_MAX_WAIT = original
+
+
+def test_match_file_pdf_page_budget():
+    """Test that a PDF over the page budget is matched on its first pages"""
+    from tests.test_pdf_extractor import make_pdf
+
+    def check(main, client):
+        StubMatcher.release.set()
+        wait_for_stage(main, {"ready"})
+        main.response_cache.clear()
+        pdf = make_pdf([["Python developer"], None, ["Docker"], ["Kubernetes"]])
+
+        def post():
+            return client.post(
+                "/match-file",
+                data={"job_description": "Python engineer with Docker and Kubernetes"},
+                files={"resume_file": ("cv.pdf", pdf, "application/pdf")}
+            )
+
+        response = post()
+        assert response.status_code == 200
+        assert "X-Extract-Truncated" not in response.headers
+        assert response.json()["missing_keywords"] == []
+
+        main.PDF_MAX_PAGES = 3
+        response = post()
+        assert response.headers["X-Extract-Truncated"] == "page_limit"
+        assert response.json()["missing_keywords"] == ["kubernetes"]
+
+    try:
+        import backend.main as main
+    except ImportError as e:
+        print(f"✗ test_match_file_pdf_page_budget skipped: {str(e)}")
+        return
+
+    original = main.PDF_MAX_PAGES
+    try:
+        run_with_stub(check)
+        print("✓ test_match_file_pdf_page_budget passed")
+    finally:
+        main.PDF_MAX_PAGES = original
+
+
+def test_registered_documents_match_by_id():
+    """Test registering resumes and jobs, matching them by id and ranking"""
+    def check(main, client):
+        StubMatcher.release.set()
+        wait_for_stage(main, {"ready"})
+
+        resume = client.post("/resumes", json={"text": "Python developer", "title": "Ada"}).json()
+        assert resume["kind"] == "resume" and "python" in resume["skills"]
+        jobs = [client.post("/jobs", json={"text": text}).json()["id"]
+                for text in ("Python and Docker engineer", "Java developer")]
+
+        assert client.get(f"/resumes/{resume['id']}").json()["title"] == "Ada"
+        assert client.get(f"/jobs/{resume['id']}").status_code == 404
+
+        match = client.get("/match", params={"resume_id": resume["id"], "job_id": jobs[0]})
+        assert match.status_code == 200
+        assert match.json()["match_score"] == 80.0
+        assert "docker" in match.json()["missing_keywords"]
+        assert "python" not in match.json()["missing_keywords"]
+
+        ranking = client.get(f"/resumes/{resume['id']}/jobs", params={"top_k": 1}).json()
+        assert ranking["candidates"] >= 2 and len(ranking["results"]) == 1
+
+        # Documents embedded by another model are re-encoded before ranking
+        main.document_store.update_embedding(jobs[1], np.zeros(4), "old-model")
+        ranking = client.get(f"/resumes/{resume['id']}/jobs").json()
+        assert jobs[1] in [result["id"] for result in ranking["results"]]
+        assert main.document_store.stale_ids("job", "stub") == []
+
+        # Also with MATCHER_WORK_POOL=process, whose calls must be picklable
+        work_pool = main.work_pool
+        main.work_pool = main.WorkPool(kind="process", max_workers=1)
+        try:
+            main.document_store.update_embedding(jobs[0], np.zeros(4), "old-model")
+            match = client.get("/match", params={"resume_id": resume["id"], "job_id": jobs[0]})
+            assert match.status_code == 200
+        finally:
+            main.work_pool.shutdown()
+            main.work_pool = work_pool
+        assert main.document_store.stale_ids("job", "stub") == []
+
+        assert client.get("/match", params={"resume_id": "nope", "job_id": jobs[0]}).status_code == 404
+        assert client.post("/jobs", json={"text": "  "}).status_code == 400
+
+    try:
+        run_with_stub(check)
+        print("✓ test_registered_documents_match_by_id passed")
+    except ImportError as e:
+        print(f"✗ test_registered_documents_match_by_id skipped: {str(e)}")
+
+
+def test_metrics_endpoint():
+    """Test request counters, stage histograms and gauges on /metrics"""
+    def check(main, client):
+        StubMatcher.release.set()
+        wait_for_stage(main, {"ready"})
+        main.response_cache.clear()
+
+        client.post("/match", json={"resume_text": "Go developer", "job_description": "Rust and Go engineer"})
+        client.post("/match", json={"resume_text": "", "job_description": "x"})
+        client.get("/resumes/missing-id")
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        for stage in ("preprocess", "keywords", "skill_diff", "encode", "analysis_queue"):
+            assert f'matcher_stage_seconds_count{{stage="{stage}"}}' in text, stage
+        assert 'matcher_http_requests_total{method="POST",route="/match",status="200"}' in text
+        assert 'matcher_http_errors_total{route="/match",status="400"}' in text
+        # Routes are labelled by template, not by raw path
+        assert 'route="/resumes/{resume_id}",status="404"' in text
+        assert "matcher_model_loaded 1" in text
+        assert "matcher_http_requests_in_flight 1" in text  # the scrape itself
+        assert "matcher_response_cache_misses_total" in text
+
+    try:
+        run_with_stub(check)
+        print("✓ test_metrics_endpoint passed")
+    except ImportError as e:
+        print(f"✗ test_metrics_endpoint skipped: {str(e)}")
+
+
+def test_profiled_match():
+    """Test the admin-only profile flag on /match and /match-file"""
+    import tempfile
+
+    def check(main, client):
+        StubMatcher.release.set()
+        wait_for_stage(main, {"ready"})
+        body = {"resume_text": "Python developer", "job_description": "Python and Docker engineer"}
+
+        assert client.post("/match", params={"profile": "true"}, json=body).status_code == 403
+        assert "profile" not in client.post("/match", json=body).json()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            main.PROFILING_ENABLED, main.PROFILE_DIR = True, None
+            try:
+                report = client.post("/match", params={"profile": "true"}, json=body).json()["profile"]
+                assert set(report["stages_ms"]) == {"preprocess", "tokenize", "encode", "keywords", "skill_diff"}
+                assert report["tokens"] == {"resume": 4, "job": 6}
+                assert report["characters"]["resume"] == len(body["resume_text"])
+                assert "hotspots" not in report
+
+                main.PROFILE_DIR = tmp
+                response = client.post(
+                    "/match-file", params={"profile": "true"},
+                    data={"job_description": body["job_description"]},
+                    files={"resume_file": ("cv.txt", body["resume_text"].encode(), "text/plain")}
+                )
+                report = response.json()["profile"]
+                assert "extract" in report["stages_ms"]
+                assert report["hotspots"] and os.path.exists(report["profile_path"])
+                assert os.path.exists(report["profile_path"][:-len(".prof")] + ".txt")
+
+                empty = client.post(
+                    "/match-file", params={"profile": "true"}, data={"job_description": "x"},
+                    files={"resume_file": ("cv.txt", b"  ", "text/plain")}
+                )
+                assert empty.status_code == 400
+            finally:
+                main.PROFILING_ENABLED, main.PROFILE_DIR = False, None
+
+    try:
+        run_with_stub(check)
+        print("✓ test_profiled_match passed")
+    except ImportError as e:
+        print(f"✗ test_profiled_match skipped: {str(e)}")
+
+
+def test_bulk_match_task():
+    """Test submitting a background bulk match, polling it and downloading results"""
+    import json
+
+    def check(main, client):
+        StubMatcher.release.set()
+        wait_for_stage(main, {"ready"})
+
+        response = client.post("/tasks/match", json={
+            "resume_texts": ["Python developer", "", "Docker and Python expert"],
+            "job_descriptions": ["Python and Docker engineer", " ", "Java developer"],
+            "top_k": 2
+        })
+        assert response.status_code == 202
+        task = response.json()
+        assert task["total"] == 3
+
+        deadline = time.time() + 10
+        while task["status"] != "completed":
+            assert time.time() < deadline and task["status"] in ("queued", "running"), task
+            time.sleep(0.05)
+            task = client.get(f"/tasks/{task['id']}").json()
+        assert task["done"] == 3 and task["progress"] == 1.0
+
+        lines = [json.loads(line) for line in client.get(f"/tasks/{task['id']}/results").text.splitlines()]
+        assert [line["index"] for line in lines] == [0, 1, 2]
+        assert lines[1]["error"] == "Empty text"
+        matches = {match["job_index"]: match for match in lines[0]["matches"]}
+        assert set(matches) == {0, 2}  # the blank job is skipped
+        assert "docker" in matches[0]["missing_keywords"]
+
+        assert client.post(f"/tasks/{task['id']}/cancel").json()["status"] == "completed"
+        assert client.get("/tasks/missing").status_code == 404
+        assert client.post("/tasks/match", json={"resume_texts": ["a"], "job_descriptions": [""]}).status_code == 400
+        assert client.post("/tasks/match", json={
+            "resume_texts": ["a"], "job_descriptions": ["b"], "top_k": 0
+        }).status_code == 400
+        assert client.get("/stats").json()["tasks"]["tasks"]["completed"] >= 1
+
+    try:
+        run_with_stub(check)
+        print("✓ test_bulk_match_task passed")
+    except ImportError as e:
+        print(f"✗ test_bulk_match_task skipped: {str(e)}")
+
+
+def test_match_stream_sse():
+    """Test the event order and payloads of /match/stream"""
+    import json
+
+    def read_events(client, body):
+        with client.stream("POST", "/match/stream", json=body) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+            text = "".join(response.iter_text())
+        events = []
+        for block in text.strip().split("\n\n"):
+            name, data = block.split("\n")
+            events.append((name[len("event: "):], json.loads(data[len("data: "):])))
+        return events
+
+    def check(main, client):
+        StubMatcher.release.set()
+        wait_for_stage(main, {"ready"})
+        main.response_cache.clear()
+        body = {"resume_text": "Python developer", "job_description": "Python and Docker engineer"}
+
+        events = read_events(client, body)
+        assert [name for name, _ in events] == ["score", "missing_keywords", "keywords", "suggestions"]
+        assert events[0][1] == {"match_score": 80.0}
+        assert "docker" in events[1][1]["missing_keywords"]
+        assert set(events[2][1]) == {"resume_keywords", "job_keywords"}
+
+        # Same payload as /match, which now hits the cache the stream filled
+        match = client.post("/match", json=body)
+        assert match.headers["X-Cache"] == "hit"
+        streamed = {key: value for _, data in events for key, value in data.items()}
+        assert streamed == match.json()
+        assert read_events(client, body) == events
+
+        assert client.post("/match/stream", json={"resume_text": "", "job_description": "x"}).status_code == 400
+
+    try:
+        run_with_stub(check)
+        print("✓ test_match_stream_sse passed")
+    except ImportError as e:
+        print(f"✗ test_match_stream_sse skipped: {str(e)}")
+
+
+def test_skill_taxonomy_reload():
+    """Test /skills and reloading the taxonomy in the running app"""
+    import json
+    import tempfile
+    import utils.text_processor as text_processor
+
+    def check(main, client):
+        StubMatcher.release.set()
+        wait_for_stage(main, {"ready"})
+        main.response_cache.clear()
+        assert client.get("/skills").json()["skills"] > 80
+        body = {"resume_text": "Python developer", "job_description": "Python and k8s engineer"}
+        assert client.post("/match", json=body).json()["missing_keywords"] == ["kubernetes"]
+        resume_id = client.post("/resumes", json={"text": body["resume_text"]}).json()["id"]
+        job_id = client.post("/jobs", json={"text": body["job_description"]}).json()["id"]
+        ids = {"resume_id": resume_id, "job_id": job_id}
+        assert client.get("/match", params=ids).json()["missing_keywords"] == ["kubernetes"]
+
+        with open(text_processor.SKILL_TAXONOMY_PATH, "w", encoding="utf-8") as f:
+            json.dump({"version": "2", "skills": [{"id": "container orchestration", "aliases": ["k8s"]}]}, f)
+        reloaded = client.post("/skills/reload")
+        assert reloaded.status_code == 200
+        assert reloaded.json()["version"] == "2" and client.get("/skills").json()["version"] == "2"
+        # The cached response of the old taxonomy is not reused
+        match = client.post("/match", json=body)
+        assert match.headers["X-Cache"] == "miss"
+        assert match.json()["missing_keywords"] == ["container orchestration"]
+        # Stored documents are re-extracted with the new taxonomy, so both paths agree
+        assert client.get("/match", params=ids).json()["missing_keywords"] == ["container orchestration"]
+        assert client.get(f"/jobs/{job_id}").json()["skills"] == ["container orchestration"]
+        assert main.document_store.get("job", job_id)["taxonomy"] == reloaded.json()["fingerprint"]
+
+        with open(text_processor.SKILL_TAXONOMY_PATH, "w", encoding="utf-8") as f:
+            f.write("{broken")
+        assert client.post("/skills/reload").status_code == 400
+        assert client.get("/skills").json()["version"] == "2"
+
+    original = text_processor.skill_taxonomy(), text_processor.SKILL_TAXONOMY_PATH, text_processor.SKILL_CACHE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        text_processor.SKILL_TAXONOMY_PATH = os.path.join(tmp, "skills.json")
+        text_processor.SKILL_CACHE_DIR = os.path.join(tmp, "compiled")
+        try:
+            run_with_stub(check)
+            print("✓ test_skill_taxonomy_reload passed")
+        except ImportError as e:
+            print(f"✗ test_skill_taxonomy_reload skipped: {str(e)}")
+        finally:
+            text_processor._set_taxonomy(original[0])
+            text_processor.SKILL_TAXONOMY_PATH, text_processor.SKILL_CACHE_DIR = original[1:]
+
+
+def test_model_load_report_progress():
+    """Test progress values of every loading stage"""
+    try:
+        import backend.main as main
+    except ImportError as e:
+        print(f"✗ test_model_load_report_progress skipped: {str(e)}")
+        return
+
+    original = dict(main.model_status)
+    try:
+        expected = {"not_started": 0.0, "importing": 0.25, "loading_model": 0.5,
+                    "warming_up": 0.75, "ready": 1.0, "failed": 0.0}
+        for stage, progress in expected.items():
+            main.model_status.update(stage=stage, started_at=None, load_seconds=None)
+            report = main.model_load_report()
+            assert report["progress"] == progress, stage
+            assert report["load_seconds"] is None
+
+        main.model_status.update(started_at=time.time() - 2, load_seconds=None)
+        assert main.model_load_report()["load_seconds"] >= 2
+    finally:
+        main.model_status.clear()
+        main.model_status.update(original)
+    print("✓ test_model_load_report_progress passed")
+
+
+if __name__ == "__main__":
+    test_probes_while_loading_and_ready()
+    test_failed_load_reported()
+    test_match_timing_and_backpressure()
+    test_match_etag_and_response_cache()
+    test_match_batch_streams_ndjson()
+    test_match_files_ranks_uploads_and_zip_members()
+    test_match_files_busy_pool_gives_up()
+    test_match_file_pdf_page_budget()
+    test_registered_documents_match_by_id()
+    test_metrics_endpoint()
+    test_profiled_match()
+    test_bulk_match_task()
+    test_match_stream_sse()
+    test_skill_taxonomy_reload()
+    test_model_load_report_progress()
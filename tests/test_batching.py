@@ -0,0 +1,139 @@
+"""
+Tests for the micro-batching encode scheduler
+"""
+
+import sys
+import os
+import asyncio
+import threading
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from backend.batching import MicroBatcher, QueueFullError
+
+
+def test_concurrent_texts_share_a_batch():
+    """Test that concurrent requests are flushed together and get their own results"""
+    batch_sizes = []
+
+    def encode(texts):
+        batch_sizes.append(len(texts))
+        return np.array([[len(text)] for text in texts], dtype=np.float32)
+
+    async def run():
+        batcher = MicroBatcher(encode, max_batch_size=8, max_wait_ms=50)
+        batcher.start()
+        results = await asyncio.gather(*(batcher.encode("x" * i) for i in range(1, 21)))
+        await batcher.stop()
+        return results, batcher.stats()
+
+    results, stats = asyncio.run(run())
+
+    assert [int(r[0]) for r in results] == list(range(1, 21))
+    assert batch_sizes == [8, 8, 4]
+    assert stats['batches'] == 3 and stats['flushes_full'] == 2
+    print("✓ test_concurrent_texts_share_a_batch passed")
+
+
+def test_full_queue_rejects():
+    """Test that texts beyond max_queue_size are rejected"""
+    async def run():
+        batcher = MicroBatcher(lambda texts: np.zeros((len(texts), 1)), max_queue_size=1)
+        batcher.start()
+        first = asyncio.ensure_future(batcher.encode("a"))
+        await asyncio.sleep(0)  # 'a' is queued but the flush loop has not run yet
+        try:
+            await batcher.encode("b")
+            rejected = False
+        except QueueFullError:
+            rejected = True
+        await first
+        await batcher.stop()
+        return rejected, batcher.stats()['rejected']
+
+    rejected, count = asyncio.run(run())
+    assert rejected and count == 1
+    print("✓ test_full_queue_rejects passed")
+
+
+def test_encode_many_is_all_or_nothing():
+    """Test that a request whose texts don't all fit queues none of them"""
+    encoded = []
+
+    def encode(texts):
+        encoded.extend(texts)
+        return np.zeros((len(texts), 1))
+
+    async def run():
+        batcher = MicroBatcher(encode, max_queue_size=2)
+        batcher.start()
+        first = asyncio.ensure_future(batcher.encode("a"))
+        await asyncio.sleep(0)  # 'a' takes one of the two slots
+        try:
+            await batcher.encode_many(["resume", "job"])
+            rejected = False
+        except QueueFullError:
+            rejected = True
+        await first
+        await batcher.stop()
+        return rejected
+
+    assert asyncio.run(run())
+    assert encoded == ["a"]
+    print("✓ test_encode_many_is_all_or_nothing passed")
+
+
+def test_short_encode_result_fails_batch():
+    """Test that an encode_fn returning too few rows fails every text instead of hanging"""
+    async def run():
+        batcher = MicroBatcher(lambda texts: np.zeros((1, 1)), max_wait_ms=20)
+        batcher.start()
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.encode("a"), batcher.encode("b"), return_exceptions=True), 5
+        )
+        await batcher.stop()
+        return results
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    print("✓ test_short_encode_result_fails_batch passed")
+
+
+def test_stop_cancels_batch_in_flight():
+    """Test that stop() resolves the futures of a batch still being encoded"""
+    started = threading.Event()
+    release = threading.Event()
+
+    def encode(texts):
+        started.set()
+        release.wait(5)
+        return np.zeros((len(texts), 1))
+
+    async def run():
+        batcher = MicroBatcher(encode, max_wait_ms=1)
+        batcher.start()
+        pending = asyncio.ensure_future(batcher.encode("a"))
+        while not started.is_set():
+            await asyncio.sleep(0.001)
+
+        await batcher.stop()
+        release.set()
+        try:
+            await asyncio.wait_for(pending, 5)
+            return False
+        except asyncio.CancelledError:
+            return True
+
+    assert asyncio.run(run())
+    print("✓ test_stop_cancels_batch_in_flight passed")
+
+
+if __name__ == "__main__":
+    test_concurrent_texts_share_a_batch()
+    test_full_queue_rejects()
+    test_encode_many_is_all_or_nothing()
+    test_short_encode_result_fails_batch()
+    test_stop_cancels_batch_in_flight()
@@ -0,0 +1,124 @@
+"""
+Tests for the registered resume/job store
+"""
+
+import sys
+import os
+import tempfile
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from backend.document_store import DocumentStore
+
+
+def test_add_get_and_persist():
+    """Test storing a document and reading it back after reopening the file"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'docs.db')
+        store = DocumentStore(path)
+        doc_id = store.add('resume', 'Python developer', np.array([1.0, 2.0, 3.0]),
+                           ['python', 'developer'], ['python'], 'model-a', title='Ada')
+
+        reopened = DocumentStore(path)
+        doc = reopened.get('resume', doc_id)
+        assert doc['title'] == 'Ada' and doc['text'] == 'Python developer'
+        assert doc['embedding'].dtype == np.float32
+        assert np.allclose(doc['embedding'], [1.0, 2.0, 3.0])
+        assert doc['keywords'] == ['python', 'developer'] and doc['skills'] == ['python']
+
+        # Ids are scoped by kind
+        assert reopened.get('job', doc_id) is None
+        assert reopened.count('resume') == 1 and reopened.count('job') == 0
+
+    try:
+        store.add('cover_letter', 'x', np.zeros(3), [], [], 'model-a')
+        assert False, "unknown kind accepted"
+    except ValueError:
+        pass
+    print("✓ test_add_get_and_persist passed")
+
+
+def test_matrix_cache_and_stale_namespace():
+    """Test the ranking matrix, its invalidation and namespace filtering"""
+    store = DocumentStore()
+    first = store.add('job', 'a', np.array([3.0, 4.0]), [], [], 'model-a')
+    second = store.add('job', 'b', np.array([0.0, 2.0]), [], [], 'model-a')
+
+    ids, matrix = store.matrix('job', 'model-a')
+    assert ids == [first, second]
+    assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0)
+    assert store.matrix('job', 'model-a')[1] is matrix  # reused until a change
+
+    stale = store.add('job', 'c', np.array([1.0, 0.0]), [], [], 'model-old')
+    assert store.stale_ids('job', 'model-a') == [stale]
+    assert store.matrix('job', 'model-a')[0] == [first, second]
+
+    store.update_embedding(stale, np.array([1.0, 1.0]), 'model-a')
+    assert store.stale_ids('job', 'model-a') == []
+    assert len(store.matrix('job', 'model-a')[0]) == 3
+
+    assert store.delete('job', first) and not store.delete('job', first)
+    assert store.matrix('job', 'model-a')[0] == [second, stale]
+    assert store.titles('job', [second]) == {second: None}
+    print("✓ test_matrix_cache_and_stale_namespace passed")
+
+
+def test_skills_tagged_with_taxonomy():
+    """Test the taxonomy tag of stored skills, including stores created before it existed"""
+    import sqlite3
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'docs.db')
+        old = sqlite3.connect(path)
+        old.execute(
+            'CREATE TABLE documents (id TEXT PRIMARY KEY, kind TEXT NOT NULL, title TEXT,'
+            ' text TEXT NOT NULL, namespace TEXT NOT NULL, dim INTEGER NOT NULL,'
+            ' embedding BLOB NOT NULL, keywords TEXT NOT NULL, skills TEXT NOT NULL,'
+            ' created_at REAL NOT NULL)'
+        )
+        old.execute("INSERT INTO documents VALUES ('old', 'job', NULL, 'K8s', 'model-a', 1, ?, '[]', '[\"K8s\"]', 0)",
+                    (np.zeros(1, dtype=np.float32).tobytes(),))
+        old.commit()
+        old.close()
+
+        store = DocumentStore(path)
+        assert store.get('job', 'old')['taxonomy'] is None
+        store.update_skills('old', ['kubernetes'], 'tax-2')
+        assert store.get('job', 'old')['skills'] == ['kubernetes']
+        assert store.get('job', 'old')['taxonomy'] == 'tax-2'
+
+        new = store.add('job', 'Go', np.zeros(1), [], ['go'], 'model-a', taxonomy='tax-2')
+        assert store.get('job', new)['taxonomy'] == 'tax-2'
+    print("✓ test_skills_tagged_with_taxonomy passed")
+
+
+def test_matrix_sees_other_connections():
+    """Test that a cached matrix picks up documents written through another store on the same file"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'docs.db')
+        worker_a, worker_b = DocumentStore(path), DocumentStore(path)
+
+        first = worker_a.add('job', 'a', np.array([1.0, 0.0]), [], [], 'model-a')
+        assert worker_b.matrix('job', 'model-a')[0] == [first]
+        cached = worker_b.matrix('job', 'model-a')[1]
+        assert worker_b.matrix('job', 'model-a')[1] is cached  # unchanged file: still reused
+
+        second = worker_a.add('job', 'b', np.array([0.0, 1.0]), [], [], 'model-a')
+        assert worker_b.matrix('job', 'model-a')[0] == [first, second]
+
+        worker_a.delete('job', first)
+        assert worker_b.matrix('job', 'model-a')[0] == [second]
+
+        worker_a.update_embedding(second, np.array([2.0, 2.0]), 'model-b')
+        assert worker_b.matrix('job', 'model-a')[0] == []
+    print("✓ test_matrix_sees_other_connections passed")
+
+
+if __name__ == "__main__":
+    test_add_get_and_persist()
+    test_matrix_cache_and_stale_namespace()
+    test_skills_tagged_with_taxonomy()
+    test_matrix_sees_other_connections()
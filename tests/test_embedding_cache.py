@@ -0,0 +1,80 @@
+"""
+Tests for the two-tier embedding cache
+"""
+
+import sys
+import os
+import tempfile
+import time
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from backend.embedding_cache import EmbeddingCache
+
+
+def test_memory_lru_eviction():
+    """Test that the memory tier stays within its byte budget"""
+    vector = np.ones(4, dtype=np.float32)  # 16 bytes
+    cache = EmbeddingCache('test-model', max_bytes=32)
+
+    cache.put('a', vector)
+    cache.put('b', vector)
+    assert cache.get('a') is not None  # 'a' is now most recently used
+    cache.put('c', vector)  # evicts 'b'
+
+    assert cache.get('b') is None
+    assert cache.get('c') is not None
+
+    stats = cache.stats()
+    assert stats['evictions'] == 1
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+    assert stats['memory_bytes'] <= 32
+    print("✓ test_memory_lru_eviction passed")
+
+
+def test_disk_tier_persists():
+    """Test that the SQLite tier survives a new cache instance"""
+    vector = np.arange(8, dtype=np.float32)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        EmbeddingCache('test-model', cache_dir=cache_dir).put('job text', vector)
+
+        cache = EmbeddingCache('test-model', cache_dir=cache_dir)
+        assert np.array_equal(cache.get('job text'), vector)
+        assert cache.stats()['disk_hits'] == 1
+
+        # A different model or preprocessing version never sees the entry
+        assert EmbeddingCache('other-model', cache_dir=cache_dir).get('job text') is None
+        assert EmbeddingCache('test-model', preprocessing_version='2',
+                              cache_dir=cache_dir).get('job text') is None
+
+        # Expired entries are treated as misses
+        assert EmbeddingCache('test-model', cache_dir=cache_dir,
+                              max_age=-1).get('job text') is None
+    print("✓ test_disk_tier_persists passed")
+
+
+def test_memory_tier_expires():
+    """Test that memory entries older than max_age are treated as misses"""
+    vector = np.ones(4, dtype=np.float32)
+    cache = EmbeddingCache('test-model', max_age=0.05)
+
+    cache.put('a', vector)
+    assert cache.get('a') is not None
+    time.sleep(0.1)
+
+    assert cache.get('a') is None
+    stats = cache.stats()
+    assert stats['memory_entries'] == 0
+    assert stats['memory_bytes'] == 0
+    print("✓ test_memory_tier_expires passed")
+
+
+if __name__ == "__main__":
+    test_memory_lru_eviction()
+    test_disk_tier_persists()
+    test_memory_tier_expires()
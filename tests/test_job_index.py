@@ -0,0 +1,109 @@
+"""
+Tests for the memory-mapped job embedding index
+"""
+
+import sys
+import os
+import tempfile
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from backend.job_index import JobIndex
+from backend.matcher import ResumeJobMatcher
+
+
+def make_embeddings(n_jobs=1000, dim=32, seed=0):
+    """Random job embeddings and a query vector"""
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(n_jobs, dim)).astype(np.float32), rng.normal(size=dim).astype(np.float32)
+
+
+def test_search_matches_exact_ranking():
+    """Test that blocked search returns the same top-k as exact scoring"""
+    embeddings, query = make_embeddings()
+    index = JobIndex(dim=32)
+    index.add([f"job-{i}" for i in range(len(embeddings))], embeddings)
+
+    results = index.search(query, top_k=10, block_size=97)
+    expected = ResumeJobMatcher.rank_embeddings(query, embeddings, top_k=10)
+
+    assert [job_id for job_id, _ in results] == [f"job-{i}" for i, _ in expected]
+    assert np.allclose([s for _, s in results], [s for _, s in expected], atol=1e-3)
+    print("✓ test_search_matches_exact_ranking passed")
+
+
+def test_save_and_load_memory_mapped():
+    """Test saving an index and opening it memory-mapped"""
+    embeddings, query = make_embeddings(n_jobs=200)
+    index = JobIndex(dim=32, dtype='float16')
+    index.add(list(range(200)), embeddings, metadata=[{"title": f"Job {i}"} for i in range(200)])
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        index.save(index_dir)
+        loaded = JobIndex.load(index_dir)
+
+        assert isinstance(loaded.embeddings, np.memmap)
+        assert loaded.embeddings.dtype == np.float16
+        assert len(loaded) == 200
+        assert loaded.search(query, top_k=5) == index.search(query, top_k=5)
+        assert loaded.metadata[7] == {"title": "Job 7"}
+
+        # Loaded indexes can keep growing
+        loaded.add([200], embeddings[:1])
+        assert len(loaded) == 201 and loaded.ids[-1] == 200
+        del loaded
+    print("✓ test_save_and_load_memory_mapped passed")
+
+
+def test_ivf_search_recall():
+    """Test approximate IVF search against exact ground truth"""
+    rng = np.random.default_rng(1)
+    centers = rng.normal(size=(20, 32))
+    embeddings = (centers[rng.integers(0, 20, size=2000)] + 0.3 * rng.normal(size=(2000, 32))).astype(np.float32)
+    queries = embeddings[rng.choice(2000, 20, replace=False)] + 0.1 * rng.normal(size=(20, 32))
+
+    index = JobIndex(dim=32)
+    index.add(list(range(2000)), embeddings)
+    index.train_ivf(n_lists=20, seed=0)
+
+    hits = 0
+    for query in queries:
+        exact = {i for i, _ in ResumeJobMatcher.rank_embeddings(query, embeddings, top_k=10)}
+        approx = {job_id for job_id, _ in index.search(query, top_k=10, n_probe=3)}
+        hits += len(exact & approx)
+
+        # Probing every list is exact
+        assert index.search(query, top_k=10, n_probe=20) == index.search(query, top_k=10)
+
+    recall = hits / (10 * len(queries))
+    assert recall >= 0.9, f"recall@10 too low: {recall}"
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        index.save(index_dir)
+        loaded = JobIndex.load(index_dir)
+        assert loaded.is_trained
+        assert loaded.search(queries[0], top_k=10, n_probe=3) == index.search(queries[0], top_k=10, n_probe=3)
+        del loaded
+    print(f"✓ test_ivf_search_recall passed (recall@10={recall:.2f})")
+
+
+def test_ivf_small_sample_size():
+    """Test that a sample smaller than n_lists is raised to n_lists"""
+    embeddings, query = make_embeddings(n_jobs=100)
+    index = JobIndex(dim=32)
+    index.add(list(range(100)), embeddings)
+    index.train_ivf(n_lists=10, sample_size=3, seed=0)
+
+    assert index.is_trained
+    assert index.search(query, top_k=5, n_probe=10) == index.search(query, top_k=5)
+    print("✓ test_ivf_small_sample_size passed")
+
+
+if __name__ == "__main__":
+    test_search_matches_exact_ranking()
+    test_save_and_load_memory_mapped()
+    test_ivf_search_recall()
+    test_ivf_small_sample_size()
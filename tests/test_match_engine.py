@@ -0,0 +1,37 @@
+"""
+Tests for the blocked many-to-many matching engine
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from backend.match_engine import blocked_top_k
+from backend.matcher import normalize_rows
+
+
+def test_blocked_top_k_matches_full_matrix():
+    """Test that tiled top-k equals sorting the full similarity matrix"""
+    rng = np.random.default_rng(0)
+    resumes = normalize_rows(rng.normal(size=(300, 16)))
+    jobs = normalize_rows(rng.normal(size=(1000, 16)))
+
+    indices, scores = blocked_top_k(resumes, jobs, top_k=7, query_block=64, corpus_block=100)
+
+    full = resumes @ jobs.T
+    expected = np.argsort(-full, axis=1)[:, :7]
+    assert np.array_equal(indices, expected)
+    assert np.allclose(scores, np.take_along_axis(full, expected, axis=1), atol=1e-6)
+
+    # top_k larger than the corpus returns every job
+    indices, _ = blocked_top_k(resumes, jobs[:3], top_k=7)
+    assert indices.shape == (300, 3)
+    print("✓ test_blocked_top_k_matches_full_matrix passed")
+
+
+if __name__ == "__main__":
+    test_blocked_top_k_matches_full_matrix()
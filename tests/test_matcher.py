@@ -9,6 +9,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.text_processor import (
+    AnalyzedDocument,
     clean_text,
     extract_keywords,
     extract_skills_keywords,
@@ -64,6 +65,30 @@ def test_preprocess_for_embedding():
     print("✓ test_preprocess_for_embedding passed")
 
 
+def test_analyzed_document():
+    """Test that every helper gives the same result for an AnalyzedDocument"""
+    import pickle
+
+    resume_text = "Python developer (Flask, Postgres) - see https://example.com or me@example.com"
+    job_text = "Python and PostgreSQL engineer; Docker, K8s. Python first!"
+    resume, job = AnalyzedDocument(resume_text), AnalyzedDocument(job_text)
+
+    assert clean_text(resume) == clean_text(resume_text)
+    assert preprocess_for_embedding(resume) == preprocess_for_embedding(resume_text)
+    assert extract_keywords(job, top_n=5) == extract_keywords(job_text, top_n=5)
+    assert extract_skills_keywords(job) == extract_skills_keywords(job_text)
+    assert find_missing_keywords(resume, job) == find_missing_keywords(resume_text, job_text)
+    assert find_missing_keywords(resume, job) == ['docker', 'kubernetes']
+    assert job.tokens == clean_text(job_text).split() and job.term_counts["python"] == 2
+
+    # Views are computed once and travel with the document to other processes
+    assert job.skill_matches is job.skill_matches
+    copy = pickle.loads(pickle.dumps(AnalyzedDocument(job_text).analyze()))
+    assert {'embedding_text', 'term_counts', 'skills'} <= set(vars(copy))
+    assert copy.skills == job.skills
+    print("✓ test_analyzed_document passed")
+
+
 def test_matcher_model():
     """Test the AI matcher model"""
     try:
@@ -86,6 +111,175 @@ def test_matcher_model():
         print("  (This is expected if the model isn't downloaded yet)")
 
 
+def test_batch_calculate_scores():
+    """Test batched one-resume-vs-many-jobs scoring"""
+    try:
+        from backend.matcher import ResumeJobMatcher
+
+        matcher = ResumeJobMatcher()
+
+        resume = "Python developer with 5 years of experience in Django and Flask"
+        jobs = [
+            "Looking for Python developer with Django experience",
+            "   ",
+            "Registered nurse for night shifts in a busy hospital ward",
+        ]
+
+        scores = matcher.batch_calculate_scores(resume, jobs)
+        assert [idx for idx, _ in scores] == [0, 2]  # Empty job skipped, best first
+
+        expected = matcher.calculate_match_score(resume, jobs[0])
+        assert abs(scores[0][1] - expected) < 0.01
+
+        top = matcher.batch_calculate_scores(resume, jobs, top_k=1)
+        assert top == scores[:1]
+        print("✓ test_batch_calculate_scores passed")
+
+    except (ImportError, OSError) as e:
+        print(f"✗ test_batch_calculate_scores skipped: {str(e)}")
+        print("  (This is expected if the model isn't downloaded yet)")
+
+
+def test_match_matrix():
+    """Test many-to-many matching: index mapping, top-k across blocks and stats"""
+    import numpy as np
+    from backend.matcher import ResumeJobMatcher, normalize_rows
+
+    # Fixed vectors per text instead of a model, so the expected ranking is known
+    rng = np.random.default_rng(1)
+    vectors = {f"text {i}": rng.normal(size=8) for i in range(20)}
+    matcher = ResumeJobMatcher.__new__(ResumeJobMatcher)
+    matcher.encode_batch = lambda texts, batch_size=64: np.array([vectors[t] for t in texts]).reshape(-1, 8)
+
+    resumes = ["text 0", "", "text 1", "   ", "text 2", "text 3", "text 4"]
+    jobs = ["text 5", " ", "text 6", "text 7", "", "text 8", "text 9", "text 10", "text 11"]
+
+    results, stats = matcher.match_matrix(resumes, jobs, top_k=4, resume_block=2, job_block=3)
+
+    assert len(results) == len(resumes)
+    assert results[1] == [] and results[3] == []
+    job_rows = [j for j, text in enumerate(jobs) if text.strip()]
+    job_matrix = normalize_rows(np.array([vectors[jobs[j]] for j in job_rows]))
+    for i, text in enumerate(resumes):
+        if not text.strip():
+            continue
+        full = job_matrix @ normalize_rows(vectors[text].reshape(1, -1))[0] * 100
+        expected = [job_rows[col] for col in np.argsort(-full)[:4]]
+        assert [j for j, _ in results[i]] == expected
+        assert all(jobs[j].strip() for j, _ in results[i])
+        scores = [score for _, score in results[i]]
+        assert scores == sorted(scores, reverse=True)
+        assert np.allclose(scores, np.sort(full)[::-1][:4], atol=1e-4)
+
+    assert (stats['resumes'], stats['jobs'], stats['pairs']) == (5, 7, 35)
+    assert stats['total_seconds'] >= stats['encode_seconds'] >= 0
+
+    # Fewer jobs than top_k: every job, still best first
+    results, stats = matcher.match_matrix(["text 0"], ["text 5", "text 6"], top_k=10)
+    assert sorted(j for j, _ in results[0]) == [0, 1] and stats['pairs'] == 2
+
+    # Nothing to score on one side
+    results, stats = matcher.match_matrix(["", "text 0"], ["  "], top_k=3)
+    assert results == [[], []] and stats['pairs'] == 0
+    print("✓ test_match_matrix passed")
+
+
+def test_section_scores():
+    """Test the section similarity matrix and section scores"""
+    try:
+        from backend.matcher import ResumeJobMatcher
+
+        matcher = ResumeJobMatcher()
+
+        resume_sections = ["Python and Django developer", "", "Led a team of five engineers"]
+        job_sections = ["Django backend development", "Team leadership"]
+
+        matrix = matcher.section_similarity_matrix(resume_sections, job_sections)
+        assert matrix.shape == (3, 2)
+
+        scores = matcher.calculate_section_scores(resume_sections, job_sections, matrix=matrix)
+        assert len(scores) == 4  # Empty section skipped
+        assert scores == sorted(scores, reverse=True)
+        assert matcher.calculate_section_scores(resume_sections, job_sections, top_k=2) == scores[:2]
+        print("✓ test_section_scores passed")
+
+    except (ImportError, OSError) as e:
+        print(f"✗ test_section_scores skipped: {str(e)}")
+        print("  (This is expected if the model isn't downloaded yet)")
+
+
+def test_chunked_encoding():
+    """Test chunked encoding of texts longer than max_seq_length"""
+    try:
+        from backend.matcher import ResumeJobMatcher
+
+        matcher = ResumeJobMatcher(chunking=True, pooling='weighted')
+
+        long_resume = "Python developer building Django REST APIs and data pipelines. " * 60
+        chunks, token_counts = matcher.split_into_chunks(long_resume)
+        assert len(chunks) > 1
+        assert max(token_counts) <= matcher.model.max_seq_length
+
+        score = matcher.calculate_match_score(long_resume, "Python Django developer")
+        assert 0 <= score <= 100
+
+        # Stats stay aligned with the input even when texts are cached or repeated
+        short_job = "Backend engineer with Python"
+        chunk_stats = []
+        matcher.encode_batch([short_job, long_resume, short_job], chunk_stats=chunk_stats)
+        assert len(chunk_stats) == 3
+        assert chunk_stats[0]['chunks'] == 1
+        assert chunk_stats[1] is None  # served from the cache
+        assert chunk_stats[2] == chunk_stats[0]
+
+        direct_stats = []
+        matcher.encode_chunked([short_job, long_resume], stats=direct_stats)
+        assert [entry['chunks'] for entry in direct_stats] == [1, len(chunks)]
+
+        # Profiling reports untruncated token counts and bypasses the cache
+        embeddings, profile = matcher.profile_encode([short_job, long_resume])
+        assert embeddings.shape == (2, matcher.embedding_dim)
+        assert profile['token_counts'][1] > matcher.model.max_seq_length
+        assert profile['encode_ms'] > 0
+        print("✓ test_chunked_encoding passed")
+
+    except (ImportError, OSError) as e:
+        print(f"✗ test_chunked_encoding skipped: {str(e)}")
+        print("  (This is expected if the model isn't downloaded yet)")
+
+
+def test_offline_bundle():
+    """Test building, verifying and loading an offline model bundle"""
+    import tempfile
+
+    try:
+        from backend.matcher import ResumeJobMatcher
+        from backend.model_bundle import create_bundle, verify_bundle
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            bundle_dir = create_bundle('all-MiniLM-L6-v2', output_dir=output_dir, version='test')
+            manifest = verify_bundle(bundle_dir)
+            assert any(name.endswith('.safetensors') for name in manifest['files'])
+
+            matcher = ResumeJobMatcher(bundle_dir, verify_checksums=True)
+            assert matcher.model_id == 'all-MiniLM-L6-v2@test'
+            assert 0 <= matcher.calculate_match_score("Python developer", "Python engineer") <= 100
+
+            # Tampering with a file is detected
+            with open(os.path.join(bundle_dir, 'modules.json'), 'a') as f:
+                f.write(' ')
+            try:
+                verify_bundle(bundle_dir)
+                assert False, "tampered bundle passed verification"
+            except ValueError:
+                pass
+        print("✓ test_offline_bundle passed")
+
+    except (ImportError, OSError) as e:
+        print(f"✗ test_offline_bundle skipped: {str(e)}")
+        print("  (This is expected if the model isn't downloaded yet)")
+
+
 def run_all_tests():
     """Run all tests"""
     print("=" * 50)
@@ -99,7 +293,13 @@ def run_all_tests():
         test_extract_skills,
         test_find_missing_keywords,
         test_preprocess_for_embedding,
-        test_matcher_model
+        test_analyzed_document,
+        test_matcher_model,
+        test_batch_calculate_scores,
+        test_match_matrix,
+        test_section_scores,
+        test_chunked_encoding,
+        test_offline_bundle
     ]
 
     passed = 0
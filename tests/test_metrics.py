@@ -0,0 +1,78 @@
+"""
+Tests for the Prometheus metrics registry
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.metrics import MetricsRegistry, observe_timings
+
+
+def test_counter_gauge_and_callbacks():
+    """Test labelled counters, gauges and scrape-time callbacks"""
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests", ["route", "status"])
+    in_flight = registry.gauge("in_flight", "In flight")
+    depth = [3]
+    registry.gauge("queue_depth", "Queue depth", function=lambda: depth[0])
+
+    requests.inc("/match", "200")
+    requests.inc("/match", "200")
+    requests.inc("/match", "429")
+    in_flight.inc()
+    in_flight.dec()
+    depth[0] = 7
+
+    text = registry.render()
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{route="/match",status="200"} 2' in text
+    assert 'requests_total{route="/match",status="429"} 1' in text
+    assert "in_flight 0" in text
+    assert "queue_depth 7" in text
+
+    try:
+        requests.inc("/match")
+        assert False, "wrong label count accepted"
+    except ValueError:
+        pass
+    try:
+        requests.inc("/match", "200", amount=-1)
+        assert False, "counter decreased"
+    except ValueError:
+        pass
+    print("✓ test_counter_gauge_and_callbacks passed")
+
+
+def test_histogram_buckets():
+    """Test cumulative buckets, sum and count of a labelled histogram"""
+    registry = MetricsRegistry()
+    stages = registry.histogram("stage_seconds", "Stages", ["stage"], buckets=(0.01, 0.1, 1.0))
+    observe_timings(stages, [("encode", 5.0), ("encode", 50.0), ("encode", 100.0), ("encode", 3000.0)])
+
+    text = registry.render()
+    assert 'stage_seconds_bucket{stage="encode",le="0.01"} 1' in text
+    assert 'stage_seconds_bucket{stage="encode",le="0.1"} 3' in text  # bounds are inclusive
+    assert 'stage_seconds_bucket{stage="encode",le="1"} 3' in text
+    assert 'stage_seconds_bucket{stage="encode",le="+Inf"} 4' in text
+    assert 'stage_seconds_count{stage="encode"} 4' in text
+    assert stages.count("encode") == 4 and stages.count("extract") == 0
+    print("✓ test_histogram_buckets passed")
+
+
+def test_failing_callback_does_not_break_scrape():
+    """Test that one broken callback leaves the other metrics readable"""
+    registry = MetricsRegistry()
+    registry.gauge("broken", "Broken", function=lambda: 1 / 0)
+    registry.counter("ok_total", "Fine").inc()
+    text = registry.render()
+    assert "broken" not in text and "ok_total 1" in text
+    print("✓ test_failing_callback_does_not_break_scrape passed")
+
+
+if __name__ == "__main__":
+    test_counter_gauge_and_callbacks()
+    test_histogram_buckets()
+    test_failing_callback_does_not_break_scrape()
@@ -0,0 +1,109 @@
+"""
+Tests for the ONNX Runtime inference backend
+"""
+
+import sys
+import os
+import tempfile
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+
+def build_tiny_model(model_dir):
+    """Build a small randomly initialized SentenceTransformer without network access"""
+    from sentence_transformers import SentenceTransformer, models
+    from transformers import BertConfig, BertModel, BertTokenizerFast
+
+    words = ['python', 'django', 'developer', 'data', 'engineer', 'resume', 'job', 'skills']
+    vocab = ['[PAD]', '[UNK]', '[CLS]', '[SEP]', '[MASK]'] + words + list('abcdefghijklmnopqrstuvwxyz.,')
+    vocab_file = os.path.join(model_dir, 'vocab.txt')
+    with open(vocab_file, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(vocab))
+
+    hf_dir = os.path.join(model_dir, 'hf')
+    BertTokenizerFast(vocab_file).save_pretrained(hf_dir)
+    BertModel(BertConfig(
+        vocab_size=len(vocab), hidden_size=32, num_hidden_layers=2,
+        num_attention_heads=2, intermediate_size=64, max_position_embeddings=64
+    )).save_pretrained(hf_dir)
+
+    transformer = models.Transformer(hf_dir, max_seq_length=48)
+    pooling = models.Pooling(transformer.get_word_embedding_dimension(), 'mean')
+    return SentenceTransformer(modules=[transformer, pooling, models.Normalize()], device='cpu')
+
+
+def test_onnx_encode_matches_torch():
+    """Test that OnnxEncoder reproduces SentenceTransformer.encode"""
+    try:
+        import torch
+        from backend.onnx_backend import OnnxEncoder
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model = build_tiny_model(tmp_dir)
+            encoder = OnnxEncoder(model, 'tiny', onnx_dir=os.path.join(tmp_dir, 'onnx'))
+
+            texts = ['python developer', 'data engineer with django skills and a long resume', 'job']
+            expected = model.encode(texts, convert_to_tensor=False)
+            actual = encoder.encode(texts, batch_size=2)
+            assert actual.shape == expected.shape
+            assert np.allclose(actual, expected, atol=1e-4)
+            assert np.allclose(encoder.encode('job'), expected[2], atol=1e-4)
+
+            # Changed weights must not reuse the stale export
+            first_dir = encoder.export_dir
+            with torch.no_grad():
+                next(model[0].auto_model.parameters()).add_(0.5)
+            assert OnnxEncoder(model, 'tiny', onnx_dir=os.path.join(tmp_dir, 'onnx')).export_dir != first_dir
+        print("✓ test_onnx_encode_matches_torch passed")
+
+    except (ImportError, OSError) as e:
+        print(f"✗ test_onnx_encode_matches_torch skipped: {str(e)}")
+        print("  (This is expected if onnxruntime or the ML stack isn't installed)")
+
+
+def test_unsupported_module_rejected():
+    """Test that a model with a module the backend can't reproduce is refused"""
+    try:
+        from sentence_transformers import SentenceTransformer, models
+        from backend.onnx_backend import OnnxEncoder
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model = build_tiny_model(tmp_dir)
+            dense = models.Dense(model[0].get_word_embedding_dimension(), 16)
+            with_dense = SentenceTransformer(modules=[model[0], model[1], dense, model[2]], device='cpu')
+            try:
+                OnnxEncoder(with_dense, 'tiny-dense', onnx_dir=os.path.join(tmp_dir, 'onnx'))
+                assert False, "Should raise ValueError"
+            except ValueError as e:
+                assert 'Dense' in str(e)
+            assert not os.path.exists(os.path.join(tmp_dir, 'onnx'))
+        print("✓ test_unsupported_module_rejected passed")
+
+    except (ImportError, OSError) as e:
+        print(f"✗ test_unsupported_module_rejected skipped: {str(e)}")
+        print("  (This is expected if the ML stack isn't installed)")
+
+
+def test_pooling_modes():
+    """Test the numpy pooling of token embeddings"""
+    from backend.onnx_backend import OnnxEncoder
+
+    tokens = np.array([[[1.0, 4.0], [3.0, 0.0], [100.0, 100.0]]], dtype=np.float32)
+    mask = np.array([[1, 1, 0]])
+
+    # _pool only needs the pooling attribute, so skip the export in __init__
+    encoder = OnnxEncoder.__new__(OnnxEncoder)
+    expected = {'mean': [2.0, 2.0], 'max': [3.0, 4.0], 'cls': [1.0, 4.0]}
+    for mode, values in expected.items():
+        encoder.pooling = mode
+        assert np.allclose(encoder._pool(tokens, mask), [values]), mode
+    print("✓ test_pooling_modes passed")
+
+
+if __name__ == "__main__":
+    test_onnx_encode_matches_torch()
+    test_unsupported_module_rejected()
+    test_pooling_modes()
@@ -0,0 +1,180 @@
+"""
+Tests for streaming, budgeted and page-parallel PDF extraction
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def make_pdf(pages):
+    """
+    Build a PDF in memory.
+
+    Args:
+        pages: One entry per page: text lines (list of str) or None for a scanned, image-only page
+    """
+    objects = []
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    image = add(b"<< /Type /XObject /Subtype /Image /Width 1 /Height 1 /ColorSpace /DeviceGray "
+                b"/BitsPerComponent 8 /Length 1 >>\nstream\n\x80\nendstream")
+    pages_id = len(objects) + 2 * len(pages) + 1
+
+    page_ids = []
+    for lines in pages:
+        if lines is None:
+            content = b"q 500 0 0 700 50 50 cm /Im0 Do Q"
+            resources = b"<< /XObject << /Im0 %d 0 R >> >>" % image
+        else:
+            text = b" ".join(b"(%s) '" % line.encode('latin-1') for line in lines)
+            content = b"BT /F1 10 Tf 12 TL 50 780 Td " + text + b" ET"
+            resources = b"<< /Font << /F1 %d 0 R >> >>" % font
+        stream = add(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        page_ids.append(add(b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] "
+                            b"/Resources %s /Contents %d 0 R >>" % (pages_id, resources, stream)))
+
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    assert add(b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))) == pages_id
+    catalog = add(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, catalog, xref)
+    return bytes(out)
+
+
+def text_pages(count, lines=3):
+    """Pages whose lines name their page, e.g. 'page 3 line 1'"""
+    return [[f"page {page} line {line}" for line in range(lines)] for page in range(count)]
+
+
+def test_stream_pages_and_skip_images():
+    """Test page streaming and image-only page detection"""
+    try:
+        from utils.pdf_extractor import extract_pdf, iter_pdf_pages
+        from utils.text_processor import extract_text_from_pdf
+    except ImportError as e:
+        print(f"✗ test_stream_pages_and_skip_images skipped: {str(e)}")
+        return
+
+    content = make_pdf([["Python developer"], None, ["Docker and Kubernetes"], None])
+    pages = list(iter_pdf_pages(content))
+    assert [number for number, _ in pages] == [0, 1, 2, 3]
+    assert "Python developer" in pages[0][1] and pages[1][1] is None and pages[3][1] is None
+
+    result = extract_pdf(content)
+    assert (result.pages, result.pages_read, result.pages_skipped, result.truncated) == (4, 2, 2, None)
+    assert extract_text_from_pdf(content) == result.text
+    assert result.text.index("Python developer") < result.text.index("Docker and Kubernetes")
+
+    # The generator stops reading where the caller stops iterating
+    assert len(list(iter_pdf_pages(content, max_pages=1))) == 1
+
+    try:
+        extract_pdf(b"not a pdf")
+        assert False, "Should raise ValueError"
+    except ValueError as e:
+        assert "Error extracting text from PDF" in str(e)
+    print("✓ test_stream_pages_and_skip_images passed")
+
+
+def test_page_and_time_budgets():
+    """Test that budgets return the pages read so far"""
+    try:
+        from utils.pdf_extractor import extract_pdf
+    except ImportError as e:
+        print(f"✗ test_page_and_time_budgets skipped: {str(e)}")
+        return
+
+    content = make_pdf(text_pages(10))
+    result = extract_pdf(content, max_pages=3)
+    assert result.truncated == 'page_limit' and result.pages == 10 and result.pages_read == 3
+    assert "page 2 line 0" in result.text and "page 3" not in result.text
+
+    # A page that takes seconds to parse: cut in the middle of it, keeping the pages before
+    extract_pdf(content, time_limit=30)  # start the extraction helper process outside the budget
+    heavy = make_pdf(text_pages(3) + [[f"heavy line {line}" for line in range(60000)]] + text_pages(2))
+    result = extract_pdf(heavy, time_limit=0.5)
+    assert result.truncated == 'time_limit' and result.elapsed_ms < 2000
+    assert 1 <= result.pages_read <= 3 and "page 0 line 0" in result.text and "heavy" not in result.text
+
+    try:
+        extract_pdf(b"not a pdf", time_limit=5)
+        assert False, "Should raise ValueError"
+    except ValueError as e:
+        assert "Error extracting text from PDF" in str(e)
+    print("✓ test_page_and_time_budgets passed")
+
+
+def _extract_with_limit(content):
+    from utils.pdf_extractor import extract_pdf
+    return extract_pdf(content, time_limit=30).pages_read
+
+
+def test_time_limit_in_forked_worker():
+    """Test a time-limited extraction in a worker forked after this process started extraction helpers"""
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    try:
+        from utils.pdf_extractor import extract_pdf
+    except ImportError as e:
+        print(f"✗ test_time_limit_in_forked_worker skipped: {str(e)}")
+        return
+
+    content = make_pdf(text_pages(3))
+    assert extract_pdf(content, time_limit=30).pages_read == 3
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context('fork')) as pool:
+        assert pool.submit(_extract_with_limit, content).result(timeout=60) == 3
+    print("✓ test_time_limit_in_forked_worker passed")
+
+
+def test_page_parallel_extraction():
+    """Test that the process-pool mode returns the same text in page order"""
+    try:
+        import utils.pdf_extractor as pdf_extractor
+        from utils.pdf_extractor import PARALLEL_MIN_PAGES, extract_pdf
+    except ImportError as e:
+        print(f"✗ test_page_parallel_extraction skipped: {str(e)}")
+        return
+
+    pages = text_pages(PARALLEL_MIN_PAGES * 2, lines=20)
+    pages[5] = None
+    content = make_pdf(pages)
+
+    # Use the pool even on a single-core machine
+    original = pdf_extractor.MAX_PAGE_WORKERS
+    pdf_extractor.MAX_PAGE_WORKERS = 2
+    try:
+        serial = extract_pdf(content)
+        parallel = extract_pdf(content, workers=2)
+        assert parallel.text == serial.text
+        assert (parallel.pages_read, parallel.pages_skipped) == (serial.pages_read, serial.pages_skipped) == (15, 1)
+
+        # A deadline that has effectively passed: the pool is killed, no waiting for all pages
+        heavy = make_pdf(text_pages(PARALLEL_MIN_PAGES * 4, lines=400))
+        result = extract_pdf(heavy, time_limit=0.05, workers=2)
+        assert result.truncated == 'time_limit' and result.pages_read < PARALLEL_MIN_PAGES * 4
+    finally:
+        pdf_extractor.MAX_PAGE_WORKERS = original
+    print("✓ test_page_parallel_extraction passed")
+
+
+if __name__ == "__main__":
+    test_stream_pages_and_skip_images()
+    test_page_and_time_budgets()
+    test_time_limit_in_forked_worker()
+    test_page_parallel_extraction()
@@ -0,0 +1,53 @@
+"""
+Tests for the /match response cache
+"""
+
+import sys
+import os
+import time
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.response_cache import ResponseCache, normalize_for_key
+
+
+def test_lru_bound_and_ttl():
+    """Test entry-count eviction and TTL expiry"""
+    cache = ResponseCache(max_entries=2, ttl=0.05)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # 'a' is now most recently used
+    cache.put('c', 3)  # evicts 'b'
+
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    time.sleep(0.1)
+    assert cache.get('a') is None
+
+    stats = cache.stats()
+    assert stats['evictions'] == 1 and stats['expirations'] == 1
+    assert stats['hits'] == 2 and stats['misses'] == 2
+    print("✓ test_lru_bound_and_ttl passed")
+
+
+def test_keys_and_etags():
+    """Test key construction and If-None-Match matching"""
+    key = ResponseCache.make_key(normalize_for_key(" Python\n developer "), 'job', 'model', '1')
+    assert key == ResponseCache.make_key('Python developer', 'job', 'model', '1')
+    assert ResponseCache.make_key('ab', 'c') != ResponseCache.make_key('a', 'bc')
+
+    cache = ResponseCache()
+    etag = cache.etag(key)
+    assert cache.matches(key, etag)
+    assert cache.matches(key, f'"other", W/{etag}')
+    assert not cache.matches(key, '"other"')
+    assert not cache.matches(key, None)
+    assert not cache.matches(key, '*')
+    assert cache.stats()['not_modified'] == 2
+    print("✓ test_keys_and_etags passed")
+
+
+if __name__ == "__main__":
+    test_lru_bound_and_ttl()
+    test_keys_and_etags()
@@ -0,0 +1,34 @@
+"""
+Tests for the pre-fork server helpers
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.serve import default_worker_threads, process_memory
+
+
+def test_default_worker_threads():
+    """Test that cores are split between workers without going below one thread"""
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()
+    assert default_worker_threads(1) == cores
+    assert default_worker_threads(cores * 4) == 1
+    print("✓ test_default_worker_threads passed")
+
+
+def test_process_memory():
+    """Test reading the memory of the current process"""
+    memory = process_memory()
+    assert memory['pid'] == os.getpid()
+    if os.path.exists('/proc/self/smaps_rollup'):
+        assert memory['rss_mb'] > 0
+        assert 0 < memory['pss_mb'] <= memory['rss_mb']
+    print("✓ test_process_memory passed")
+
+
+if __name__ == "__main__":
+    test_default_worker_threads()
+    test_process_memory()
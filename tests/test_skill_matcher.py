@@ -0,0 +1,64 @@
+"""
+Tests for the token-level Aho–Corasick skill matcher
+"""
+
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.skill_matcher import SkillMatcher
+from utils.text_processor import extract_skills_keywords, find_skills
+
+
+def test_word_boundaries():
+    """Test that short skills only match whole words"""
+    text = "Framework engineer; Django and Argo experience. Languages: R, Go (golang), C++ and C#."
+    skills = extract_skills_keywords(text)
+    assert {'r', 'go', 'c++', 'c#', 'django'} <= skills
+    assert 'rest' not in extract_skills_keywords("Interested in forestry")
+    assert extract_skills_keywords("Framework for cargo ships") == set()
+    print("✓ test_word_boundaries passed")
+
+
+def test_punctuated_and_multi_word_skills():
+    """Test skills containing punctuation and spaces"""
+    text = "Built Node.js services, CI/CD with Jenkins, scikit-learn and Machine\nLearning models"
+    skills = extract_skills_keywords(text)
+    assert {'node.js', 'ci/cd', 'jenkins', 'scikit-learn', 'machine learning'} <= skills
+    # Punctuation between words breaks a phrase
+    assert 'machine learning' not in extract_skills_keywords("machine, learning")
+    print("✓ test_punctuated_and_multi_word_skills passed")
+
+
+def test_offsets_and_overlaps():
+    """Test match offsets and overlapping phrases"""
+    text = "Deep Learning and NLP"
+    matches = find_skills(text)
+    assert [(m.skill, text[m.start:m.end]) for m in matches] == [
+        ('deep learning', 'Deep Learning'), ('nlp', 'NLP')
+    ]
+
+    matcher = SkillMatcher({'machine learning': 'ml', 'learning': 'learning',
+                            'learning rate': 'lr', 'k8s': 'kubernetes'})
+    found = matcher.find("machine learning rate on k8s")
+    assert [m.skill for m in found] == ['ml', 'lr', 'learning', 'kubernetes']
+    assert found[0][1:] == (0, 16) and found[1][1:] == (8, 21)
+    assert matcher.skills("K8S cluster") == {'kubernetes'}
+    print("✓ test_offsets_and_overlaps passed")
+
+
+def test_failure_links():
+    """Test that a failed partial phrase still matches a suffix phrase"""
+    matcher = SkillMatcher(['a b c', 'b d', 'b'])
+    assert matcher.skills("a b d") == {'b d', 'b'}
+    assert matcher.skills("a b a b c") == {'a b c', 'b'}
+    print("✓ test_failure_links passed")
+
+
+if __name__ == "__main__":
+    test_word_boundaries()
+    test_punctuated_and_multi_word_skills()
+    test_offsets_and_overlaps()
+    test_failure_links()
@@ -0,0 +1,128 @@
+"""
+Tests for the external skill taxonomy
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils.text_processor as text_processor
+from utils.skill_taxonomy import SkillTaxonomy, load_taxonomy
+from utils.text_processor import extract_skills_keywords, find_missing_keywords, reload_skill_taxonomy, skill_taxonomy
+
+
+def write_file(directory, name, content):
+    """Write a file and return its path"""
+    path = os.path.join(directory, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return path
+
+
+def test_default_taxonomy_aliases():
+    """Test that aliases in the bundled taxonomy map to canonical ids"""
+    assert len(skill_taxonomy()) > 80
+    assert extract_skills_keywords("Ran k8s and Postgres; ML with JS and golang") == {
+        'kubernetes', 'postgresql', 'machine learning', 'javascript', 'go'
+    }
+    # The resume's alias covers the job's canonical name
+    missing = find_missing_keywords("Postgres, K8s", "PostgreSQL, Kubernetes and Kafka")
+    assert missing == ['kafka']
+    print("✓ test_default_taxonomy_aliases passed")
+
+
+def test_json_and_csv_files():
+    """Test loading both file formats"""
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = write_file(tmp, 'skills.json', json.dumps({
+            'version': '2025.1',
+            'skills': [{'id': 'kubernetes', 'name': 'Kubernetes', 'aliases': ['k8s', 'kube']},
+                       {'id': 'machine learning', 'aliases': ['ML']}]
+        }))
+        csv_path = write_file(tmp, 'skills-7.csv',
+                              'id,name,aliases\nkubernetes,Kubernetes,k8s|kube\nmachine learning,,ML\n')
+
+        from_json = load_taxonomy(json_path)
+        from_csv = load_taxonomy(csv_path)
+        assert from_json.version == '2025.1' and from_csv.version == 'skills-7'
+        for taxonomy in (from_json, from_csv):
+            assert len(taxonomy) == 2
+            assert taxonomy.matcher.skills("kube and ml") == {'kubernetes', 'machine learning'}
+        assert from_json.fingerprint != from_csv.fingerprint
+
+        for bad in ('{"skills": "nope"}', '{not json'):
+            try:
+                load_taxonomy(write_file(tmp, 'bad.json', bad))
+                assert False, "Should raise ValueError"
+            except ValueError:
+                pass
+    print("✓ test_json_and_csv_files passed")
+
+
+def test_conflicting_alias_rejected():
+    """Test that one phrase can't name two skills"""
+    try:
+        SkillTaxonomy([{'id': 'go', 'aliases': ['golang']}, {'id': 'golang'}])
+        assert False, "Should raise ValueError"
+    except ValueError as e:
+        assert 'golang' in str(e)
+    print("✓ test_conflicting_alias_rejected passed")
+
+
+def test_compiled_cache():
+    """Test that the compiled taxonomy is reused until the file changes"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, 'compiled')
+        path = write_file(tmp, 'skills.json', json.dumps({'version': '1', 'skills': [{'id': 'rust'}]}))
+
+        first = load_taxonomy(path, cache_dir)
+        assert len(os.listdir(cache_dir)) == 1
+        second = load_taxonomy(path, cache_dir)
+        assert second.fingerprint == first.fingerprint
+        assert second.matcher.skills("Rust") == {'rust'}
+        assert len(os.listdir(cache_dir)) == 1
+
+        write_file(tmp, 'skills.json', json.dumps({'version': '2', 'skills': [{'id': 'rust'}, {'id': 'zig'}]}))
+        third = load_taxonomy(path, cache_dir)
+        assert third.version == '2' and third.matcher.skills("zig, rust") == {'rust', 'zig'}
+        # The pickle of version 1 was replaced
+        assert len(os.listdir(cache_dir)) == 1
+    print("✓ test_compiled_cache passed")
+
+
+def test_reload_swaps_taxonomy():
+    """Test that a reload replaces the active taxonomy and a bad file keeps the old one"""
+    original, cache_dir = skill_taxonomy(), text_processor.SKILL_CACHE_DIR
+    text_processor.SKILL_CACHE_DIR = None
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_file(tmp, 'skills.json', json.dumps({
+                'version': 'custom', 'skills': [{'id': 'terraform', 'aliases': ['tf']}]
+            }))
+            reload_skill_taxonomy(path)
+            assert skill_taxonomy().version == 'custom'
+            assert extract_skills_keywords("TF modules in Python") == {'terraform'}
+
+            try:
+                reload_skill_taxonomy(write_file(tmp, 'broken.json', '{'))
+                assert False, "Should raise ValueError"
+            except ValueError:
+                pass
+            assert skill_taxonomy().version == 'custom'
+    finally:
+        text_processor._set_taxonomy(original)
+        text_processor.SKILL_CACHE_DIR = cache_dir
+    assert 'python' in extract_skills_keywords("TF modules in Python")
+    print("✓ test_reload_swaps_taxonomy passed")
+
+
+if __name__ == "__main__":
+    test_default_taxonomy_aliases()
+    test_json_and_csv_files()
+    test_conflicting_alias_rejected()
+    test_compiled_cache()
+    test_reload_swaps_taxonomy()
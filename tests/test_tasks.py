@@ -0,0 +1,175 @@
+"""
+Tests for the SQLite-backed background task queue
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.tasks import TaskRunner, TaskStore
+
+
+def upper_handlers(calls=None, fail_at=None, gate=None):
+    """Handlers that upper-case items, recording each chunk's start position"""
+    def prepare(task):
+        return task['params']['suffix']
+
+    def process(task, state, items, start):
+        if calls is not None:
+            calls.append(start)
+        if gate is not None:
+            gate.wait(5)
+        if fail_at is not None and start >= fail_at:
+            raise ValueError("boom")
+        return [item.upper() + state for item in items]
+
+    return {'upper': (prepare, process)}
+
+
+def wait_for_status(store, task_id, statuses, timeout=10.0):
+    """Poll a task until it reaches one of the given statuses"""
+    deadline = time.time() + timeout
+    while store.get(task_id)['status'] not in statuses:
+        assert time.time() < deadline, f"stuck at {store.get(task_id)['status']}"
+        time.sleep(0.01)
+    return store.get(task_id)
+
+
+def test_runs_to_completion_with_progress():
+    """Test chunked processing, results order and progress fields"""
+    store = TaskStore()
+    task_id = store.submit('upper', ['a', 'b', 'c', 'd', 'e'], {'suffix': '!'})
+    assert store.get(task_id)['status'] == 'queued'
+
+    runner = TaskRunner(store, upper_handlers(), chunk_size=2, poll_interval=0.01)
+    runner.start()
+    try:
+        task = wait_for_status(store, task_id, {'completed'})
+    finally:
+        runner.stop()
+
+    assert task['done'] == 5 and task['progress'] == 1.0 and task['eta_seconds'] is None
+    assert [result for _, result in store.results(task_id, batch_size=2)] == ['A!', 'B!', 'C!', 'D!', 'E!']
+    assert runner.stats()['completed'] == 1 and runner.stats()['tasks']['completed'] == 1
+    print("✓ test_runs_to_completion_with_progress passed")
+
+
+def test_resumes_from_checkpoint_after_restart():
+    """Test that a task interrupted by a stop continues where it left off"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'tasks.db')
+        store = TaskStore(path)
+        task_id = store.submit('upper', list('abcdef'), {'suffix': ''})
+
+        gate = threading.Event()
+        calls = []
+        runner = TaskRunner(store, upper_handlers(calls, gate=gate), chunk_size=2, poll_interval=0.01)
+        runner.start()
+        while not calls:
+            time.sleep(0.01)
+        # Stop while the first chunk runs: it is checkpointed, then the task is released
+        threading.Timer(0.05, gate.set).start()
+        runner.stop()
+        assert store.get(task_id)['status'] == 'queued'
+        assert store.get(task_id)['done'] == 2
+
+        # A new process opens the same file and resumes at position 2
+        reopened = TaskStore(path)
+        calls = []
+        runner = TaskRunner(reopened, upper_handlers(calls), chunk_size=2, poll_interval=0.01)
+        runner.start()
+        try:
+            wait_for_status(reopened, task_id, {'completed'})
+        finally:
+            runner.stop()
+        assert calls == [2, 4]
+        assert [result for _, result in reopened.results(task_id)] == list('ABCDEF')
+    print("✓ test_resumes_from_checkpoint_after_restart passed")
+
+
+def test_expired_lease_is_reclaimed():
+    """Test that a task whose worker stopped heartbeating is claimed again"""
+    store = TaskStore()
+    task_id = store.submit('upper', ['a'], {'suffix': ''})
+    assert store.claim('dead-worker', lease_seconds=60, kinds=('upper',))['status'] == 'running'
+    assert store.claim('other', lease_seconds=60, kinds=('upper',)) is None
+
+    time.sleep(0.02)
+    task = store.claim('other', lease_seconds=0.01, kinds=('upper',))
+    assert task['id'] == task_id and task['owner'] == 'other'
+    # The old worker lost its lease and can no longer write
+    assert store.checkpoint(task_id, 'dead-worker', 0, ['X']) is False
+    assert list(store.results(task_id)) == []
+    print("✓ test_expired_lease_is_reclaimed passed")
+
+
+def test_lease_kept_during_long_prepare():
+    """Test that a task whose prepare outlasts the lease is not claimed by another worker"""
+    store = TaskStore()
+    task_id = store.submit('upper', ['a', 'b'], {'suffix': ''})
+    preparing, finish_prepare = threading.Event(), threading.Event()
+
+    def prepare(task):
+        preparing.set()
+        finish_prepare.wait(5)
+        return ''
+
+    runner = TaskRunner(store, {'upper': (prepare, upper_handlers()['upper'][1])},
+                        lease_seconds=0.3, poll_interval=0.01)
+    runner.start()
+    try:
+        assert preparing.wait(5)
+        # Several leases long: still heartbeating, so nobody else may take it
+        for _ in range(10):
+            time.sleep(0.1)
+            assert store.claim('other', lease_seconds=0.3, kinds=('upper',)) is None
+        finish_prepare.set()
+        task = wait_for_status(store, task_id, {'completed'})
+        assert task['owner'] == runner.owner
+    finally:
+        finish_prepare.set()
+        runner.stop()
+    assert [result for _, result in store.results(task_id)] == ['A', 'B']
+    print("✓ test_lease_kept_during_long_prepare passed")
+
+
+def test_cancel_and_failure():
+    """Test cancelling queued and running tasks and recording handler errors"""
+    store = TaskStore()
+    queued = store.submit('upper', ['a'], {'suffix': ''})
+    assert store.cancel(queued) == 'cancelled'
+    assert store.cancel('missing') is None
+
+    gate = threading.Event()
+    calls = []
+    running = store.submit('upper', list('abcdef'), {'suffix': ''})
+    runner = TaskRunner(store, upper_handlers(calls, gate=gate), chunk_size=2, poll_interval=0.01)
+    runner.start()
+    try:
+        while not calls:
+            time.sleep(0.01)
+        assert store.cancel(running) == 'running'
+        gate.set()
+        task = wait_for_status(store, running, {'cancelled'})
+        assert task['done'] == 2 and calls == [0]
+
+        failing = store.submit('upper', list('abcd'), {'suffix': ''})
+        runner.handlers = upper_handlers(fail_at=2)
+        task = wait_for_status(store, failing, {'failed'})
+        assert task['error'] == 'boom' and task['done'] == 2
+    finally:
+        runner.stop()
+    print("✓ test_cancel_and_failure passed")
+
+
+if __name__ == "__main__":
+    test_runs_to_completion_with_progress()
+    test_resumes_from_checkpoint_after_restart()
+    test_expired_lease_is_reclaimed()
+    test_lease_kept_during_long_prepare()
+    test_cancel_and_failure()
@@ -0,0 +1,65 @@
+"""
+Tests for the bounded work pool
+"""
+
+import sys
+import os
+import asyncio
+import threading
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.work_pool import WorkPool, PoolBusyError
+
+
+def test_pool_rejects_beyond_max_pending():
+    """Test bounded admission and separate queue/compute timing"""
+    release = threading.Event()
+
+    def blocking(value):
+        release.wait(5)
+        return value * 2
+
+    async def run():
+        pool = WorkPool(kind='thread', max_workers=1, max_pending=2, retry_after=3)
+        first = asyncio.ensure_future(pool.run_timed(blocking, 1))
+        second = asyncio.ensure_future(pool.run_timed(blocking, 2))
+        await asyncio.sleep(0.05)
+
+        try:
+            await pool.run(blocking, 3)
+            error = None
+        except PoolBusyError as e:
+            error = e
+
+        release.set()
+        results = await asyncio.gather(first, second)
+        pool.shutdown()
+        return error, results, pool.stats()
+
+    error, results, stats = asyncio.run(run())
+
+    assert error is not None and error.retry_after == 3
+    assert [result for result, _ in results] == [2, 4]
+    # The second call waited in the queue while the only worker was busy
+    assert results[1][1]['queue_ms'] > 0
+    assert stats['rejected'] == 1 and stats['completed'] == 2 and stats['pending'] == 0
+    print("✓ test_pool_rejects_beyond_max_pending passed")
+
+
+def test_process_pool():
+    """Test running picklable functions in a process pool"""
+    async def run():
+        pool = WorkPool(kind='process', max_workers=2)
+        results = await asyncio.gather(*(pool.run(pow, 2, n) for n in range(5)))
+        pool.shutdown()
+        return results
+
+    assert asyncio.run(run()) == [1, 2, 4, 8, 16]
+    print("✓ test_process_pool passed")
+
+
+if __name__ == "__main__":
+    test_pool_rejects_beyond_max_pending()
+    test_process_pool()
@@ -3,21 +3,29 @@ Utility functions for AI Resume-Job Matcher
 """
 
 from .text_processor import (
+    AnalyzedDocument,
     extract_text_from_pdf,
     clean_text,
     remove_stopwords,
     extract_keywords,
     extract_skills_keywords,
+    find_skills,
     find_missing_keywords,
-    preprocess_for_embedding
+    preprocess_for_embedding,
+    reload_skill_taxonomy,
+    skill_taxonomy
 )
 
 __all__ = [
+    'AnalyzedDocument',
     'extract_text_from_pdf',
     'clean_text',
     'remove_stopwords',
     'extract_keywords',
     'extract_skills_keywords',
+    'find_skills',
     'find_missing_keywords',
-    'preprocess_for_embedding'
+    'preprocess_for_embedding',
+    'reload_skill_taxonomy',
+    'skill_taxonomy'
 ]
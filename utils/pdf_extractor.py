@@ -0,0 +1,359 @@
+"""
+PDF text extraction with streaming pages, budgets and a page-parallel mode.
+
+iter_pdf_pages() yields the text of one page at a time, so callers can stop
+early and never hold more than the pages they keep. extract_pdf() builds on
+it with per-document limits: at most max_pages pages and time_limit seconds,
+returning whatever was extracted so far (with the reason) instead of
+failing. Pages without a text layer (scanned images) are recognized from
+their resources, without parsing their content streams, and skipped.
+
+The time limit covers the whole extraction, opening the PDF included: with
+a limit, the document is read in a child process that streams its pages
+back and is killed when the limit passes, so even a malicious page that
+never finishes can't hold the caller longer than the limit. With workers >
+1, documents of PARALLEL_MIN_PAGES pages or more are split into page ranges
+extracted in a pool of worker processes started for that document, which is
+terminated the same way.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from io import BytesIO
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+
+# Smaller documents go to one pool worker as a single range: splitting costs more than it saves
+PARALLEL_MIN_PAGES = 8
+# Pages per pool task; each task re-opens the PDF, so ranges amortize that
+PAGES_PER_TASK = 4
+# More page workers than cores only adds process start-up
+MAX_PAGE_WORKERS = os.cpu_count() or 1
+
+TRUNCATED_PAGE_LIMIT = 'page_limit'
+TRUNCATED_TIME_LIMIT = 'time_limit'
+
+
+class PDFExtraction(NamedTuple):
+    """Text of a PDF and how much of it was read."""
+    text: str
+    pages: int                  # pages in the document (0 if the time limit passed while opening it)
+    pages_read: int             # pages whose text layer was extracted
+    pages_skipped: int          # image-only pages skipped without parsing
+    truncated: Optional[str]    # None, 'page_limit' or 'time_limit'
+    elapsed_ms: float
+
+
+def open_pdf(file_content: bytes):
+    """
+    Open a PDF for reading.
+
+    Raises:
+        ValueError: If the content is not a readable PDF
+    """
+    import PyPDF2
+
+    try:
+        return PyPDF2.PdfReader(BytesIO(file_content))
+    except Exception as e:
+        raise ValueError(f"Error extracting text from PDF: {str(e)}")
+
+
+def has_text_layer(page) -> bool:
+    """
+    Whether a page can contain text, judged from its resources only.
+
+    Text needs a font: a page with no fonts and no form XObjects (which
+    carry their own fonts) is image-only, e.g. a scanned page.
+    """
+    resources = page.get('/Resources')
+    if resources is None:
+        return False
+    resources = resources.get_object()
+    if resources.get('/Font'):
+        return True
+
+    xobjects = resources.get('/XObject')
+    if xobjects is None:
+        return False
+    xobjects = xobjects.get_object()
+    return any(xobjects[name].get_object().get('/Subtype') == '/Form' for name in xobjects)
+
+
+def _page_text(page) -> Optional[str]:
+    """Text of a page, or None if it has no text layer."""
+    if not has_text_layer(page):
+        return None
+    return page.extract_text() or ''
+
+
+def _iter_pages(reader, numbers: Iterable[int]) -> Iterator[Tuple[int, Optional[str]]]:
+    for number in numbers:
+        try:
+            text = _page_text(reader.pages[number])
+        except Exception as e:
+            raise ValueError(f"Error extracting text from PDF page {number + 1}: {str(e)}")
+        yield number, text
+
+
+def iter_pdf_pages(file_content: bytes, max_pages: Optional[int] = None) -> Iterator[Tuple[int, Optional[str]]]:
+    """
+    Stream the text of a PDF page by page.
+
+    Args:
+        file_content: PDF file content as bytes
+        max_pages: Stop after this many pages (None reads all)
+
+    Yields:
+        Tuples (0-based page number, page text or None for image-only pages)
+
+    Raises:
+        ValueError: If the PDF or one of its pages can't be parsed
+    """
+    reader = open_pdf(file_content)
+    total = len(reader.pages)
+    yield from _iter_pages(reader, range(min(total, max_pages) if max_pages else total))
+
+
+# Per worker process: the last PDF opened, reused by further ranges of the same document
+_worker_reader = (None, None)
+
+
+def _worker_open(file_content: bytes):
+    """Open a PDF in a pool worker, reusing the reader of the previous task for the same document."""
+    global _worker_reader
+    key = (len(file_content), hash(file_content))
+    if _worker_reader[0] != key:
+        _worker_reader = (key, open_pdf(file_content))
+    return _worker_reader[1]
+
+
+def _count_pages(file_content: bytes) -> int:
+    """Number of pages of a PDF (executed in a pool worker)."""
+    return len(_worker_open(file_content).pages)
+
+
+def _extract_page_range(file_content: bytes, numbers: List[int], deadline: Optional[float]):
+    """
+    Extract a range of pages (executed in a pool worker).
+
+    Returns:
+        Tuple (list of (page number, text or None), whether the deadline stopped it)
+    """
+    reader = _worker_open(file_content)
+    pages = []
+    for number in numbers:
+        if deadline is not None and time.time() >= deadline:
+            return pages, True
+        pages.extend(_iter_pages(reader, [number]))
+    return pages, False
+
+
+def _stream_pages(conn, file_content: bytes, max_pages: Optional[int]):
+    """
+    Send a PDF's page count, then its pages one by one, to the parent (executed in a child process).
+
+    Messages: ('total', pages), ('page', number, text or None) per page, then
+    ('done',) or ('error', message).
+    """
+    try:
+        reader = open_pdf(file_content)
+        total = len(reader.pages)
+        conn.send(('total', total))
+        for number, text in _iter_pages(reader, range(min(total, max_pages) if max_pages else total)):
+            conn.send(('page', number, text))
+        conn.send(('done',))
+    except ValueError as e:
+        conn.send(('error', str(e)))
+    finally:
+        conn.close()
+
+
+def _forget_inherited_forkserver():
+    """
+    Drop the fork server handle a forked child inherits from its parent.
+
+    Only the process that started a fork server can use it: a child forked
+    later (e.g. a ProcessPoolExecutor worker) fails with ChildProcessError
+    on its first forkserver process. Reset so the child starts its own.
+    """
+    from multiprocessing import forkserver
+
+    server = getattr(forkserver, '_forkserver', None)
+    if server is None or getattr(server, '_forkserver_pid', None) is None:
+        return
+    try:
+        # Our copy of the "alive" pipe would keep the parent's server running after the parent exits
+        os.close(server._forkserver_alive_fd)
+    except (OSError, TypeError):
+        pass
+    server._forkserver_pid = server._forkserver_address = server._forkserver_alive_fd = None
+    server._lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_inherited_forkserver)
+
+
+def _pool_context():
+    """Start method for extraction processes."""
+    # forkserver forks workers from a small helper process with PyPDF2 already
+    # imported, not from this (threaded, possibly model-holding) process
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload([__name__, 'PyPDF2'])
+    return context
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds until the deadline (None without one)."""
+    return None if deadline is None else max(0.0, deadline - time.time())
+
+
+def _extract_inline(file_content: bytes, max_pages: Optional[int], deadline: Optional[float]):
+    """
+    Extract pages in this process, checking the deadline between pages only.
+
+    Returns:
+        Tuple (pages in the document, list of (page number, text or None), whether the deadline was hit)
+    """
+    reader = open_pdf(file_content)
+    total = len(reader.pages)
+    numbers = range(min(total, max_pages) if max_pages else total)
+    pages = []
+    for number, text in _iter_pages(reader, numbers):
+        pages.append((number, text))
+        if deadline is not None and time.time() >= deadline and len(pages) < len(numbers):
+            return total, pages, True
+    return total, pages, False
+
+
+def _extract_isolated(file_content: bytes, max_pages: Optional[int], deadline: float):
+    """
+    Extract pages in a child process, receiving them until the deadline.
+
+    The child is killed when the deadline passes, wherever it is: opening
+    the PDF or in the middle of a page.
+
+    Returns:
+        Tuple (pages in the document, list of (page number, text or None), whether the deadline was hit)
+    """
+    context = _pool_context()
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_stream_pages, args=(sender, file_content, max_pages), daemon=True)
+    process.start()
+    sender.close()
+
+    total, pages = 0, []
+    try:
+        while True:
+            if not receiver.poll(_remaining(deadline)):
+                return total, pages, True
+            try:
+                message = receiver.recv()
+            except EOFError:
+                process.join()
+                raise ValueError(f"Error extracting text from PDF: extraction process exited "
+                                 f"with code {process.exitcode}") from None
+            if message[0] == 'total':
+                total = message[1]
+            elif message[0] == 'page':
+                pages.append((message[1], message[2]))
+            elif message[0] == 'error':
+                raise ValueError(message[1])
+            else:
+                return total, pages, False
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()
+
+
+def _extract_parallel(file_content: bytes, max_pages: Optional[int], workers: int, deadline: Optional[float]):
+    """
+    Extract pages in a pool of their own, waiting for ranges until the deadline.
+
+    The pool belongs to this document only, so terminating it when the
+    deadline passes kills exactly the workers still busy with it. The page
+    count is read in the pool too, so opening the PDF is within the deadline.
+
+    Returns:
+        Tuple (pages in the document, list of (page number, text or None), whether the deadline was hit)
+    """
+    found, timed_out = {}, False
+    # Leaving the block terminates the pool, including workers stuck on a page
+    with _pool_context().Pool(workers) as pool:
+        try:
+            total = pool.apply_async(_count_pages, (file_content,)).get(_remaining(deadline))
+        except multiprocessing.TimeoutError:
+            return 0, [], True
+
+        numbers = list(range(min(total, max_pages) if max_pages else total))
+        size = PAGES_PER_TASK if len(numbers) >= PARALLEL_MIN_PAGES else max(1, len(numbers))
+        chunks = [numbers[i:i + size] for i in range(0, len(numbers), size)]
+        tasks = [pool.apply_async(_extract_page_range, (file_content, chunk, deadline)) for chunk in chunks]
+        for task in tasks:
+            try:
+                chunk_pages, stopped = task.get(_remaining(deadline))
+            except multiprocessing.TimeoutError:
+                timed_out = True
+                continue
+            found.update(chunk_pages)
+            if stopped and not timed_out:
+                # Keep ranges that already finished, don't wait for the others
+                timed_out, deadline = True, time.time()
+    return total, [(number, found[number]) for number in numbers if number in found], timed_out
+
+
+def extract_pdf(
+    file_content: bytes,
+    max_pages: Optional[int] = None,
+    time_limit: Optional[float] = None,
+    workers: int = 0
+) -> PDFExtraction:
+    """
+    Extract the text of a PDF within a page and time budget.
+
+    Args:
+        file_content: PDF file content as bytes
+        max_pages: Read at most this many pages (None reads all)
+        time_limit: Stop after this many seconds, even in the middle of a page
+            (None waits for all pages)
+        workers: Worker processes for page-parallel extraction of documents with
+            at least PARALLEL_MIN_PAGES pages, capped at MAX_PAGE_WORKERS (0 or
+            1 extracts serially)
+
+    Returns:
+        PDFExtraction; when a budget is exhausted, text holds the pages read so far
+
+    Raises:
+        ValueError: If the PDF or one of its pages can't be parsed
+    """
+    start = time.time()
+    deadline = start + time_limit if time_limit else None
+    workers = min(workers, MAX_PAGE_WORKERS)
+
+    if multiprocessing.current_process().daemon:
+        # Pool workers are daemonic and can't start processes: the limit is only checked between pages
+        total, pages, timed_out = _extract_inline(file_content, max_pages, deadline)
+    elif workers > 1:
+        total, pages, timed_out = _extract_parallel(file_content, max_pages, workers, deadline)
+    elif deadline is not None:
+        total, pages, timed_out = _extract_isolated(file_content, max_pages, deadline)
+    else:
+        total, pages, timed_out = _extract_inline(file_content, max_pages, None)
+
+    texts = [text for _, text in pages if text is not None]
+    read = len(pages) if total else 0
+    return PDFExtraction(
+        text="\n".join(texts).strip(),
+        pages=total,
+        pages_read=len(texts),
+        pages_skipped=read - len(texts),
+        truncated=TRUNCATED_TIME_LIMIT if timed_out
+        else TRUNCATED_PAGE_LIMIT if max_pages and total > max_pages else None,
+        elapsed_ms=round((time.time() - start) * 1000, 3)
+    )
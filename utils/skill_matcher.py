@@ -0,0 +1,155 @@
+"""
+Single-pass multi-pattern skill matching.
+
+Skills are matched on whole tokens, so 'r' and 'go' no longer match inside
+'framework' or 'django'. The text is split into tokens by one C-level regex
+scan: runs of letters, digits, '+' and '#' ('c++', 'c#'), plus every other
+punctuation character as a token of its own ('node.js' is node . js). Patterns
+are token sequences in an Aho–Corasick automaton over that token alphabet,
+so all skills, including multi-word ones, are found in one linear pass over
+the tokens. Per token it is one dict lookup, and the cost does not depend on
+the number of patterns.
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple, Union
+
+
+# Word tokens, or a single punctuation character; whitespace only separates
+TOKEN_PATTERN = re.compile(r'[a-z0-9+#]+|[^\sa-z0-9+#]')
+
+
+class SkillMatch(NamedTuple):
+    """One occurrence of a skill in a text."""
+    skill: str
+    start: int
+    end: int
+
+
+def tokenize(text: str) -> List[str]:
+    """Split lowercase text into matcher tokens."""
+    return TOKEN_PATTERN.findall(text)
+
+
+class SkillMatcher:
+    """
+    Aho–Corasick automaton over tokens mapping skill phrases to canonical names.
+    """
+
+    def __init__(self, patterns: Union[Iterable[str], Dict[str, str]]):
+        """
+        Compile the automaton.
+
+        Args:
+            patterns: Skill phrases, or a dict phrase -> canonical name (for
+                aliases such as 'k8s' -> 'kubernetes'); matching is case-insensitive
+        """
+        if not isinstance(patterns, dict):
+            patterns = {pattern: pattern for pattern in patterns}
+
+        # Node 0 is the root; goto[n] maps a token to the next node
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Per node: (canonical name, phrase length in tokens) of every phrase ending here
+        self._out: List[Tuple[Tuple[str, int], ...]] = [()]
+
+        outputs: Dict[int, List[Tuple[str, int]]] = {}
+        for phrase, canonical in patterns.items():
+            tokens = tokenize(phrase.lower())
+            if not tokens:
+                continue
+            node = 0
+            for token in tokens:
+                nxt = self._goto[node].get(token)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][token] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = nxt
+            outputs.setdefault(node, []).append((canonical, len(tokens)))
+
+        for node, found in outputs.items():
+            self._out[node] = tuple(found)
+        self._build_failure_links()
+        self.size = len(patterns)
+
+    def _build_failure_links(self):
+        """Breadth-first: each node falls back to its longest proper suffix in the trie."""
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for token, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target
+                if self._out[self._fail[child]]:
+                    self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def _scan(self, tokens: Iterable[str]):
+        """
+        Run the automaton.
+
+        Yields:
+            Tuples (token index, (canonical, length), ...) for every token that ends a match
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        root = goto[0]
+        state = 0
+        for index, token in enumerate(tokens):
+            if state == 0:
+                # Fast path: most tokens don't start a skill
+                state = root.get(token, 0)
+            else:
+                while True:
+                    nxt = goto[state].get(token)
+                    if nxt is not None:
+                        state = nxt
+                        break
+                    if state == 0:
+                        break
+                    state = fail[state]
+            if out[state]:
+                yield index, out[state]
+
+    def skills(self, text: str) -> Set[str]:
+        """
+        Canonical names of all skills occurring in a text.
+
+        Args:
+            text: Input text (any case)
+
+        Returns:
+            Set of canonical skill names
+        """
+        found = set()
+        for _, matches in self._scan(tokenize(text.lower())):
+            found.update(canonical for canonical, _ in matches)
+        return found
+
+    def find(self, text: str) -> List[SkillMatch]:
+        """
+        All skill occurrences with character offsets, in text order.
+
+        Overlapping phrases are all reported ('machine learning' and 'learning'
+        if both are patterns).
+
+        Args:
+            text: Input text (any case)
+
+        Returns:
+            List of SkillMatch(skill, start, end) with text[start:end] being the match
+        """
+        found_tokens = list(TOKEN_PATTERN.finditer(text.lower()))
+        matches = []
+        for index, found in self._scan(match.group() for match in found_tokens):
+            for canonical, length in found:
+                matches.append(SkillMatch(
+                    canonical, found_tokens[index - length + 1].start(), found_tokens[index].end()
+                ))
+        matches.sort(key=lambda match: (match.start, -match.end))
+        return matches
+
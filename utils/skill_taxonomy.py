@@ -0,0 +1,181 @@
+"""
+Skill taxonomy loaded from a versioned JSON or CSV file.
+
+Each skill has a canonical id, a display name and aliases ('k8s' ->
+'kubernetes'). All of them are compiled into one SkillMatcher, so finding skills
+costs one pass over the text no matter how many skills the taxonomy has.
+
+JSON format:
+    {"version": "2025.1",
+     "skills": [{"id": "kubernetes", "name": "Kubernetes", "aliases": ["k8s"]}, ...]}
+
+CSV format (header required; aliases separated by '|'):
+    id,name,aliases
+    kubernetes,Kubernetes,k8s|kube
+
+Compiling tens of thousands of skills takes a noticeable fraction of a second,
+so the compiled taxonomy is pickled to a cache directory under a hash of the
+file content and reused while the file is unchanged; compiling a new version
+replaces the old pickle.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+import pickle
+from typing import Dict, List, Optional
+
+from .skill_matcher import SkillMatcher
+
+
+# Bump when SkillMatcher's internals change so stale pickles are ignored
+COMPILED_FORMAT = '1'
+
+
+class SkillTaxonomy:
+    """
+    Canonical skills with aliases, compiled into a SkillMatcher.
+    """
+
+    def __init__(self, skills: List[dict], version: str = 'unversioned', source: Optional[str] = None):
+        """
+        Compile a taxonomy.
+
+        Args:
+            skills: Entries with 'id' and optional 'name' and 'aliases'
+            version: Taxonomy version (from the file)
+            source: File the taxonomy was read from, if any
+
+        Raises:
+            ValueError: If an entry has no id, or one phrase maps to two skills
+        """
+        self.version = version
+        self.source = source
+        self.names: Dict[str, str] = {}
+
+        patterns: Dict[str, str] = {}
+        for entry in skills:
+            skill_id = str(entry.get('id') or '').strip().lower()
+            if not skill_id:
+                raise ValueError(f"Skill entry without an id: {entry}")
+            self.names[skill_id] = entry.get('name') or skill_id
+
+            for phrase in [skill_id, entry.get('name')] + list(entry.get('aliases') or []):
+                if not phrase or not str(phrase).strip():
+                    continue
+                phrase = ' '.join(str(phrase).lower().split())
+                owner = patterns.setdefault(phrase, skill_id)
+                if owner != skill_id:
+                    raise ValueError(f"'{phrase}' is used by both '{owner}' and '{skill_id}'")
+
+        self.matcher = SkillMatcher(patterns)
+        self.fingerprint = hashlib.sha256(
+            json.dumps([version, sorted(patterns.items())]).encode('utf-8')
+        ).hexdigest()[:16]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def info(self) -> dict:
+        """Summary for status endpoints."""
+        return {
+            'version': self.version,
+            'source': self.source,
+            'skills': len(self.names),
+            'patterns': self.matcher.size,
+            'fingerprint': self.fingerprint
+        }
+
+
+def parse_taxonomy(content: bytes, filename: str) -> dict:
+    """
+    Parse a taxonomy file.
+
+    Args:
+        content: File content
+        filename: File name; '.csv' selects CSV, anything else JSON
+
+    Returns:
+        Dictionary with 'version' and 'skills'
+
+    Raises:
+        ValueError: If the file is malformed
+    """
+    text = content.decode('utf-8-sig')
+    if filename.lower().endswith('.csv'):
+        rows = list(csv.DictReader(io.StringIO(text)))
+        if rows and 'id' not in rows[0]:
+            raise ValueError("CSV taxonomy needs an 'id' column")
+        skills = [
+            {
+                'id': row['id'],
+                'name': row.get('name'),
+                'aliases': [alias for alias in (row.get('aliases') or '').split('|') if alias.strip()]
+            }
+            for row in rows
+        ]
+        # CSV has no header for it; take the version from the file name, e.g. skills-2025.1.csv
+        version = os.path.splitext(os.path.basename(filename))[0]
+        return {'version': version, 'skills': skills}
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid taxonomy JSON: {e}")
+    if not isinstance(data, dict) or not isinstance(data.get('skills'), list):
+        raise ValueError("Taxonomy JSON needs a 'skills' list")
+    return {'version': str(data.get('version', 'unversioned')), 'skills': data['skills']}
+
+
+def load_taxonomy(path: str, cache_dir: Optional[str] = None) -> SkillTaxonomy:
+    """
+    Load a taxonomy file, reusing its compiled form from cache_dir when possible.
+
+    Args:
+        path: JSON or CSV taxonomy file
+        cache_dir: Directory for compiled taxonomies (None disables the disk cache)
+
+    Returns:
+        Compiled SkillTaxonomy
+
+    Raises:
+        ValueError: If the file is malformed
+        OSError: If the file can't be read
+    """
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    cache_path = None
+    if cache_dir:
+        digest = hashlib.sha256(content + COMPILED_FORMAT.encode('utf-8')).hexdigest()[:24]
+        cache_path = os.path.join(cache_dir, f"{os.path.basename(path)}-{digest}.pickle")
+        try:
+            with open(cache_path, 'rb') as f:
+                taxonomy = pickle.load(f)
+            taxonomy.source = path
+            return taxonomy
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            pass
+
+    parsed = parse_taxonomy(content, path)
+    taxonomy = SkillTaxonomy(parsed['skills'], version=parsed['version'], source=path)
+
+    if cache_path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write then rename, so concurrent workers never read a partial file
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(taxonomy, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            # Older compiled versions of this file are never read again
+            prefix = f"{os.path.basename(path)}-"
+            for name in os.listdir(cache_dir):
+                if name.startswith(prefix) and name.endswith('.pickle') and name != os.path.basename(cache_path):
+                    os.remove(os.path.join(cache_dir, name))
+        except OSError as e:
+            print(f"Could not cache compiled taxonomy: {e}")
+
+    return taxonomy
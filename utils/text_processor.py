@@ -2,62 +2,122 @@
 Text processing utilities for resume and job description analysis.
 """
 
+import os
 import re
 import string
-from typing import List, Set
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-import PyPDF2
-from io import BytesIO
+import threading
+from collections import Counter
+from functools import cached_property, lru_cache
+from typing import FrozenSet, List, Optional, Set, Union
 
+from .pdf_extractor import extract_pdf
+from .skill_matcher import SkillMatch
+from .skill_taxonomy import SkillTaxonomy, load_taxonomy
 
-# Download required NLTK data (only first time)
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
-    nltk.download('punkt_tab', quiet=True)
 
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords', quiet=True)
+# Bump whenever preprocessing changes so cached embeddings are invalidated
+PREPROCESSING_VERSION = '1'
 
+# Every helper takes raw text or an AnalyzedDocument (analyzed once, reused)
+TextOrDocument = Union[str, 'AnalyzedDocument']
 
-def extract_text_from_pdf(file_content: bytes) -> str:
+
+@lru_cache(maxsize=None)
+def _nltk():
+    """
+    Import NLTK and download required data on first use.
+
+    NLTK takes over a second to import, so it is loaded lazily to keep
+    importing this module (and starting the API server) fast.
+    """
+    import nltk
+
+    # Download required NLTK data (only first time)
+    try:
+        nltk.data.find('tokenizers/punkt')
+    except LookupError:
+        nltk.download('punkt', quiet=True)
+        nltk.download('punkt_tab', quiet=True)
+
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords', quiet=True)
+
+    return nltk
+
+
+@lru_cache(maxsize=None)
+def _english_stopwords() -> FrozenSet[str]:
+    """English stopword set, built once."""
+    from nltk.corpus import stopwords
+
+    _nltk()
+    return frozenset(stopwords.words('english'))
+
+
+def extract_text_from_pdf(
+    file_content: bytes,
+    max_pages: Optional[int] = None,
+    time_limit: Optional[float] = None,
+    workers: int = 0
+) -> str:
     """
     Extract text from PDF file content.
 
+    Pages are streamed one at a time and image-only pages are skipped; see
+    utils/pdf_extractor.py for the budgets and the page-parallel mode.
+
     Args:
         file_content: PDF file content as bytes
+        max_pages: Read at most this many pages (None reads all)
+        time_limit: Return the pages read after this many seconds (None waits for all)
+        workers: Worker processes for page-parallel extraction of long documents
 
     Returns:
         Extracted text as string
     """
-    try:
-        pdf_file = BytesIO(file_content)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
+    return extract_pdf(file_content, max_pages=max_pages, time_limit=time_limit, workers=workers).text
 
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
 
-        return text.strip()
-    except Exception as e:
-        raise ValueError(f"Error extracting text from PDF: {str(e)}")
+SUPPORTED_RESUME_EXTENSIONS = ('.pdf', '.txt')
 
 
-def clean_text(text: str) -> str:
+def extract_text_from_file(filename: str, file_content: bytes) -> str:
+    """
+    Extract text from a resume file based on its extension.
+
+    Args:
+        filename: Name of the file (its extension selects the parser)
+        file_content: File content as bytes
+
+    Returns:
+        Extracted text as string
+
+    Raises:
+        ValueError: If the file type is unsupported or the file can't be parsed
+    """
+    name = filename.lower()
+    if name.endswith('.pdf'):
+        return extract_text_from_pdf(file_content)
+    if name.endswith('.txt'):
+        return file_content.decode('utf-8')
+    raise ValueError("Unsupported file type. Please upload PDF or TXT file.")
+
+
+def clean_text(text: TextOrDocument) -> str:
     """
     Clean text by removing special characters, extra spaces, and lowercasing.
 
     Args:
-        text: Input text to clean
+        text: Input text to clean, or an AnalyzedDocument
 
     Returns:
         Cleaned text
     """
+    if isinstance(text, AnalyzedDocument):
+        return text.normalized
+
     # Convert to lowercase
     text = text.lower()
 
@@ -76,19 +136,22 @@ def clean_text(text: str) -> str:
     return text
 
 
-def remove_stopwords(text: str) -> str:
+def remove_stopwords(text: TextOrDocument) -> str:
     """
     Remove common stopwords from text.
 
     Args:
-        text: Input text
+        text: Input text, or an AnalyzedDocument
 
     Returns:
         Text with stopwords removed
     """
+    if isinstance(text, AnalyzedDocument):
+        text = text.text
+
     try:
-        stop_words = set(stopwords.words('english'))
-        word_tokens = word_tokenize(text)
+        stop_words = set(_english_stopwords())
+        word_tokens = _nltk().word_tokenize(text)
 
         # Keep important technical words even if they're in stopwords
         important_words = {'python', 'r', 'c', 'go', 'ai', 'ml', 'will', 'can'}
@@ -101,120 +164,140 @@ def remove_stopwords(text: str) -> str:
         return text
 
 
-def extract_keywords(text: str, top_n: int = 20) -> List[str]:
+def _term_counts(words: List[str]) -> Counter:
+    """Frequencies of keyword candidates among cleaned words."""
+    # Remove very short words (likely not meaningful)
+    words = [w for w in words if len(w) > 2]
+
+    # Remove stopwords
+    try:
+        stop_words = _english_stopwords()
+        words = [w for w in words if w not in stop_words]
+    except:
+        pass
+
+    return Counter(words)
+
+
+def extract_keywords(text: TextOrDocument, top_n: int = 20) -> List[str]:
     """
     Extract important keywords from text using simple frequency analysis.
 
     Args:
-        text: Input text
+        text: Input text, or an AnalyzedDocument (reuses its term counts)
         top_n: Number of top keywords to extract
 
     Returns:
         List of keywords
     """
-    from collections import Counter
+    if isinstance(text, AnalyzedDocument):
+        word_freq = text.term_counts
+    else:
+        word_freq = _term_counts(clean_text(text).split())
 
-    # Clean the text
-    cleaned_text = clean_text(text)
+    # Get top keywords
+    top_keywords = [word for word, _ in word_freq.most_common(top_n)]
 
-    # Tokenize
-    words = cleaned_text.split()
+    return top_keywords
 
-    # Remove very short words (likely not meaningful)
-    words = [w for w in words if len(w) > 2]
 
-    # Remove stopwords
-    try:
-        stop_words = set(stopwords.words('english'))
-        words = [w for w in words if w not in stop_words]
-    except:
-        pass
+# Skill taxonomy used by find_skills/extract_skills_keywords (JSON or CSV, see utils/skill_taxonomy.py)
+DEFAULT_SKILL_TAXONOMY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'skills.json')
+SKILL_TAXONOMY_PATH = os.getenv('MATCHER_SKILL_TAXONOMY', DEFAULT_SKILL_TAXONOMY)
+# Compiled taxonomies are cached here; set MATCHER_SKILL_CACHE_DIR to '' to disable
+SKILL_CACHE_DIR = os.getenv(
+    'MATCHER_SKILL_CACHE_DIR', os.path.join(os.path.dirname(DEFAULT_SKILL_TAXONOMY), 'compiled')
+) or None
 
-    # Count frequency
-    word_freq = Counter(words)
+_taxonomy_lock = threading.Lock()
+_taxonomy: Optional[SkillTaxonomy] = None
 
-    # Get top keywords
-    top_keywords = [word for word, _ in word_freq.most_common(top_n)]
 
-    return top_keywords
+def skill_taxonomy() -> SkillTaxonomy:
+    """The active skill taxonomy, loaded from SKILL_TAXONOMY_PATH on first use."""
+    taxonomy = _taxonomy
+    if taxonomy is None:
+        with _taxonomy_lock:
+            if _taxonomy is None:
+                _set_taxonomy(load_taxonomy(SKILL_TAXONOMY_PATH, SKILL_CACHE_DIR))
+            taxonomy = _taxonomy
+    return taxonomy
+
 
+def _set_taxonomy(taxonomy: SkillTaxonomy):
+    global _taxonomy
+    _taxonomy = taxonomy
 
-def extract_skills_keywords(text: str) -> Set[str]:
+
+def reload_skill_taxonomy(path: Optional[str] = None) -> SkillTaxonomy:
     """
-    Extract technical skills and important keywords from text.
-    Uses pattern matching for common skills and technologies.
+    Load a taxonomy file and make it the active one.
+
+    The new taxonomy is compiled before it replaces the old one, so matching
+    keeps working during a reload and a broken file leaves the old one active.
 
     Args:
-        text: Input text
+        path: Taxonomy file (default: SKILL_TAXONOMY_PATH)
 
     Returns:
-        Set of identified skills/keywords
-    """
-    text_lower = text.lower()
-    skills = set()
+        The new active taxonomy
 
-    # Common programming languages
-    languages = [
-        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'php',
-        'swift', 'kotlin', 'go', 'rust', 'scala', 'r', 'matlab', 'sql', 'html',
-        'css', 'bash', 'shell', 'perl'
-    ]
+    Raises:
+        ValueError: If the file is malformed
+        OSError: If the file can't be read
+    """
+    taxonomy = load_taxonomy(path or SKILL_TAXONOMY_PATH, SKILL_CACHE_DIR)
+    with _taxonomy_lock:
+        _set_taxonomy(taxonomy)
+    return taxonomy
 
-    # Frameworks and libraries
-    frameworks = [
-        'react', 'angular', 'vue', 'django', 'flask', 'fastapi', 'spring',
-        'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy',
-        'node.js', 'express', 'next.js', 'laravel', 'rails', 'asp.net',
-        'streamlit', 'gradio', 'huggingface', 'transformers'
-    ]
 
-    # Tools and technologies
-    tools = [
-        'git', 'docker', 'kubernetes', 'jenkins', 'aws', 'azure', 'gcp',
-        'mongodb', 'postgresql', 'mysql', 'redis', 'elasticsearch', 'kafka',
-        'spark', 'hadoop', 'airflow', 'linux', 'unix', 'agile', 'scrum',
-        'ci/cd', 'devops', 'mlops', 'rest', 'api', 'graphql', 'microservices'
-    ]
+def find_skills(text: TextOrDocument) -> List[SkillMatch]:
+    """
+    Find every skill occurrence in a text with its character offsets.
 
-    # AI/ML specific
-    ai_ml = [
-        'machine learning', 'deep learning', 'neural network', 'nlp',
-        'computer vision', 'data science', 'artificial intelligence',
-        'natural language processing', 'reinforcement learning', 'lstm',
-        'transformer', 'bert', 'gpt', 'llm', 'generative ai'
-    ]
+    Args:
+        text: Input text, or an AnalyzedDocument
 
-    # Check for all skill categories
-    all_skills = languages + frameworks + tools + ai_ml
+    Returns:
+        List of SkillMatch(skill, start, end) in text order
+    """
+    if isinstance(text, AnalyzedDocument):
+        return list(text.skill_matches)
+    return skill_taxonomy().matcher.find(text)
 
-    for skill in all_skills:
-        if skill in text_lower:
-            skills.add(skill)
 
-    # Extract other keywords using word patterns
-    words = re.findall(r'\b[a-z][a-z0-9+#\-]*\b', text_lower)
+def extract_skills_keywords(text: TextOrDocument) -> Set[str]:
+    """
+    Extract technical skills and important keywords from text.
 
-    # Add multi-word technical terms
-    bigrams = [f"{words[i]} {words[i+1]}" for i in range(len(words)-1)]
-    trigrams = [f"{words[i]} {words[i+1]} {words[i+2]}" for i in range(len(words)-2)]
+    Skills and their aliases come from the active skill taxonomy and are
+    found in one pass by a token-level Aho–Corasick automaton (see
+    utils/skill_matcher.py). Skills match whole words only, so 'r' or
+    'go' inside another word do not count.
 
-    for term in bigrams + trigrams:
-        if any(tech in term for tech in ['machine learning', 'deep learning', 'data science', 'computer vision']):
-            skills.add(term)
+    Args:
+        text: Input text, or an AnalyzedDocument (reuses its skill matches)
 
-    return skills
+    Returns:
+        Set of canonical skill ids ('k8s' is reported as 'kubernetes')
+    """
+    if isinstance(text, AnalyzedDocument):
+        return set(text.skills)
+    return skill_taxonomy().matcher.skills(text)
 
 
-def find_missing_keywords(resume_text: str, job_text: str) -> List[str]:
+def find_missing_keywords(resume_text: TextOrDocument, job_text: TextOrDocument) -> List[str]:
     """
     Find keywords present in job description but missing from resume.
 
     Args:
-        resume_text: Resume text
-        job_text: Job description text
+        resume_text: Resume text or AnalyzedDocument
+        job_text: Job description text or AnalyzedDocument
 
     Returns:
-        List of missing keywords
+        Sorted canonical ids of skills the job mentions and the resume doesn't,
+        so 'Postgres' in the resume covers 'PostgreSQL' in the job
     """
     resume_skills = extract_skills_keywords(resume_text)
     job_skills = extract_skills_keywords(job_text)
@@ -225,17 +308,20 @@ def find_missing_keywords(resume_text: str, job_text: str) -> List[str]:
     return sorted(list(missing))
 
 
-def preprocess_for_embedding(text: str) -> str:
+def preprocess_for_embedding(text: TextOrDocument) -> str:
     """
     Preprocess text for embedding generation.
     Less aggressive cleaning to preserve context.
 
     Args:
-        text: Input text
+        text: Input text, or an AnalyzedDocument
 
     Returns:
         Preprocessed text
     """
+    if isinstance(text, AnalyzedDocument):
+        return text.embedding_text
+
     # Remove URLs and emails
     text = re.sub(r'http\S+|www\S+', '', text)
     text = re.sub(r'\S+@\S+', '', text)
@@ -244,3 +330,69 @@ def preprocess_for_embedding(text: str) -> str:
     text = ' '.join(text.split())
 
     return text
+
+
+class AnalyzedDocument:
+    """
+    A resume or job description analyzed once for all helpers in this module.
+
+    Each view of the text is computed on first use and kept, so passing the
+    same document to preprocess_for_embedding, extract_keywords and
+    find_missing_keywords cleans, tokenizes and skill-matches it once instead
+    of once per helper. Instances pickle with the views computed so far, so
+    they can be analyzed in a process pool and sent back. Skill matches use
+    the taxonomy active when they are first computed.
+    """
+
+    def __init__(self, text: str):
+        """
+        Wrap a text; nothing is computed yet.
+
+        Args:
+            text: Resume or job description text
+        """
+        self.text = text
+
+    @cached_property
+    def normalized(self) -> str:
+        """Lowercase text without URLs, emails and special characters (clean_text)."""
+        return clean_text(self.text)
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        """Words of the normalized text."""
+        return self.normalized.split()
+
+    @cached_property
+    def term_counts(self) -> Counter:
+        """Frequencies of keyword candidates (tokens over two characters, minus stopwords)."""
+        return _term_counts(self.tokens)
+
+    @cached_property
+    def skill_matches(self) -> List[SkillMatch]:
+        """Skill occurrences with character offsets, in text order."""
+        return skill_taxonomy().matcher.find(self.text)
+
+    @cached_property
+    def skills(self) -> FrozenSet[str]:
+        """Canonical ids of the skills found."""
+        return frozenset(match.skill for match in self.skill_matches)
+
+    @cached_property
+    def embedding_text(self) -> str:
+        """Text for the embedding model (preprocess_for_embedding)."""
+        return preprocess_for_embedding(self.text)
+
+    def analyze(self) -> 'AnalyzedDocument':
+        """
+        Compute every view now (e.g. in a worker before the document is sent back).
+
+        Returns:
+            This document
+        """
+        for view in ('embedding_text', 'term_counts', 'skills'):
+            getattr(self, view)
+        return self
+
+    def __repr__(self) -> str:
+        return f"AnalyzedDocument({len(self.text)} characters)"